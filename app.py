@@ -4,7 +4,11 @@ Main application entry point
 """
 
 import customtkinter as ctk
+from controllers import instrumentation
+from controllers.auth_service import auth_executor
+from controllers.background import db_executor
 from controllers.crud import ensure_default_admin_exists
+from controllers.database import init_db
 from views.login import LoginFrame
 from views.dashboard import DashboardFrame
 from views.colors import COLORS
@@ -20,6 +24,16 @@ class App(ctk.CTk):
         self._setup_window()
         self._create_header()
         self._create_main_frame()
+
+        # Controller work submitted from the views reports back through this window
+        db_executor.attach(self)
+        auth_executor.attach(self)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self._overlay = None
+        if instrumentation.is_enabled():
+            self.bind("<F12>", self._toggle_instrumentation_overlay)
+
         self.show_login()
 
     def _setup_window(self):
@@ -110,6 +124,24 @@ class App(ctk.CTk):
         self.current_admin = None
         self.show_login()
 
+    def _toggle_instrumentation_overlay(self, event=None):
+        """Show or hide the live timing report"""
+        if self._overlay is not None and self._overlay.winfo_exists():
+            self._overlay.destroy()
+            self._overlay = None
+            return
+
+        from views.instrumentation_overlay import InstrumentationOverlay
+
+        self._overlay = InstrumentationOverlay(self)
+
+    def _on_close(self):
+        """Stop the background workers before closing the window"""
+        instrumentation.log_report()
+        db_executor.shutdown(wait=False)
+        auth_executor.shutdown(wait=False)
+        self.destroy()
+
     def _clear_main_frame(self):
         """Clear all widgets from the main frame"""
         for widget in self.main_frame.winfo_children():
@@ -118,6 +150,9 @@ class App(ctk.CTk):
 
 def main():
     """Main entry point of the application"""
+    if instrumentation.ENABLED_BY_ENV:
+        instrumentation.enable()
+    init_db()
     app = App()
     app.mainloop()
 
@@ -0,0 +1,131 @@
+"""
+SQLite write and read throughput for each engine profile in controllers.database.
+
+Every profile gets its own throwaway database and runs the same workload:
+one commit per member (like create_user), a bulk insert, full table reads
+and primary key lookups.
+
+Usage:
+    python -m benchmarks.engine_benchmark [--commits 500] [--rows 50000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from controllers.database import SQLITE_PROFILES, create_db_engine, sqlite_settings
+from models.models import Base, PersonDB, UserDB
+
+
+def make_user(idx, rng):
+    created_at = datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, 8760))
+    return UserDB(
+        name=f"Name{idx}",
+        lastname="Lastname",
+        age=rng.randint(16, 70),
+        email=f"user{idx}@fitzone.test",
+        phone=f"55{rng.randint(10_000_000, 99_999_999)}",
+        membership_type=rng.choice(["basic", "premium", "vip"]),
+        created_at=created_at,
+        renovation_date=created_at + timedelta(days=30),
+    )
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_profile(profile, directory, commits, rows):
+    """Run the workload on a fresh database, returns operations per second"""
+    url = f"sqlite:///{os.path.join(directory, profile)}.db"
+    engine = create_db_engine(url, sqlite_settings(profile))
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    rng = random.Random(42)
+    results = {}
+
+    def commit_each():
+        for idx in range(commits):
+            with Session() as session:
+                session.add(make_user(idx, rng))
+                session.commit()
+
+    results["commit/s"] = commits / timed(commit_each)
+
+    persons = PersonDB.__table__
+    users = UserDB.__table__
+
+    def bulk_insert():
+        with engine.begin() as connection:
+            first_id = commits + 1
+            person_rows = []
+            user_rows = []
+            for idx in range(first_id, first_id + rows):
+                user = make_user(idx, rng)
+                person_rows.append({
+                    "id": idx, "name": user.name, "lastname": user.lastname,
+                    "age": user.age, "email": user.email, "phone": user.phone,
+                    "created_at": user.created_at, "type": "user",
+                })
+                user_rows.append({
+                    "id": idx, "membership_type": user.membership_type,
+                    "renovation_date": user.renovation_date,
+                })
+            connection.execute(persons.insert(), person_rows)
+            connection.execute(users.insert(), user_rows)
+
+    results["bulk rows/s"] = rows / timed(bulk_insert)
+
+    stmt = select(UserDB.id, UserDB.name, UserDB.lastname, UserDB.membership_type,
+                  UserDB.created_at).order_by(UserDB.id)
+
+    def full_scans():
+        with Session() as session:
+            for _ in range(3):
+                session.execute(stmt).all()
+
+    results["scan rows/s"] = 3 * (rows + commits) / timed(full_scans)
+
+    lookup_ids = [rng.randint(1, rows + commits) for _ in range(5000)]
+
+    def point_lookups():
+        with Session() as session:
+            for user_id in lookup_ids:
+                session.execute(
+                    select(UserDB.name).where(UserDB.id == user_id)
+                ).scalar_one()
+
+    results["lookups/s"] = len(lookup_ids) / timed(point_lookups)
+
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commits", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {
+            profile: run_profile(profile, directory, args.commits, args.rows)
+            for profile in sorted(SQLITE_PROFILES)
+        }
+
+    metrics = list(next(iter(results.values())))
+    print(f"{'profile':>10} " + " ".join(f"{metric:>12}" for metric in metrics))
+    for profile, values in results.items():
+        print(f"{profile:>10} " + " ".join(f"{values[metric]:>12.0f}" for metric in metrics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Members table formatting: ORM entities + User domain objects vs. column projection.
+
+Seeds a throwaway SQLite database and times DataFormatter.get_formatted_user_data
+against the previous implementation, checking that both produce the same rows.
+
+Usage:
+    python -m benchmarks.formatter_benchmark [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+FIRST_NAMES = ["Antonio", "Aideé", "Ana", "Luis", "María", "Carlos", "Sofía", "Jorge"]
+LAST_NAMES = ["Vázquez", "Correa", "López", "Pérez", "García", "Hernández", "Ruiz"]
+MEMBERSHIPS = ["basic", "premium", "vip"]
+
+
+def seed_users(engine, count, seed=42):
+    """Insert count users straight into the persons/users tables"""
+    from models.models import PersonDB, UserDB
+
+    rng = random.Random(seed)
+    base_date = datetime(2019, 1, 1)
+    persons = []
+    users = []
+    for idx in range(1, count + 1):
+        created_at = base_date + timedelta(hours=rng.randint(0, 6 * 365 * 24))
+        persons.append({
+            "id": idx,
+            "name": rng.choice(FIRST_NAMES),
+            "lastname": rng.choice(LAST_NAMES),
+            "age": rng.randint(16, 70),
+            "email": f"user{idx}@fitzone.test",
+            "phone": f"55{rng.randint(10_000_000, 99_999_999)}",
+            "created_at": created_at,
+            "type": "user",
+        })
+        users.append({
+            "id": idx,
+            "membership_type": rng.choice(MEMBERSHIPS),
+            "renovation_date": created_at + timedelta(days=30),
+        })
+
+    with engine.begin() as connection:
+        connection.execute(PersonDB.__table__.insert(), persons)
+        connection.execute(UserDB.__table__.insert(), users)
+
+
+def legacy_formatted_user_data(formatter):
+    """The previous get_formatted_user_data: UserDB -> User -> row"""
+    from controllers.crud import get_all_users
+
+    rows = []
+    for idx, user in enumerate(get_all_users()):
+        membership_type = getattr(user, "membership_type", "Basic")
+        rows.append([
+            str(idx + 1),
+            formatter._format_full_name(user),
+            membership_type.capitalize(),
+            "Active",
+            formatter._format_date(user.created_at),
+        ])
+    return rows
+
+
+def best_time(func, repeat):
+    """Run func repeat times, return (median seconds, last result)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def run(row_count, repeat):
+    # The database URL is read when controllers.database is imported
+    from controllers.database import engine, init_db
+    from services.data_formatter import DataFormatter
+
+    init_db()
+    seed_users(engine, row_count)
+    formatter = DataFormatter()
+
+    legacy_time, legacy_rows = best_time(
+        lambda: legacy_formatted_user_data(formatter), repeat
+    )
+    projection_time, projection_rows = best_time(
+        formatter.get_formatted_user_data, repeat
+    )
+    assert projection_rows == legacy_rows, "Projection rows differ from legacy rows"
+
+    print(f"{'rows':>10} {'ORM + User':>12} {'projection':>12} {'speedup':>8}")
+    print(
+        f"{row_count:>10} {legacy_time:>11.2f}s {projection_time:>11.2f}s "
+        f"{legacy_time / projection_time:>7.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["FITZONE_DATABASE_URL"] = f"sqlite:///{directory}/benchmark.db"
+        run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
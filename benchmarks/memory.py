@@ -0,0 +1,122 @@
+"""
+Memory footprint of the domain models for a full member load.
+
+Seeds a throwaway SQLite database, loads every member with
+crud.get_all_users() under tracemalloc, and compares the per-object size
+of the slotted User with the same attributes kept in a per-instance
+__dict__ (the layout the models had before they declared __slots__).
+Then compares the dashboard's member row caches (the views of one
+ColumnTable) with the same rows held as lists.
+
+Usage:
+    python -m benchmarks.memory [--scale 100k]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from benchmarks.synthetic_data import SCALES, parse_scale
+
+
+class _DictUser:
+    """A User's attributes in a per-instance __dict__, set in the same order"""
+
+    def __init__(self, user):
+        self._name = user.name
+        self._lastname = user.lastname
+        self._age = user.age
+        self._email = user.email
+        self._phone = user.phone
+        self._created_at = user.created_at
+        self._unique_id = user.unique_id
+        self._membership_type = user.membership_type
+        self._renovation_date = user.renovation_date
+
+
+def _copy_user(user):
+    from models.user import User
+
+    copy = User(
+        user.name, user.lastname, user.age, user.email, user.phone,
+        user.membership_type, user.created_at, user.renovation_date,
+    )
+    copy.unique_id = user.unique_id
+    return copy
+
+
+def _allocated(build):
+    """(result, bytes still allocated by build() once it returns)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def _object_size(objects):
+    """Bytes of the objects themselves and their __dict__, without shared values"""
+    size = sum(sys.getsizeof(obj) for obj in objects)
+    size += sum(sys.getsizeof(obj.__dict__) for obj in objects if hasattr(obj, "__dict__"))
+    return size
+
+
+def run(members, seed):
+    from controllers import crud
+    from controllers.database import engine, init_db
+    from benchmarks.synthetic_data import seed_database
+
+    init_db()
+    seed_database(engine, members, seed=seed)
+
+    users, load_bytes = _allocated(crud.get_all_users)
+    count = len(users)
+    print(f"Full member load: {count} members")
+    print(f"  get_all_users() retained {load_bytes / 2**20:.1f} MiB "
+          f"({load_bytes / count:.0f} B per member, strings included)")
+
+    # Rebuild the loaded members in both layouts; the values are shared, so
+    # what is retained is the object overhead alone
+    layouts = {
+        "__slots__ (User)": lambda: [_copy_user(user) for user in users],
+        "__dict__ (before)": lambda: [_DictUser(user) for user in users],
+    }
+    print(f"{'layout':<20} {'B per object':>13} {'retained MiB':>13}")
+    for layout, build in layouts.items():
+        objects, retained = _allocated(build)
+        print(f"{layout:<20} {_object_size(objects) / count:>13.0f} {retained / 2**20:>13.1f}")
+        del objects
+    del users
+
+    from services.data_formatter import DataFormatter
+
+    views, columnar_bytes = _allocated(DataFormatter().get_user_views)
+    # The same rows as lists of cells. Names come from the table's pool in
+    # both, so this understates what separately built rows would take
+    _, list_bytes = _allocated(lambda: [list(view) for view in views])
+    print(f"Member row caches ({len(views)} views: table, real IDs, search terms)")
+    print(f"  ColumnTable views {columnar_bytes / 2**20:>8.1f} MiB")
+    print(f"  lists of rows     {list_bytes / 2**20:>8.1f} MiB "
+          f"({list_bytes / max(columnar_bytes, 1):.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", default="100k", help=f"{', '.join(SCALES)} or a member count")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The database URL is read when controllers.database is imported
+        os.environ["FITZONE_DATABASE_URL"] = f"sqlite:///{directory}/memory.db"
+        run(parse_scale(args.scale), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Per-keystroke search latency: full scan vs. SearchIndex, plus FuzzyIndex lookups.
+
+Usage:
+    python -m benchmarks.search_benchmark [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from services.search_index import SearchIndex
+from services.fuzzy_search import FuzzyIndex, tokenize
+
+FIRST_NAMES = ["Antonio", "Aideé", "Ana", "Luis", "María", "Carlos", "Sofía", "Jorge"]
+LAST_NAMES = ["Vázquez", "Correa", "López", "Pérez", "García", "Hernández", "Ruiz"]
+MEMBERSHIPS = ["Basic", "Premium", "Vip"]
+
+# Simulates typing a last name one key at a time
+TYPED_QUERY = "correa"
+
+# Misspelled queries for the fuzzy index
+FUZZY_QUERIES = ["Vazques", "Hernandes", "Corea", "antonio lopes", "Sofia Ruis"]
+
+
+def make_rows(count, seed=42):
+    """Build user-table shaped rows: [ID, Name, Membership, Status, Join Date]"""
+    rng = random.Random(seed)
+    rows = []
+    for idx in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}{rng.randint(0, 999)}"
+        join_date = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2019, 2025)}"
+        rows.append([str(idx + 1), name, rng.choice(MEMBERSHIPS), "Active", join_date])
+    return rows
+
+
+def linear_filter(rows, query):
+    """The previous DashboardController.filter_data implementation"""
+    query_lower = query.lower()
+    return [row for row in rows if any(query_lower in str(cell).lower() for cell in row)]
+
+
+def time_keystrokes(search, query):
+    """Time search() for every prefix of query, returns seconds per keystroke"""
+    timings = []
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        search(query[:end])
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(sizes):
+    print(
+        f"{'rows':>10} {'build (s)':>10} {'scan median':>12} "
+        f"{'index median':>13} {'index max':>10}"
+    )
+    for size in sizes:
+        rows = make_rows(size)
+
+        start = time.perf_counter()
+        index = SearchIndex(rows)
+        build_time = time.perf_counter() - start
+
+        if size <= 10_000:
+            for end in range(1, len(TYPED_QUERY) + 1):
+                query = TYPED_QUERY[:end]
+                expected = linear_filter(rows, query)
+                assert [rows[pos] for pos in index.search(query)] == expected
+
+        scan = time_keystrokes(lambda q: linear_filter(rows, q), TYPED_QUERY)
+        indexed = time_keystrokes(lambda q: [rows[p] for p in index.search(q)], TYPED_QUERY)
+
+        print(
+            f"{size:>10} {build_time:>10.2f} "
+            f"{statistics.median(scan) * 1000:>10.1f}ms "
+            f"{statistics.median(indexed) * 1000:>11.2f}ms "
+            f"{max(indexed) * 1000:>8.2f}ms"
+        )
+
+
+def run_fuzzy(sizes):
+    print(f"\n{'rows':>10} {'build (s)':>10} {'fuzzy median':>13} {'fuzzy max':>10}")
+    for size in sizes:
+        rows = make_rows(size)
+
+        start = time.perf_counter()
+        index = FuzzyIndex(
+            [[token for cell in row[1:] for token in tokenize(cell)] for row in rows]
+        )
+        build_time = time.perf_counter() - start
+
+        timings = []
+        for query in FUZZY_QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            timings.append(time.perf_counter() - start)
+
+        print(
+            f"{size:>10} {build_time:>10.2f} "
+            f"{statistics.median(timings) * 1000:>11.2f}ms "
+            f"{max(timings) * 1000:>8.2f}ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+    run(args.sizes)
+    run_fuzzy(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
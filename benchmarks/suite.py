@@ -0,0 +1,361 @@
+"""
+Headless scale benchmark suite: CRUD, converters, formatter, filtering and table loading.
+
+Every scale runs in its own process against a throwaway SQLite database
+seeded by benchmarks.synthetic_data. Timings (median and best of --repeat
+runs) are written to a JSON report; pass an older report as --baseline to
+print the change of every case.
+
+Usage:
+    python -m benchmarks.suite [--scales 1k 10k 100k] [--repeat 3]
+                               [--output benchmark-report.json] [--baseline old.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.synthetic_data import SCALES, parse_scale
+
+# Searches typed in the dashboard filter: common and rare names, a plan,
+# a partial date, and misspellings for the fuzzy search
+FILTER_QUERIES = ["garcía", "correa", "premium", "2024", "mar"]
+FUZZY_QUERIES = ["Hernandes", "Vazques", "Sofia Ruis"]
+
+# Full ORM hydration of every member is skipped above this size
+MAX_ORM_ROWS = 100_000
+
+POINT_LOOKUPS = 200
+CONVERTER_SAMPLE = 10_000
+WRITE_CYCLES = 20
+
+
+class Recorder:
+    """Times benchmark cases and collects their results"""
+
+    def __init__(self, scale, members, repeat):
+        self.scale = scale
+        self.members = members
+        self.repeat = repeat
+        self.results = []
+
+    def time(self, group, name, func, setup=None):
+        """
+        Run func repeat times and record its median and best time. With a
+        setup function, func gets setup()'s result, prepared before the clock starts
+        """
+        timings = []
+        result = None
+        for _ in range(self.repeat):
+            args = (setup(),) if setup else ()
+            start = time.perf_counter()
+            result = func(*args)
+            timings.append(time.perf_counter() - start)
+
+        self._add(group, name, {
+            "median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "runs": len(timings),
+            "rows": len(result) if hasattr(result, "__len__") else None,
+        })
+        return result
+
+    def skip(self, group, name, reason):
+        self._add(group, name, {"skipped": reason})
+
+    def _add(self, group, name, values):
+        self.results.append({
+            "scale": self.scale, "members": self.members, "group": group, "name": name,
+            **values,
+        })
+        print(f"  {group:<10} {name:<42} {_describe(self.results[-1])}", file=sys.stderr)
+
+
+def _describe(result):
+    if "skipped" in result:
+        return f"skipped ({result['skipped']})"
+    return f"{result['median_s'] * 1000:>10.2f} ms"
+
+
+def bench_crud(recorder, rng):
+    from controllers import crud
+    from models.user import User
+
+    recorder.time("crud", "count_users", crud.count_users)
+    recorder.time("crud", "get_user_table_rows", crud.get_user_table_rows)
+    recorder.time("crud", "get_user_contact_rows", crud.get_user_contact_rows)
+    recorder.time("crud", "get_users_page (first)", lambda: crud.get_users_page(limit=200)[0])
+
+    middle_id = crud.get_user_id_at(recorder.members // 2)
+    recorder.time(
+        "crud", "get_users_page (middle, keyset)",
+        lambda: crud.get_users_page(after_id=middle_id, limit=200)[0],
+    )
+
+    ids = [crud.get_user_id_at(rng.randrange(recorder.members)) for _ in range(POINT_LOOKUPS)]
+    recorder.time(
+        "crud", f"get_user x{POINT_LOOKUPS}", lambda: [crud.get_user(user_id) for user_id in ids]
+    )
+
+    if recorder.members <= MAX_ORM_ROWS:
+        recorder.time("crud", "get_all_users", crud.get_all_users)
+    else:
+        recorder.skip("crud", "get_all_users", f"more than {MAX_ORM_ROWS} rows")
+
+    recorder.time("crud", "get_all_trainers_with_managers", crud.get_all_trainers_with_managers)
+    recorder.time("crud", "get_all_admins", crud.get_all_admins)
+
+    def write_cycle():
+        for idx in range(WRITE_CYCLES):
+            user = User(
+                name="Bench", lastname="Write", age=30,
+                email=f"bench.write{idx}.{time.perf_counter_ns()}@fitzone.test",
+                phone="5500000000", membership_type="basic",
+                created_at="2024-01-01 10:00", renovation_date="2024-01-31 10:00",
+            )
+            crud.create_user(user)
+            user.membership_type = "vip"
+            crud.update_user(user)
+            crud.delete_user(user.unique_id)
+        return range(WRITE_CYCLES)
+
+    recorder.time("crud", f"create/update/delete_user x{WRITE_CYCLES}", write_cycle)
+
+
+def bench_converters(recorder):
+    from sqlalchemy import select
+    from controllers.converters import db_to_user, user_to_row
+    from controllers.database import SessionLocal
+    from models.models import UserDB
+
+    session = SessionLocal()
+    try:
+        users_db = session.execute(
+            select(UserDB).order_by(UserDB.id).limit(CONVERTER_SAMPLE)
+        ).scalars().all()
+        recorder.time("converters", "db_to_user", lambda: [db_to_user(u) for u in users_db])
+    finally:
+        session.close()
+
+    users = [db_to_user(user_db) for user_db in users_db]
+    recorder.time("converters", "user_to_row", lambda: [user_to_row(u) for u in users])
+
+
+def bench_formatter(recorder):
+    from services.data_formatter import DataFormatter
+
+    formatter = DataFormatter()
+    for method in (
+        "get_user_views",
+        "get_trainer_views",
+        "get_admin_views",
+        "get_formatted_user_data",
+        "get_formatted_user_data_with_real_ids",
+        "get_user_search_terms",
+        "get_formatted_trainer_data",
+        "get_formatted_trainer_data_with_real_ids",
+        "get_formatted_admin_data",
+        "get_formatted_admin_data_extended",
+    ):
+        recorder.time("formatter", method, getattr(formatter, method))
+    recorder.time(
+        "formatter", "get_formatted_user_page", lambda: formatter.get_formatted_user_page(0)[0]
+    )
+
+
+def bench_controller(recorder):
+    from controllers.dashboard_controller import DashboardController
+
+    for table_name in ("users", "trainers"):
+        def cold_filter():
+            # New controller: includes loading the rows and building the index
+            controller = DashboardController()
+            return controller.filter_data(table_name, FILTER_QUERIES[0])
+
+        recorder.time("controller", f"filter_data {table_name} (cold)", cold_filter)
+
+        controller = DashboardController()
+        controller.filter_data(table_name, FILTER_QUERIES[0])
+        recorder.time(
+            "controller", f"filter_data {table_name} (warm, {len(FILTER_QUERIES)} queries)",
+            lambda: [row for query in FILTER_QUERIES
+                     for row in controller.filter_data(table_name, query)],
+        )
+
+        controller.fuzzy_search(table_name, FUZZY_QUERIES[0])
+        recorder.time(
+            "controller", f"fuzzy_search {table_name} ({len(FUZZY_QUERIES)} queries)",
+            lambda: [row for query in FUZZY_QUERIES
+                     for row in controller.fuzzy_search(table_name, query)],
+        )
+
+
+def bench_table(recorder):
+    from controllers.dashboard_controller import DashboardController
+    from utils.row_diff import diff_rows
+
+    def load_members_table():
+        # What the dashboard does before drawing the member table
+        controller = DashboardController()
+        return controller._load_table("users")
+
+    recorder.time("table", "load users table (first page)", load_members_table)
+    recorder.time(
+        "table", "PagedRows jump to middle (30 rows)",
+        lambda rows: rows[len(rows) // 2:len(rows) // 2 + 30],
+        setup=load_members_table,
+    )
+
+    data = DashboardController().get_user_data()
+    updated = list(data)
+    middle = len(updated) // 2
+    updated[middle] = updated[middle][:1] + ["Changed"] + updated[middle][2:]
+    recorder.time("table", "diff_rows (one row changed)", lambda: diff_rows(data, updated)["changed"])
+
+    try:
+        import customtkinter as ctk
+        root = ctk.CTk()
+    except Exception as e:
+        recorder.skip("table", "DataTable populate", f"no display: {e.__class__.__name__}")
+        return
+
+    from views.data_table import DataTable
+
+    headers = ["ID", "Name", "Membership", "Status", "Join Date"]
+    try:
+        def populate():
+            table = DataTable(root, headers, data)
+            root.update_idletasks()
+            table.destroy()
+            return data
+
+        recorder.time("table", "DataTable populate", populate)
+    finally:
+        root.destroy()
+
+
+def run_worker(scale, repeat, results_path, seed):
+    """Seed a database for one scale and run every case against it"""
+    from controllers.crud import ensure_default_admin_exists
+    from controllers.database import engine, init_db
+    from benchmarks.synthetic_data import seed_database
+
+    members = parse_scale(scale)
+    init_db()
+    ensure_default_admin_exists()
+
+    start = time.perf_counter()
+    counts = seed_database(engine, members, seed=seed)
+    print(f"[{scale}] seeded {counts} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    recorder = Recorder(scale, members, repeat)
+    rng = random.Random(seed)
+    bench_crud(recorder, rng)
+    bench_converters(recorder)
+    bench_formatter(recorder)
+    bench_controller(recorder)
+    bench_table(recorder)
+
+    with open(results_path, "w", encoding="utf-8") as results_file:
+        json.dump(recorder.results, results_file)
+
+
+def run_scale(scale, repeat, seed):
+    """Run one scale in a fresh process with its own database"""
+    with tempfile.TemporaryDirectory() as directory:
+        results_path = os.path.join(directory, "results.json")
+        env = dict(os.environ, FITZONE_DATABASE_URL=f"sqlite:///{directory}/benchmark.db")
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "--worker", scale,
+             "--repeat", str(repeat), "--seed", str(seed), "--results", results_path],
+            env=env,
+            check=True,
+        )
+        with open(results_path, encoding="utf-8") as results_file:
+            return json.load(results_file)
+
+
+def environment_info(seed, repeat):
+    import sqlalchemy
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def print_comparison(results, baseline):
+    """Print every case next to the same case of a baseline report"""
+    previous = {
+        (result["scale"], result["group"], result["name"]): result
+        for result in baseline["results"]
+    }
+    print(f"{'scale':>6} {'case':<54} {'now ms':>10} {'before ms':>10} {'change':>8}")
+    for result in results:
+        old = previous.get((result["scale"], result["group"], result["name"]))
+        if "median_s" not in result or not old or "median_s" not in old:
+            continue
+        now, before = result["median_s"] * 1000, old["median_s"] * 1000
+        change = f"{now / before:>7.2f}x" if before else "-"
+        print(
+            f"{result['scale']:>6} {result['group'] + ' ' + result['name']:<54} "
+            f"{now:>10.2f} {before:>10.2f} {change:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scales", nargs="+", default=["1k", "10k", "100k"],
+        help=f"Named scales ({', '.join(SCALES)}) or member counts",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--baseline", help="Earlier report to compare against")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--results", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.repeat, args.results, args.seed)
+        return
+
+    results = []
+    for scale in args.scales:
+        results.extend(run_scale(scale, args.repeat, args.seed))
+
+    report = {"environment": environment_info(args.seed, args.repeat), "results": results}
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            print_comparison(results, json.load(baseline_file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Deterministic synthetic FitZone data: members, trainers and managers.
+
+The same seed and scale always produce the same rows. Names follow a
+Zipf-like popularity curve, sign-ups grow over time, and membership plans,
+ages and trainer shifts are weighted the way a real gym's would be.
+
+Usage:
+    python -m benchmarks.synthetic_data --scale 10k --database fitzone_10k.db
+"""
+
+import argparse
+import itertools
+import os
+import random
+import unicodedata
+from datetime import datetime, timedelta
+
+# Members per named scale; trainers and managers are derived from it
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+
+FIRST_NAMES = [
+    "María", "José", "Juan", "Ana", "Luis", "Carlos", "Sofía", "Jorge", "Lucía",
+    "Miguel", "Fernanda", "Antonio", "Valentina", "Alejandro", "Camila", "Diego",
+    "Daniela", "Javier", "Isabella", "Ricardo", "Gabriela", "Fernando", "Mariana",
+    "Roberto", "Aideé", "Eduardo", "Paula", "Héctor", "Andrea", "Raúl", "Natalia",
+    "Sergio", "Valeria", "Óscar", "Regina", "Arturo", "Ximena", "Emilio", "Renata",
+    "Iñaki",
+]
+LAST_NAMES = [
+    "García", "Hernández", "López", "Martínez", "González", "Pérez", "Rodríguez",
+    "Sánchez", "Ramírez", "Cruz", "Flores", "Gómez", "Morales", "Vázquez",
+    "Reyes", "Jiménez", "Torres", "Díaz", "Gutiérrez", "Ruiz", "Mendoza",
+    "Aguilar", "Ortiz", "Moreno", "Castillo", "Romero", "Álvarez", "Méndez",
+    "Chávez", "Rivera", "Juárez", "Ramos", "Domínguez", "Herrera", "Medina",
+    "Castro", "Vargas", "Guzmán", "Velázquez", "Correa",
+]
+
+# Plan -> (share of members, days until renewal)
+MEMBERSHIPS = {"basic": (0.6, 30), "premium": (0.3, 90), "vip": (0.1, 365)}
+
+SPECIALTIES = {
+    "Strength": 5, "Cardio": 4, "Yoga": 3, "CrossFit": 3, "Pilates": 2,
+    "Boxing": 2, "Spinning": 2, "Nutrition": 1, "Rehabilitation": 1,
+}
+SHIFT_STARTS = ["06:00", "07:00", "08:00", "10:00", "14:00", "16:00", "18:00"]
+SHIFT_HOURS = [4, 6, 8]
+
+# Sign-ups span OPENING..END, so the data does not depend on today's date
+OPENING = datetime(2019, 1, 1)
+END = datetime(2025, 1, 1)
+
+
+def scale_counts(members):
+    """(members, trainers, managers) for a member count"""
+    trainers = max(10, members // 100)
+    return members, trainers, max(2, trainers // 4)
+
+
+def _zipf_weights(count):
+    """Popularity weights 1, 1/2, 1/3, ...: a few names are very common"""
+    return list(itertools.accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+def _ascii(text):
+    """Accent-free lowercase text for emails"""
+    return (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    )
+
+
+class _PersonFactory:
+    """Draws names, ages, contact data and sign-up dates from one RNG"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self._first_weights = _zipf_weights(len(FIRST_NAMES))
+        self._last_weights = _zipf_weights(len(LAST_NAMES))
+        self._span_hours = int((END - OPENING).total_seconds() // 3600)
+
+    def person(self, person_id, kind, min_age, max_age, mean_age):
+        rng = self.rng
+        name = rng.choices(FIRST_NAMES, cum_weights=self._first_weights)[0]
+        lastname = rng.choices(LAST_NAMES, cum_weights=self._last_weights)[0]
+        age = min(max_age, max(min_age, round(rng.gauss(mean_age, 9))))
+        return {
+            "id": person_id,
+            "name": name,
+            "lastname": lastname,
+            "age": age,
+            "email": f"{_ascii(name)}.{_ascii(lastname)}{person_id}@{kind}.fitzone.test",
+            "phone": f"55{rng.randint(10_000_000, 99_999_999)}",
+            "created_at": self.signup_date(),
+            "type": kind,
+        }
+
+    def signup_date(self):
+        """Hour-aligned date; the sign-up rate grows linearly over time"""
+        hours = int(self._span_hours * self.rng.random() ** 0.5)
+        return OPENING + timedelta(hours=hours)
+
+
+def generate_members(count, seed=42, first_id=1):
+    """
+    Yield (person_row, user_row) dicts for count members with IDs from first_id.
+    """
+    rng = random.Random(seed)
+    factory = _PersonFactory(rng)
+    plans = list(MEMBERSHIPS)
+    plan_weights = list(itertools.accumulate(share for share, _ in MEMBERSHIPS.values()))
+
+    for person_id in range(first_id, first_id + count):
+        person = factory.person(person_id, "user", 16, 75, 32)
+        plan = rng.choices(plans, cum_weights=plan_weights)[0]
+        renewal_days = MEMBERSHIPS[plan][1]
+        yield person, {
+            "id": person_id,
+            "membership_type": plan,
+            "renovation_date": person["created_at"] + timedelta(days=renewal_days),
+        }
+
+
+def generate_trainers(count, seed=42, first_id=1):
+    """Yield (person_row, trainer_row) dicts for count trainers with IDs from first_id"""
+    rng = random.Random(seed + 1)
+    factory = _PersonFactory(rng)
+    specialties = list(SPECIALTIES)
+    specialty_weights = list(itertools.accumulate(SPECIALTIES.values()))
+
+    for person_id in range(first_id, first_id + count):
+        person = factory.person(person_id, "trainer", 21, 60, 33)
+        start = rng.choice(SHIFT_STARTS)
+        end_hour = min(23, int(start[:2]) + rng.choice(SHIFT_HOURS))
+        yield person, {
+            "id": person_id,
+            "specialty": rng.choices(specialties, cum_weights=specialty_weights)[0],
+            "start_time": start,
+            "end_time": f"{end_hour:02d}:00",
+            "admin_username": None,
+        }
+
+
+def generate_managers(count, password_hash, seed=42):
+    """Yield admin rows for count managers, created over the gym's lifetime"""
+    rng = random.Random(seed + 2)
+    factory = _PersonFactory(rng)
+    for idx in range(1, count + 1):
+        yield {
+            "username": f"manager{idx:05d}",
+            "password_hash": password_hash,
+            "role": "manager",
+            "created_at": factory.signup_date(),
+        }
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def seed_database(engine, members, trainers=None, managers=None, seed=42,
+                  chunk_size=50_000, password="fitzone"):
+    """
+    Insert a synthetic dataset with Core executemany, chunk by chunk.
+    Each manager is linked to one trainer. The schema must already exist.
+
+    Returns:
+        dict: Number of members, trainers and managers inserted
+    """
+    from models.admin import ph
+    from models.models import AdminDB, PersonDB, TrainerDB, UserDB
+
+    _, default_trainers, default_managers = scale_counts(members)
+    trainers = default_trainers if trainers is None else trainers
+    managers = min(trainers, default_managers if managers is None else managers)
+
+    # Argon2 is slow by design: every manager shares one hash
+    password_hash = ph.hash(password)
+
+    with engine.begin() as connection:
+        first_id = (connection.execute(
+            PersonDB.__table__.select().with_only_columns(PersonDB.__table__.c.id)
+            .order_by(PersonDB.__table__.c.id.desc()).limit(1)
+        ).scalar() or 0) + 1
+
+        for chunk in _chunks(generate_members(members, seed, first_id), chunk_size):
+            connection.execute(PersonDB.__table__.insert(), [person for person, _ in chunk])
+            connection.execute(UserDB.__table__.insert(), [user for _, user in chunk])
+
+        manager_rows = list(generate_managers(managers, password_hash, seed))
+        if manager_rows:
+            connection.execute(AdminDB.__table__.insert(), manager_rows)
+
+        trainer_rows = list(generate_trainers(trainers, seed, first_id + members))
+        for (_, trainer), manager in zip(trainer_rows, manager_rows):
+            trainer["admin_username"] = manager["username"]
+        for chunk in _chunks(trainer_rows, chunk_size):
+            connection.execute(PersonDB.__table__.insert(), [person for person, _ in chunk])
+            connection.execute(TrainerDB.__table__.insert(), [trainer for _, trainer in chunk])
+
+    return {"members": members, "trainers": trainers, "managers": managers}
+
+
+def parse_scale(value):
+    """'10k', '1M' or a plain number of members"""
+    if value in SCALES:
+        return SCALES[value]
+    return int(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", default="10k", help=f"{', '.join(SCALES)} or a member count")
+    parser.add_argument("--database", required=True, help="SQLite file to create or extend")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # The database URL is read when controllers.database is imported
+    os.environ["FITZONE_DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.database)}"
+    from controllers.database import engine, init_db
+
+    init_db()
+    counts = seed_database(engine, parse_scale(args.scale), seed=args.seed)
+    print(
+        f"Inserted {counts['members']} members, {counts['trainers']} trainers "
+        f"and {counts['managers']} managers into {args.database}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+FitZone - Command line tools
+Maintenance tasks that do not need the graphical interface.
+
+Usage:
+    python cli.py import users members.csv
+    python cli.py import trainers trainers.jsonl --chunk-size 10000
+    python cli.py export users members.csv
+    python cli.py export admins - --format jsonl
+    python cli.py migrate
+    python cli.py --profile export users members.csv
+"""
+
+import argparse
+import sys
+import time
+
+from controllers import instrumentation
+from controllers.bulk_export import export_file
+from controllers.bulk_import import DEFAULT_CHUNK_SIZE, import_file
+from controllers.database import init_db
+
+# Rejected rows printed before the summary is truncated
+MAX_PRINTED_ERRORS = 50
+
+
+def run_import(args):
+    """Import members or trainers from a CSV/JSONL file and print the report"""
+    start = time.perf_counter()
+    report = import_file(args.entity, args.path, args.format, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    for line_number, message in report.errors[:MAX_PRINTED_ERRORS]:
+        location = f"line {line_number}" if line_number else "import"
+        print(f"  {location}: {message}")
+    if report.failed > MAX_PRINTED_ERRORS:
+        print(f"  ... {report.failed - MAX_PRINTED_ERRORS} more errors")
+
+    rate = report.imported / elapsed if elapsed else 0
+    print(f"{report} in {elapsed:.1f}s ({rate:.0f} rows/s)")
+    return 0 if not report.errors else 1
+
+
+def run_export(args):
+    """Stream a table to a CSV/JSONL file"""
+    start = time.perf_counter()
+    count = export_file(args.entity, args.path, args.format, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    # Keep standard output clean when it holds the export itself
+    summary = sys.stderr if args.path == "-" else sys.stdout
+    print(f"{args.entity}: {count} exported in {elapsed:.1f}s", file=summary)
+    return 0
+
+
+def run_migrate(args):
+    """Apply pending schema migrations"""
+    applied = init_db()
+    if applied:
+        print(f"Applied migrations: {', '.join(str(version) for version in applied)}")
+    else:
+        print("Database schema is up to date")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="FitZone command line tools")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=instrumentation.ENABLED_BY_ENV,
+        help="Print the time spent per operation and SQL statement to stderr",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Bulk import members or trainers")
+    import_parser.add_argument("entity", choices=["users", "trainers"])
+    import_parser.add_argument("path", help="CSV (with header row) or JSONL file")
+    import_parser.add_argument(
+        "--format", choices=["csv", "jsonl"], help="File format (default: from extension)"
+    )
+    import_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    import_parser.set_defaults(handler=run_import)
+
+    export_parser = commands.add_parser("export", help="Export members, trainers or admins")
+    export_parser.add_argument("entity", choices=["users", "trainers", "admins"])
+    export_parser.add_argument("path", help="Output file, or - for standard output")
+    export_parser.add_argument(
+        "--format", choices=["csv", "jsonl"], help="File format (default: from extension)"
+    )
+    export_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    export_parser.set_defaults(handler=run_export)
+
+    migrate_parser = commands.add_parser("migrate", help="Create or upgrade the database schema")
+    migrate_parser.set_defaults(handler=run_migrate)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        instrumentation.enable()
+    if args.command != "migrate":
+        init_db()
+    try:
+        return args.handler(args)
+    finally:
+        if args.profile:
+            print(instrumentation.format_report(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Admin authentication with Argon2 kept off the Tk thread.
+Hashes run on a small worker pool behind a semaphore (each one allocates
+memory_cost KiB), repeated failures per username and per client are slowed
+down with an exponential backoff, and outdated hashes are upgraded after a
+successful login.
+"""
+import logging
+import threading
+import time
+from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
+from controllers.background import BackgroundExecutor
+from controllers.crud import get_admin_by_username, update_admin_password_hash
+from models.admin import ph
+
+logger = logging.getLogger(__name__)
+
+# Logins are rare: two workers keep one slow hash from queueing the next
+auth_executor = BackgroundExecutor(max_workers=2, thread_name_prefix="fitzone-auth")
+
+
+class AuthService:
+    """
+    Rate-limited authentication around the admin password hashes.
+
+    Args:
+        executor: Runs authenticate_async work and delivers its results
+        max_concurrent_hashes: Argon2 computations allowed at the same time
+        clock: Monotonic time source, in seconds
+    """
+
+    # Failed attempts allowed before the backoff starts
+    FREE_ATTEMPTS = 3
+    BASE_DELAY = 1.0  # seconds, doubled on every further failure
+    MAX_DELAY = 300.0
+    # Failure records kept before expired ones are pruned
+    MAX_TRACKED_KEYS = 10_000
+
+    def __init__(self, executor=auth_executor, max_concurrent_hashes=2, clock=time.monotonic):
+        self.executor = executor
+        self._hash_slots = threading.BoundedSemaphore(max_concurrent_hashes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = {}  # key -> (failed attempts, locked until)
+        self._dummy_hash = None
+
+    def authenticate(self, username, password, client="local"):
+        """
+        Check credentials, blocking until the hash is verified.
+
+        Returns:
+            dict: {"success", "message", "admin", "retry_after"}
+        """
+        if not username or not password:
+            return self._result(False, "Please enter both username and password")
+
+        keys = (f"user:{username.lower()}", f"client:{client}")
+        retry_after = self._begin_attempt(keys)
+        if retry_after > 0:
+            return self._result(
+                False,
+                f"Too many failed attempts. Try again in {int(retry_after) + 1} seconds.",
+                retry_after=retry_after,
+            )
+
+        admin = get_admin_by_username(username)
+        stored_hash = admin._password if admin else None
+
+        if not self._verify(stored_hash or self._get_dummy_hash(), password) or not admin:
+            # Already counted as failed by _begin_attempt
+            return self._result(False, "Invalid credentials. Please try again.")
+
+        self._clear_failures(keys)
+        self._rehash_if_needed(admin, password)
+        return self._result(True, "", admin=admin)
+
+    def authenticate_async(self, username, password, callback, client="local"):
+        """Run authenticate in the background, callback gets its result dict"""
+        return self.executor.submit(
+            self.authenticate,
+            username,
+            password,
+            client,
+            callback=callback,
+            error_callback=lambda error: callback(
+                self._result(False, f"Authentication error: {error}")
+            ),
+        )
+
+    def hash_password(self, password):
+        """Hash a password, waiting for a free hashing slot"""
+        with self._hash_slots:
+            return ph.hash(password)
+
+    def _get_dummy_hash(self):
+        """
+        Hash verified when the username does not exist, so unknown usernames
+        take as long as wrong passwords
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash_password("fitzone-dummy-password")
+        return self._dummy_hash
+
+    def _verify(self, stored_hash, password):
+        with self._hash_slots:
+            try:
+                return ph.verify(stored_hash, password)
+            except (VerifyMismatchError, VerificationError, InvalidHashError):
+                return False
+
+    def _rehash_if_needed(self, admin, password):
+        """Store a new hash when the PasswordHasher parameters changed"""
+        try:
+            if not ph.check_needs_rehash(admin._password):
+                return
+        except InvalidHashError:
+            return
+
+        new_hash = self.hash_password(password)
+        if update_admin_password_hash(admin.unique_id, new_hash):
+            admin._password = new_hash
+            logger.info(f"Upgraded password hash for admin '{admin.username}'")
+
+    def _begin_attempt(self, keys):
+        """
+        Seconds until any of keys may try again, or 0 after counting this
+        attempt as failed until it succeeds. Checking and counting under one
+        lock keeps concurrent attempts from all passing the check before
+        any of their failures is recorded
+        """
+        now = self._clock()
+        with self._lock:
+            retry_after = max(
+                (self._failures.get(key, (0, 0.0))[1] - now for key in keys),
+                default=0.0,
+            )
+            if retry_after <= 0:
+                self._record_failure(keys, now)
+            return retry_after
+
+    def _record_failure(self, keys, now):
+        """Count a failed attempt for keys (the caller holds the lock)"""
+        if len(self._failures) >= self.MAX_TRACKED_KEYS:
+            self._prune(now)
+        for key in keys:
+            attempts = self._failures.get(key, (0, 0.0))[0] + 1
+            locked_until = 0.0
+            if attempts >= self.FREE_ATTEMPTS:
+                delay = self.BASE_DELAY * 2 ** (attempts - self.FREE_ATTEMPTS)
+                locked_until = now + min(delay, self.MAX_DELAY)
+            self._failures[key] = (attempts, locked_until)
+
+    def _clear_failures(self, keys):
+        with self._lock:
+            for key in keys:
+                self._failures.pop(key, None)
+
+    def _prune(self, now):
+        """Forget keys whose lock has expired"""
+        self._failures = {
+            key: record for key, record in self._failures.items() if record[1] > now
+        }
+
+    @staticmethod
+    def _result(success, message, admin=None, retry_after=0.0):
+        return {
+            "success": success,
+            "message": message,
+            "admin": admin,
+            "retry_after": retry_after,
+        }
+
+
+auth_service = AuthService()
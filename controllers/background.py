@@ -0,0 +1,111 @@
+"""
+Runs blocking work (queries, password hashing) off the Tk main loop.
+Work goes to a thread pool; finished futures are put on a result queue that
+the Tk thread drains with after(), so callbacks always run on the Tk thread.
+"""
+import logging
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundExecutor:
+    """
+    Thread pool whose results are delivered back on the Tk thread.
+
+    Until attach() is given a Tk widget, submit() runs the work inline, so
+    controllers keep working without a window (CLI, scripts).
+    """
+
+    # ~60 fps: the queue is only polled while work is pending
+    POLL_INTERVAL_MS = 16
+
+    def __init__(self, max_workers=1, thread_name_prefix="fitzone-worker"):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._results = queue.SimpleQueue()
+        self._root = None
+        self._pending = 0
+        self._polling = False
+
+    def attach(self, widget):
+        """Deliver results through the main loop of widget's toplevel window"""
+        self._root = widget.winfo_toplevel()
+
+    def detach(self):
+        self._root = None
+        self._polling = False
+
+    def submit(self, func, *args, callback=None, error_callback=None, **kwargs):
+        """
+        Run func(*args, **kwargs) in the background.
+
+        Args:
+            callback: Called on the Tk thread with the result
+            error_callback: Called on the Tk thread with the exception.
+                Without one, the exception is logged
+
+        Returns:
+            Future: Resolves to func's result
+        """
+        if self._root is None:
+            future = Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            self._deliver(future, callback, error_callback)
+            return future
+
+        future = self._pool.submit(func, *args, **kwargs)
+        self._pending += 1
+        future.add_done_callback(
+            lambda done: self._results.put((done, callback, error_callback))
+        )
+        self._schedule_poll()
+        return future
+
+    def _schedule_poll(self):
+        if not self._polling and self._root is not None:
+            self._polling = True
+            self._root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Run the callbacks of finished work, keep polling while any is pending"""
+        self._polling = False
+        while True:
+            try:
+                future, callback, error_callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._deliver(future, callback, error_callback)
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    @staticmethod
+    def _deliver(future, callback, error_callback):
+        error = future.exception()
+        try:
+            if error is not None:
+                if error_callback:
+                    error_callback(error)
+                else:
+                    logger.error(f"Background task failed: {error}")
+            elif callback:
+                callback(future.result())
+        except Exception as e:
+            # A failing callback must not stop the other results
+            logger.error(f"Background callback failed: {e}")
+
+    def shutdown(self, wait=False):
+        self.detach()
+        self._pool.shutdown(wait=wait)
+
+
+# Database work runs on a single worker, so there is one SQLite writer. The
+# Tk thread still reads the controller caches, which guard their own state
+db_executor = BackgroundExecutor(max_workers=1, thread_name_prefix="fitzone-db")
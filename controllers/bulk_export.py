@@ -0,0 +1,118 @@
+"""
+Streaming export of members, trainers and admins to CSV or JSONL.
+Rows are read with yield_per and written as they arrive, so memory stays at
+one chunk no matter how large the table is. Dates use the same
+'YYYY-MM-DD HH:00' format the importer accepts.
+"""
+import csv
+import json
+import os
+import sys
+from contextlib import contextmanager
+from sqlalchemy import select
+from controllers.database import SessionLocal
+from models.models import AdminDB, TrainerDB, UserDB
+from utils.date_codec import format_hour
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Exported columns per entity. Password hashes are never exported
+EXPORT_COLUMNS = {
+    "users": (
+        UserDB.id, UserDB.name, UserDB.lastname, UserDB.age, UserDB.email, UserDB.phone,
+        UserDB.membership_type, UserDB.created_at, UserDB.renovation_date,
+    ),
+    "trainers": (
+        TrainerDB.id, TrainerDB.name, TrainerDB.lastname, TrainerDB.age, TrainerDB.email,
+        TrainerDB.phone, TrainerDB.specialty, TrainerDB.start_time, TrainerDB.end_time,
+        TrainerDB.admin_username, TrainerDB.created_at,
+    ),
+    "admins": (AdminDB.id, AdminDB.username, AdminDB.role, AdminDB.created_at),
+}
+
+
+def export_headers(entity):
+    """Column names written for an entity"""
+    if entity not in EXPORT_COLUMNS:
+        raise ValueError(f"Cannot export '{entity}'")
+    return [column.key for column in EXPORT_COLUMNS[entity]]
+
+
+def _format_value(value):
+    if hasattr(value, "strftime"):
+        return format_hour(value)
+    return value
+
+
+def stream_rows(entity, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the rows of an entity as tuples in ID order.
+
+    The result is fetched chunk_size rows at a time, so only one chunk is
+    held in memory while the caller consumes the generator.
+    """
+    columns = EXPORT_COLUMNS.get(entity)
+    if columns is None:
+        raise ValueError(f"Cannot export '{entity}'")
+
+    stmt = select(*columns).order_by(columns[0]).execution_options(yield_per=chunk_size)
+    session = SessionLocal()
+    try:
+        for partition in session.execute(stmt).partitions():
+            for row in partition:
+                yield tuple(_format_value(value) for value in row)
+    finally:
+        session.close()
+
+
+def write_csv(output, headers, rows):
+    """Write rows as CSV with a header row, returns the number of rows"""
+    writer = csv.writer(output)
+    writer.writerow(headers)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(output, headers, rows):
+    """Write one JSON object per line, returns the number of rows"""
+    count = 0
+    for row in rows:
+        output.write(json.dumps(dict(zip(headers, row)), ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
+
+
+@contextmanager
+def _open_output(path):
+    """Open path for writing, '-' meaning standard output"""
+    if path == "-":
+        yield sys.stdout
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as output:
+            yield output
+
+
+def export_file(entity, path, file_format=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Export 'users', 'trainers' or 'admins' to a CSV or JSONL file.
+
+    Returns:
+        int: Number of rows written
+    """
+    if file_format is None:
+        file_format = "csv" if path == "-" else os.path.splitext(path)[1].lstrip(".").lower()
+    if file_format == "ndjson":
+        file_format = "jsonl"
+    if file_format not in WRITERS:
+        raise ValueError(f"Unsupported export format: '{file_format}'")
+
+    headers = export_headers(entity)
+    with _open_output(path) as output:
+        return WRITERS[file_format](output, headers, stream_rows(entity, chunk_size))
@@ -0,0 +1,272 @@
+"""
+Bulk import of members and trainers from CSV or JSONL files.
+Records are streamed in chunks, validated with the domain models and inserted
+with one executemany per table and chunk, each chunk in its own transaction,
+so a bad row is reported without aborting the rest of the load.
+"""
+import csv
+import json
+import logging
+import os
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from controllers.database import SessionLocal
+from controllers.converters import trainer_to_row, user_to_row
+from models.models import PersonDB, TrainerDB, UserDB
+from models.trainer import Trainer
+from models.user import User
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+REQUIRED_FIELDS = ("name", "lastname", "email")
+
+
+class ImportReport:
+    """Outcome of a bulk import: counts plus one error per rejected row"""
+
+    def __init__(self, entity):
+        self.entity = entity
+        self.total = 0
+        self.imported = 0
+        self.errors = []  # (line number, message)
+
+    @property
+    def failed(self):
+        return len(self.errors)
+
+    def add_error(self, line_number, message):
+        self.errors.append((line_number, message))
+
+    def __str__(self):
+        return (
+            f"{self.entity}: {self.imported} imported, "
+            f"{self.failed} rejected, {self.total} read"
+        )
+
+
+def read_records(path, file_format=None):
+    """
+    Stream records from a CSV (with header row) or JSONL file.
+
+    Yields:
+        tuple: (line number, dict of field -> value). Unparseable JSONL lines
+        are yielded with a None record so they can be reported.
+    """
+    file_format = file_format or os.path.splitext(path)[1].lstrip(".").lower()
+
+    with open(path, newline="", encoding="utf-8") as source:
+        if file_format == "csv":
+            reader = csv.DictReader(source)
+            for record in reader:
+                yield reader.line_num, record
+        elif file_format in ("jsonl", "ndjson"):
+            for line_number, line in enumerate(source, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                yield line_number, record if isinstance(record, dict) else None
+        else:
+            raise ValueError(f"Unsupported import format: '{file_format}'")
+
+
+def _chunks(records, size):
+    """Group an iterable into lists of at most size items"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _clean(record):
+    """Strip strings and turn blanks into None"""
+    cleaned = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        cleaned[key.strip()] = value
+    return cleaned
+
+
+def _build_person_fields(record):
+    """Validate the fields shared by users and trainers"""
+    missing = [field for field in REQUIRED_FIELDS if not record.get(field)]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+
+    email = record["email"]
+    if "@" not in email:
+        raise ValueError(f"Invalid email: '{record['email']}'")
+
+    age = record.get("age")
+    if age is not None:
+        try:
+            age = int(age)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid age: '{age}'")
+
+    return {
+        "name": record["name"],
+        "lastname": record["lastname"],
+        "age": age,
+        "email": email,
+        "phone": str(record["phone"]) if record.get("phone") else None,
+    }
+
+
+def build_user(record):
+    """Build a validated User from an import record"""
+    # The renovation_date setter parses created_at, so both dates are checked here
+    return User(
+        membership_type=record.get("membership_type") or "Basic",
+        created_at=record.get("created_at"),
+        renovation_date=record.get("renovation_date"),
+        **_build_person_fields(record),
+    )
+
+
+def build_trainer(record):
+    """Build a validated Trainer from an import record"""
+    trainer = Trainer(specialty=record.get("specialty"), **_build_person_fields(record))
+    if record.get("created_at"):
+        trainer.created_at = record["created_at"]
+    trainer.start_time = record.get("start_time")
+    trainer.end_time = record.get("end_time")
+    return trainer
+
+
+def _existing_emails(session, emails):
+    """Emails from the given collection that are already registered"""
+    return set(session.scalars(select(PersonDB.email).where(PersonDB.email.in_(emails))))
+
+
+def _insert_chunk(session, model, rows):
+    """
+    Insert rows of a joined-table model (UserDB, TrainerDB) with one
+    executemany per table. The IDs generated for the persons rows are read
+    back by their unique email to fill the child table rows.
+    """
+    persons = PersonDB.__table__
+    child = model.__table__
+    person_columns = [column.key for column in persons.c if column.key not in ("id", "type")]
+    child_columns = [column.key for column in child.c if column.key != "id"]
+    identity = model.__mapper__.polymorphic_identity
+
+    session.execute(
+        persons.insert(),
+        [dict({key: row.get(key) for key in person_columns}, type=identity) for row in rows],
+    )
+    ids = dict(session.execute(
+        select(persons.c.email, persons.c.id).where(
+            persons.c.email.in_([row["email"] for row in rows])
+        )
+    ).all())
+    session.execute(
+        child.insert(),
+        [
+            dict({key: row.get(key) for key in child_columns}, id=ids[row["email"]])
+            for row in rows
+        ],
+    )
+
+
+def _insert_rows_individually(session, model, rows, report):
+    """Retry a failed chunk row by row so only the offending rows are rejected"""
+    for line_number, row in rows:
+        try:
+            with session.begin_nested():
+                _insert_chunk(session, model, [row])
+            report.imported += 1
+        except IntegrityError as e:
+            report.add_error(line_number, f"Database constraint failed: {e.orig}")
+
+
+def _import(records, model, build, to_row, report, chunk_size):
+    seen_emails = set()
+    session = SessionLocal()
+    try:
+        for chunk in _chunks(records, chunk_size):
+            rows = []
+            for line_number, record in chunk:
+                report.total += 1
+                if record is None:
+                    report.add_error(line_number, "Unreadable record")
+                    continue
+                try:
+                    entity = build(_clean(record))
+                except (TypeError, ValueError) as e:
+                    report.add_error(line_number, str(e))
+                    continue
+
+                if entity.email in seen_emails:
+                    report.add_error(line_number, f"Duplicate email in file: {entity.email}")
+                    continue
+                seen_emails.add(entity.email)
+                rows.append((line_number, entity))
+
+            existing = _existing_emails(session, [entity.email for _, entity in rows])
+            parameters = []
+            for line_number, entity in rows:
+                if entity.email in existing:
+                    report.add_error(line_number, f"Email already registered: {entity.email}")
+                    continue
+                parameters.append((line_number, to_row(entity)))
+
+            if not parameters:
+                continue
+            try:
+                _insert_chunk(session, model, [row for _, row in parameters])
+                session.commit()
+                report.imported += len(parameters)
+            except IntegrityError:
+                session.rollback()
+                _insert_rows_individually(session, model, parameters, report)
+                session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error(f"Error importing {report.entity}: {str(e)}")
+        report.add_error(None, f"Import stopped: {str(e)}")
+    finally:
+        session.close()
+
+    logger.info(str(report))
+    return report
+
+
+def import_users(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Import members from an iterable of (line number, record) pairs.
+
+    Returns:
+        ImportReport: Counts and per-row errors
+    """
+    return _import(records, UserDB, build_user, user_to_row, ImportReport("users"), chunk_size)
+
+
+def import_trainers(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Import trainers from an iterable of (line number, record) pairs.
+
+    Returns:
+        ImportReport: Counts and per-row errors
+    """
+    return _import(
+        records, TrainerDB, build_trainer, trainer_to_row, ImportReport("trainers"), chunk_size
+    )
+
+
+def import_file(entity, path, file_format=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Import a CSV or JSONL file of 'users' or 'trainers'"""
+    importers = {"users": import_users, "trainers": import_trainers}
+    if entity not in importers:
+        raise ValueError(f"Cannot import '{entity}'")
+    return importers[entity](read_records(path, file_format), chunk_size)
@@ -3,60 +3,70 @@ from models.person import Person
 from models.user import User
 from models.trainer import Trainer
 from models.admin import Admin
-from datetime import datetime
+from utils.date_codec import format_hour, parse_hour
 
 
-def user_to_db(user):
-    """Converts a User object to a UserDB object"""
+def user_to_row(user):
+    """Converts a User object to the column values of a UserDB row"""
     # Convertir strings a objetos datetime
     created_at = (
-        datetime.strptime(user.created_at, "%Y-%m-%d %H:00")
+        parse_hour(user.created_at)
         if user.created_at
         else None
     )
     renovation_date = (
-        datetime.strptime(user.renovation_date, "%Y-%m-%d %H:00")
+        parse_hour(user.renovation_date)
         if user.renovation_date
         else None
     )
 
-    return UserDB(
-        name=user.name,
-        lastname=user.lastname,
-        age=user.age,
-        email=user.email,
-        phone=user.phone,
-        membership_type=user.membership_type,
-        renovation_date=renovation_date,
-        created_at=created_at,
-    )
+    return {
+        "name": user.name,
+        "lastname": user.lastname,
+        "age": user.age,
+        "email": user.email,
+        "phone": user.phone,
+        "membership_type": user.membership_type,
+        "renovation_date": renovation_date,
+        "created_at": created_at,
+    }
 
 
-def trainer_to_db(trainer):
-    """Converts a Trainer object to a TrainerDB object"""
+def user_to_db(user):
+    """Converts a User object to a UserDB object"""
+    return UserDB(**user_to_row(user))
+
+
+def trainer_to_row(trainer):
+    """Converts a Trainer object to the column values of a TrainerDB row"""
     created_at = (
-        datetime.strptime(trainer.created_at, "%Y-%m-%d %H:00")
+        parse_hour(trainer.created_at)
         if trainer.created_at
         else None
     )
 
-    return TrainerDB(
-        name=trainer.name,
-        lastname=trainer.lastname,
-        age=trainer.age,
-        email=trainer.email,
-        phone=trainer.phone,
-        specialty=trainer.specialty,
-        start_time=trainer.start_time,
-        end_time=trainer.end_time,
-        created_at=created_at,
-    )
+    return {
+        "name": trainer.name,
+        "lastname": trainer.lastname,
+        "age": trainer.age,
+        "email": trainer.email,
+        "phone": trainer.phone,
+        "specialty": trainer.specialty,
+        "start_time": trainer.start_time,
+        "end_time": trainer.end_time,
+        "created_at": created_at,
+    }
+
+
+def trainer_to_db(trainer):
+    """Converts a Trainer object to a TrainerDB object"""
+    return TrainerDB(**trainer_to_row(trainer))
 
 
 def admin_to_db(admin):
     """Converts an Admin object to an AdminDB object"""
     created_at = (
-        datetime.strptime(admin.created_at, "%Y-%m-%d %H:00")
+        parse_hour(admin.created_at)
         if isinstance(admin.created_at, str)
         else admin.created_at
     )
@@ -88,9 +98,9 @@ def db_to_user(user_db):
         email=user_db.email,
         phone=user_db.phone,
         membership_type=user_db.membership_type,
-        created_at=user_db.created_at.strftime("%Y-%m-%d %H:00") if user_db.created_at else None,
+        created_at=format_hour(user_db.created_at) if user_db.created_at else None,
         renovation_date=(
-            user_db.renovation_date.strftime("%Y-%m-%d %H:00")
+            format_hour(user_db.renovation_date)
             if user_db.renovation_date
             else None
         ),
@@ -111,7 +121,7 @@ def db_to_trainer(trainer_db):
         start_time=trainer_db.start_time,
         end_time=trainer_db.end_time,
         created_at=(
-            trainer_db.created_at.strftime("%Y-%m-%d %H:00")
+            format_hour(trainer_db.created_at)
             if trainer_db.created_at
             else None
         ),
@@ -131,8 +141,8 @@ def db_to_admin(admin_db):
         username=admin_db.username,
         role=admin_db.role,
         created_at=admin_db.created_at,
-        trainer_id=trainer_id  # Pass trainer association
+        trainer_id=trainer_id,  # Pass trainer association
+        password_hash=admin_db.password_hash,
     )
     admin.unique_id = admin_db.id
-    admin._password = admin_db.password_hash
     return admin
@@ -1,7 +1,10 @@
 import logging
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 from prettytable import PrettyTable
-from controllers.database import SessionLocal
+from controllers.database import get_session
+from controllers.instrumentation import instrument_functions
 from models.models import DEFAULT_ADMIN, UserDB, TrainerDB, AdminDB, AdminRoles, PersonDB
 from models.admin import Admin
 from controllers.converters import (
@@ -19,6 +22,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default number of rows per page for the paginated read API
+DEFAULT_PAGE_SIZE = 200
+
+# Columns each entity can be paginated on (primary keys and indexed columns)
+USER_ORDER_COLUMNS = {"id": UserDB.id, "email": UserDB.email, "lastname": UserDB.lastname}
+TRAINER_ORDER_COLUMNS = {
+    "id": TrainerDB.id,
+    "email": TrainerDB.email,
+    "lastname": TrainerDB.lastname,
+}
+ADMIN_ORDER_COLUMNS = {"id": AdminDB.id, "username": AdminDB.username}
+
+# db_to_admin reads admin.trainer: load it in the same query instead of one
+# lazy load per admin
+ADMIN_LOAD_OPTIONS = (joinedload(AdminDB.trainer),)
+
 # ----- Funciones auxiliares compartidas -----
 
 
@@ -28,12 +47,59 @@ def _check_admin_username_exists(session, username):
     return existing_admin is not None
 
 
+def _keyset_page(session, model, order_columns, order_by, after_id, after_value, limit,
+                 options=()):
+    """
+    Fetch one page of ORM rows ordered by (order_by, id), starting after the
+    given key. Each page is a range scan on the index of the order column,
+    so its cost does not grow with the page number like OFFSET does.
+
+    Returns:
+        tuple: (rows, next_key) where next_key is (after_id, after_value) for
+        the following page, or None if this was the last page
+    """
+    if order_by not in order_columns:
+        raise ValueError(f"Cannot paginate {model.__name__} by '{order_by}'")
+
+    order_column = order_columns[order_by]
+    query = session.query(model).options(*options)
+
+    if order_by == "id":
+        if after_id is not None:
+            query = query.filter(model.id > after_id)
+        query = query.order_by(model.id)
+    else:
+        if after_id is not None:
+            query = query.filter(
+                or_(
+                    order_column > after_value,
+                    and_(order_column == after_value, model.id > after_id),
+                )
+            )
+        query = query.order_by(order_column, model.id)
+
+    rows = query.limit(limit).all()
+    if len(rows) < limit:
+        return rows, None
+
+    last = rows[-1]
+    return rows, (last.id, getattr(last, order_column.key))
+
+
+def _iter_pages(get_page, after_id, after_value, limit, order_by):
+    """Yield domain objects from consecutive keyset pages"""
+    next_key = (after_id, after_value)
+    while next_key is not None:
+        items, next_key = get_page(next_key[0], limit, order_by, next_key[1])
+        yield from items
+
+
 # ----- Funciones de Usuario (User) -----
 
 
 def create_user(user):
     """Creates a new user in the database"""
-    session = SessionLocal()
+    session = get_session()
     try:
         user_db = user_to_db(user)
         session.add(user_db)
@@ -50,7 +116,7 @@ def create_user(user):
 
 def get_user(unique_id):
     """Gets a user by their ID"""
-    session = SessionLocal()
+    session = get_session()
     try:
         user_db = session.query(UserDB).filter(UserDB.id == unique_id).first()
         if user_db:
@@ -65,9 +131,9 @@ def get_user(unique_id):
 
 def get_all_users():
     """Gets all users"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        users_db = session.query(UserDB).all()
+        users_db = session.query(UserDB).order_by(UserDB.id).all()
         return [db_to_user(user_db) for user_db in users_db]
     except SQLAlchemyError as e:
         logger.error(f"Error getting users: {str(e)}")
@@ -76,13 +142,138 @@ def get_all_users():
         session.close()
 
 
+def get_users_page(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """
+    Gets one page of users ordered by order_by, using keyset pagination.
+
+    Args:
+        after_id: ID of the last user of the previous page (None for the first page)
+        limit: Maximum number of users in the page
+        order_by: Column name from USER_ORDER_COLUMNS
+        after_value: Value of order_by for the last user of the previous page
+
+    Returns:
+        tuple: (users, next_key) where next_key is (after_id, after_value) for
+        the next page, or None when there are no more users
+    """
+    session = get_session()
+    try:
+        users_db, next_key = _keyset_page(
+            session, UserDB, USER_ORDER_COLUMNS, order_by, after_id, after_value, limit
+        )
+        return [db_to_user(user_db) for user_db in users_db], next_key
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting users page: {str(e)}")
+        return [], None
+    finally:
+        session.close()
+
+
+def iter_users(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """Yields users page by page, holding at most one page in memory"""
+    return _iter_pages(get_users_page, after_id, after_value, limit, order_by)
+
+
+def _select_user_columns(columns, after_id=None, limit=None, user_id=None):
+    """Reads the given user columns as plain tuples in ID order, without ORM objects"""
+    session = get_session()
+    try:
+        stmt = select(*columns).order_by(UserDB.id)
+        if after_id is not None:
+            stmt = stmt.where(UserDB.id > after_id)
+        if user_id is not None:
+            stmt = stmt.where(UserDB.id == user_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return session.execute(stmt).all()
+    except SQLAlchemyError as e:
+        logger.error(f"Error reading user columns: {str(e)}")
+        return []
+    finally:
+        session.close()
+
+
+def get_user_table_rows(after_id=None, limit=None, user_id=None):
+    """
+    Gets only the columns shown in the members table, skipping entity hydration.
+
+    Args:
+        user_id: Read only this user
+
+    Returns:
+        list: (id, name, lastname, membership_type, created_at) tuples in ID order
+    """
+    return _select_user_columns(
+        (UserDB.id, UserDB.name, UserDB.lastname, UserDB.membership_type, UserDB.created_at),
+        after_id=after_id,
+        limit=limit,
+        user_id=user_id,
+    )
+
+
+def get_user_contact_rows(user_id=None):
+    """Gets (id, email, phone) tuples for every user (or only user_id) in ID order"""
+    return _select_user_columns((UserDB.id, UserDB.email, UserDB.phone), user_id=user_id)
+
+
+def get_user_listing_rows(user_id=None):
+    """
+    Gets the table and contact columns of every user (or only user_id) in one query.
+
+    Returns:
+        list: (id, name, lastname, membership_type, created_at, email, phone)
+        tuples in ID order
+    """
+    return _select_user_columns(
+        (
+            UserDB.id, UserDB.name, UserDB.lastname, UserDB.membership_type,
+            UserDB.created_at, UserDB.email, UserDB.phone,
+        ),
+        user_id=user_id,
+    )
+
+
+def get_user_id_at(offset):
+    """
+    Gets the ID of the user at a position in ID order.
+    Only reads the primary key index, used to jump to a page without
+    fetching the rows before it.
+    """
+    session = get_session()
+    try:
+        return (
+            session.query(UserDB.id)
+            .order_by(UserDB.id)
+            .offset(offset)
+            .limit(1)
+            .scalar()
+        )
+    except SQLAlchemyError as e:
+        logger.error(f"Error seeking user: {str(e)}")
+        return None
+    finally:
+        session.close()
+
+
+def count_users():
+    """Counts all users"""
+    session = get_session()
+    try:
+        return session.query(func.count(UserDB.id)).scalar() or 0
+    except SQLAlchemyError as e:
+        logger.error(f"Error counting users: {str(e)}")
+        return 0
+    finally:
+        session.close()
+
+
 def update_user(user):
     """Updates an existing user"""
     if not getattr(user, "unique_id", None):
         logger.error("Cannot update a user without a valid ID")
         return False
 
-    session = SessionLocal()
+    session = get_session()
     try:
         user_db = session.query(UserDB).filter(UserDB.id == user.unique_id).first()
         if not user_db:
@@ -107,7 +298,7 @@ def update_user(user):
 
 def delete_user(unique_id):
     """Deletes a user by their ID"""
-    session = SessionLocal()
+    session = get_session()
     try:
         user_db = session.query(UserDB).filter(UserDB.id == unique_id).first()
         if not user_db:
@@ -134,7 +325,7 @@ def delete_user(unique_id):
 
 def debug_print_users():
     """Debug function to print users in a nice table format"""
-    session = SessionLocal()
+    session = get_session()
     try:
         users_db = session.query(UserDB).all()
         if not users_db:
@@ -190,7 +381,7 @@ def debug_print_users():
 
 def create_trainer(trainer):
     """Creates a new trainer in the database"""
-    session = SessionLocal()
+    session = get_session()
     try:
         trainer_db = trainer_to_db(trainer)
         session.add(trainer_db)
@@ -208,7 +399,7 @@ def create_trainer(trainer):
 
 def get_trainer(unique_id):
     """Gets a trainer by their ID"""
-    session = SessionLocal()
+    session = get_session()
     try:
         trainer_db = session.query(TrainerDB).filter(TrainerDB.id == unique_id).first()
         if trainer_db:
@@ -223,9 +414,9 @@ def get_trainer(unique_id):
 
 def get_all_trainers():
     """Gets all trainers"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        trainers_db = session.query(TrainerDB).all()
+        trainers_db = session.query(TrainerDB).order_by(TrainerDB.id).all()
         return [db_to_trainer(trainer_db) for trainer_db in trainers_db]
     except SQLAlchemyError as e:
         logger.error(f"Error getting trainers: {str(e)}")
@@ -234,13 +425,96 @@ def get_all_trainers():
         session.close()
 
 
+def _query_trainers_with_managers(session):
+    """Trainers joined with the username of the manager assigned to them"""
+    return session.query(TrainerDB, AdminDB.username).outerjoin(
+        AdminDB,
+        and_(
+            AdminDB.username == TrainerDB.admin_username,
+            func.lower(AdminDB.role) == AdminRoles.MANAGER,
+        ),
+    )
+
+
+def get_all_trainers_with_managers():
+    """
+    Gets all trainers together with the username of the manager assigned to
+    them, in a single query.
+
+    Returns:
+        list: (trainer, manager_username or None) tuples in ID order
+    """
+    session = get_session()
+    try:
+        rows = _query_trainers_with_managers(session).order_by(TrainerDB.id).all()
+        return [(db_to_trainer(trainer_db), username) for trainer_db, username in rows]
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting trainers with managers: {str(e)}")
+        return []
+    finally:
+        session.close()
+
+
+def get_trainer_with_manager(unique_id):
+    """Gets a (trainer, manager_username or None) tuple, or None if the trainer does not exist"""
+    session = get_session()
+    try:
+        row = _query_trainers_with_managers(session).filter(TrainerDB.id == unique_id).first()
+        if row:
+            return db_to_trainer(row[0]), row[1]
+        return None
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting trainer with manager: {str(e)}")
+        return None
+    finally:
+        session.close()
+
+
+def get_trainers_page(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """
+    Gets one page of trainers ordered by order_by, using keyset pagination.
+
+    Returns:
+        tuple: (trainers, next_key), see get_users_page
+    """
+    session = get_session()
+    try:
+        trainers_db, next_key = _keyset_page(
+            session, TrainerDB, TRAINER_ORDER_COLUMNS, order_by,
+            after_id, after_value, limit,
+        )
+        return [db_to_trainer(trainer_db) for trainer_db in trainers_db], next_key
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting trainers page: {str(e)}")
+        return [], None
+    finally:
+        session.close()
+
+
+def iter_trainers(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """Yields trainers page by page, holding at most one page in memory"""
+    return _iter_pages(get_trainers_page, after_id, after_value, limit, order_by)
+
+
+def count_trainers():
+    """Counts all trainers"""
+    session = get_session()
+    try:
+        return session.query(func.count(TrainerDB.id)).scalar() or 0
+    except SQLAlchemyError as e:
+        logger.error(f"Error counting trainers: {str(e)}")
+        return 0
+    finally:
+        session.close()
+
+
 def update_trainer(trainer):
     """Updates an existing trainer"""
     if not trainer.unique_id:
         logger.error("Cannot update a trainer without an ID")
         return False
 
-    session = SessionLocal()
+    session = get_session()
     try:
         trainer_db = (
             session.query(TrainerDB).filter(TrainerDB.id == trainer.unique_id).first()
@@ -286,7 +560,7 @@ def update_trainer(trainer):
 
 def delete_trainer(unique_id):
     """Deletes a trainer by their ID"""
-    session = SessionLocal()
+    session = get_session()
     try:
         trainer_db = session.query(TrainerDB).filter(TrainerDB.id == unique_id).first()
         if not trainer_db:
@@ -313,7 +587,7 @@ def delete_trainer(unique_id):
 
 def link_trainer_to_admin(trainer_id, admin_username):
     """Links a trainer to an admin account (manager role)"""
-    session = SessionLocal()
+    session = get_session()
     try:
         trainer_db = session.query(TrainerDB).filter(TrainerDB.id == trainer_id).first()
         admin_db = (
@@ -338,9 +612,46 @@ def link_trainer_to_admin(trainer_id, admin_username):
         session.close()
 
 
+def reassign_admin_trainers(admin_username, trainer_id=None, previous_username=None):
+    """
+    Replaces the trainer association of an admin with one set-based UPDATE,
+    without loading any trainer.
+
+    Trainers linked to admin_username (or to previous_username, when the
+    admin was renamed) are unlinked, and trainer_id, if given, is linked to
+    admin_username.
+
+    Returns:
+        bool: True if the update was committed
+    """
+    trainers = TrainerDB.__table__
+    usernames = [username for username in (admin_username, previous_username) if username]
+    conditions = [trainers.c.admin_username.in_(usernames)]
+
+    if trainer_id is not None:
+        conditions.append(trainers.c.id == trainer_id)
+        new_username = case((trainers.c.id == trainer_id, admin_username), else_=None)
+    else:
+        new_username = None
+
+    session = get_session()
+    try:
+        session.execute(
+            update(trainers).where(or_(*conditions)).values(admin_username=new_username)
+        )
+        session.commit()
+        return True
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error(f"Error reassigning trainers of admin '{admin_username}': {str(e)}")
+        return False
+    finally:
+        session.close()
+
+
 def debug_print_trainers():
     """Debug function to print trainers in a nice table format"""
-    session = SessionLocal()
+    session = get_session()
     try:
         trainers_db = session.query(TrainerDB).all()
         if not trainers_db:
@@ -400,7 +711,7 @@ def debug_print_trainers():
 
 def create_admin(admin):
     """Creates a new admin in the database"""
-    session = SessionLocal()
+    session = get_session()
     try:
         # Reuse the helper function
         if _check_admin_username_exists(session, admin.username):
@@ -424,9 +735,14 @@ def create_admin(admin):
 
 def get_admin_by_username(username):
     """Gets an admin by their username (for authentication purposes)"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        admin_db = session.query(AdminDB).filter(AdminDB.username == username).first()
+        admin_db = (
+            session.query(AdminDB)
+            .options(*ADMIN_LOAD_OPTIONS)
+            .filter(AdminDB.username == username)
+            .first()
+        )
         if admin_db:
             return db_to_admin(admin_db)
         return None
@@ -439,9 +755,14 @@ def get_admin_by_username(username):
 
 def get_admin(unique_id):
     """Gets an admin by their unique_id"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        admin_db = session.query(AdminDB).filter(AdminDB.id == unique_id).first()
+        admin_db = (
+            session.query(AdminDB)
+            .options(*ADMIN_LOAD_OPTIONS)
+            .filter(AdminDB.id == unique_id)
+            .first()
+        )
         if admin_db:
             return db_to_admin(admin_db)
         return None
@@ -454,9 +775,11 @@ def get_admin(unique_id):
 
 def get_all_admins():
     """Gets all admins"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        admins_db = session.query(AdminDB).all()
+        admins_db = (
+            session.query(AdminDB).options(*ADMIN_LOAD_OPTIONS).order_by(AdminDB.id).all()
+        )
         return [db_to_admin(admin_db) for admin_db in admins_db]
     except SQLAlchemyError as e:
         logger.error(f"Error getting admins: {str(e)}")
@@ -465,13 +788,51 @@ def get_all_admins():
         session.close()
 
 
+def get_admins_page(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """
+    Gets one page of admins ordered by order_by, using keyset pagination.
+
+    Returns:
+        tuple: (admins, next_key), see get_users_page
+    """
+    session = get_session()
+    try:
+        admins_db, next_key = _keyset_page(
+            session, AdminDB, ADMIN_ORDER_COLUMNS, order_by, after_id, after_value, limit,
+            options=ADMIN_LOAD_OPTIONS,
+        )
+        return [db_to_admin(admin_db) for admin_db in admins_db], next_key
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting admins page: {str(e)}")
+        return [], None
+    finally:
+        session.close()
+
+
+def iter_admins(after_id=None, limit=DEFAULT_PAGE_SIZE, order_by="id", after_value=None):
+    """Yields admins page by page, holding at most one page in memory"""
+    return _iter_pages(get_admins_page, after_id, after_value, limit, order_by)
+
+
+def count_admins():
+    """Counts all admins"""
+    session = get_session()
+    try:
+        return session.query(func.count(AdminDB.id)).scalar() or 0
+    except SQLAlchemyError as e:
+        logger.error(f"Error counting admins: {str(e)}")
+        return 0
+    finally:
+        session.close()
+
+
 def update_admin(admin):
     """Updates an existing admin"""
     if not admin.unique_id:
         logger.error("Cannot update an admin without an ID")
         raise ValueError("Cannot update an admin without an ID")
 
-    session = SessionLocal()
+    session = get_session()
     try:
         admin_db = session.query(AdminDB).filter(AdminDB.id == admin.unique_id).first()
         if not admin_db:
@@ -523,7 +884,7 @@ def delete_admin_by_username(username):
     Returns:
         bool: True if deleted successfully, False otherwise
     """
-    session = SessionLocal()
+    session = get_session()
     try:
         # Find the admin to delete by username
         admin_db = (
@@ -572,7 +933,7 @@ def delete_admin(unique_id):
     Returns:
         bool: True if deleted successfully, False otherwise
     """
-    session = SessionLocal()
+    session = get_session()
     try:
         # Find the admin to delete
         admin_db = (
@@ -613,7 +974,7 @@ def delete_admin(unique_id):
 
 def debug_print_admins():
     """Debug function to print admins in a nice table format"""
-    session = SessionLocal()
+    session = get_session()
     try:
         admins_db = session.query(AdminDB).all()
         if not admins_db:
@@ -651,7 +1012,7 @@ def debug_print_admins():
 
 def is_admin_username_available(username):
     """Public API to check if username is available"""
-    session = SessionLocal()
+    session = get_session()
     try:
         return not _check_admin_username_exists(session, username)
     except SQLAlchemyError as e:
@@ -663,7 +1024,7 @@ def is_admin_username_available(username):
 
 def ensure_default_admin_exists():
     """Ensures that there is at least one admin with ADMIN role in the system"""
-    session = SessionLocal()
+    session = get_session()
     try:
         # Check if there are any admins with ADMIN role (not managers)
         admin_count = session.query(AdminDB).filter(AdminDB.role == AdminRoles.ADMIN).count()
@@ -688,9 +1049,14 @@ def ensure_default_admin_exists():
 
 def authenticate_admin(username, password):
     """Authenticates an admin by username and password"""
-    session = SessionLocal()
+    session = get_session()
     try:
-        admin_db = session.query(AdminDB).filter(AdminDB.username == username).first()
+        admin_db = (
+            session.query(AdminDB)
+            .options(*ADMIN_LOAD_OPTIONS)
+            .filter(AdminDB.username == username)
+            .first()
+        )
         if admin_db:
             admin = db_to_admin(admin_db)
             if admin.verify_password(password):
@@ -703,6 +1069,25 @@ def authenticate_admin(username, password):
         session.close()
 
 
+def update_admin_password_hash(unique_id, password_hash):
+    """Replaces the stored password hash of an admin (used to upgrade old hashes)"""
+    session = get_session()
+    try:
+        updated = (
+            session.query(AdminDB)
+            .filter(AdminDB.id == unique_id)
+            .update({AdminDB.password_hash: password_hash}, synchronize_session=False)
+        )
+        session.commit()
+        return updated > 0
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error(f"Error updating admin password hash: {str(e)}")
+        return False
+    finally:
+        session.close()
+
+
 def is_admin(username):
     """Checks if a given username belongs to an admin account
 
@@ -712,7 +1097,7 @@ def is_admin(username):
     Returns:
         bool: True if the username belongs to an admin account, False otherwise
     """
-    session = SessionLocal()
+    session = get_session()
     try:
         admin_db = session.query(AdminDB).filter(AdminDB.username == username).first()
         return admin_db is not None
@@ -723,7 +1108,15 @@ def is_admin(username):
         session.close()
 
 
+# Time every public function while instrumentation is enabled
+instrument_functions(globals(), "crud")
+
+
 if __name__ == "__main__":
+    from controllers.database import init_db
+
+    init_db()
+
     # 1. Create a test admin
     test_admin = Admin(
         username="test_admin",
@@ -16,15 +16,49 @@ from controllers.crud import (
     update_trainer,
     get_user,
     update_user,
-    get_all_trainers,
     create_trainer,
     create_user,
+    count_users,
+    get_user_id_at,
+    reassign_admin_trainers,
 )
+from controllers.auth_service import auth_service
+from controllers.background import db_executor
+from controllers.database import unit_of_work
+from services.column_table import APPEND, DELETE, REPLACE, TableView
 from services.data_formatter import DataFormatter
+from services.facet_index import FacetIndex
+from services.id_index import IdIndex
+from services.paged_rows import PagedRows
+from services.search_index import SearchIndex
+from services.sort_order import SortOrder
+from services.fuzzy_search import FuzzyIndex, tokenize
 from models.admin import Admin
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
+import operator
+import threading
 import time
 
+# Cache patches queued by the save or delete running in this context
+_pending_patches = ContextVar("fitzone_pending_cache_patches", default=None)
+
+
+def _locked(method):
+    """
+    Run a method holding the controller's cache lock. Only for quick
+    bookkeeping: loads and index builds run without it (see _get_index)
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class DashboardController:
     """
@@ -32,65 +66,578 @@ class DashboardController:
     Separates business logic from the view, following the MVC pattern.
     """
 
-    def __init__(self):
+    # Default typo tolerance of the fuzzy search
+    FUZZY_MAX_DISTANCE = 2
+
+    # Rows fetched per page by the paged member table
+    USER_PAGE_SIZE = 200
+
+    # Row-aligned caches of each table: views over one ColumnTable, in the
+    # order the DataFormatter get_*_views methods return them. The second
+    # one has the real ID in its first column
+    ROW_CACHES = {
+        "admins": ("admins", "admins_extended"),
+        "trainers": ("trainers", "trainers_with_real_ids", "trainers_search_terms"),
+        "users": ("users", "users_with_real_ids", "users_search_terms"),
+    }
+
+    # DataFormatter methods returning all ROW_CACHES of an entity in one pass
+    ROW_CACHE_LOADERS = {
+        "admins": "get_admin_views",
+        "trainers": "get_trainer_views",
+        "users": "get_user_views",
+    }
+    _ROW_CACHE_ENTITIES = {
+        name: entity for entity, names in ROW_CACHES.items() for name in names
+    }
+
+    # Unique columns indexed besides the real ID: admin username and trainer_id
+    ID_INDEX_KEY_COLUMNS = {"admins_extended": (1, 4)}
+
+    # Extra per-row fields (email, phone) indexed by the fuzzy search
+    SEARCH_TERM_TABLES = {
+        "users": "users_search_terms",
+        "trainers": "trainers_search_terms",
+    }
+
+    # Table column (see DataFormatter *_COLUMNS) holding the sort key of each
+    # displayed column; None sorts by row position, which is ID order
+    SORT_COLUMNS = {
+        "admins": (None, "username", "role", "created_at"),
+        "trainers": (None, "name", "specialty", "schedule", "manager"),
+        "users": (None, "name", "membership_type", "status", "created_at"),
+    }
+
+    # Displayed columns offered as facet filters, and the CATEGORY column
+    # (see DataFormatter *_COLUMNS) behind each. Users have no status facet:
+    # their status is a constant until the user model stores one
+    FACET_COLUMNS = {
+        "admins": {2: "role"},
+        "trainers": {2: "specialty", 4: "manager"},
+        "users": {2: "membership_type"},
+    }
+
+    def __init__(self, executor=db_executor):
         self.data_formatter = DataFormatter()
+        # Runs the *_async operations off the Tk thread
+        self.executor = executor
         self._cache = {}
         self._cache_dirty = {"admins": True, "trainers": True, "users": True}
+        # entity -> changes (saves, invalidations) seen, to tell whether a
+        # load running without the lock may have missed one
+        self._cache_epochs = {}
+        # Indexes of the cached tables, table_name -> (rows, index): an
+        # index is used only with the rows object it was built over or
+        # patched for (see _patch_indexes), so its positions always refer to
+        # the rows it is used with
+        # table_name -> IdIndex
+        self._id_indexes = {}
+        # table_name -> SearchIndex
+        self._search_indexes = {}
+        # table_name -> FuzzyIndex, over the table and its search terms
+        self._fuzzy_indexes = {}
+        # table_name -> SortOrder
+        self._sort_orders = {}
+        # table_name -> FacetIndex
+        self._facet_indexes = {}
+        # ((trainer rows with real IDs, extended admin rows), (available
+        # trainer rows, IdIndex)) or None
+        self._available_trainers = None
         self._last_operations = {}
+        # Guards the caches, their dirty flags and epochs, and the index
+        # dicts. Held only to read or swap them, never while a table is
+        # loaded or an index is built
+        self._lock = threading.RLock()
 
-    def _get_cached_data(self, table_name: str) -> List[List[Any]]:
+    def _get_cached_data(self, table_name: str) -> Sequence[List[Any]]:
         """Get data from cache or fetch if cache is dirty"""
-        if self._cache_dirty.get(table_name, True) or table_name not in self._cache:
-            if table_name == "admins":
-                self._cache[table_name] = self.data_formatter.get_formatted_admin_data()
-            elif table_name == "admins_extended":
-                self._cache[table_name] = (
-                    self.data_formatter.get_formatted_admin_data_extended()
-                )
-            elif table_name == "trainers":
-                self._cache[table_name] = (
-                    self.data_formatter.get_formatted_trainer_data()
-                )
-            elif table_name == "trainers_with_real_ids":
-                self._cache[table_name] = (
-                    self.data_formatter.get_formatted_trainer_data_with_real_ids()
-                )
-            elif table_name == "users":
-                self._cache[table_name] = self.data_formatter.get_formatted_user_data()
-            elif table_name == "users_with_real_ids":
-                try:
-                    self._cache[table_name] = (
-                        self.data_formatter.get_formatted_user_data_with_real_ids()
-                    )
-                except Exception:
-                    self._cache[table_name] = self._cache.get("users", [])
-            else:
+        with self._lock:
+            if self._is_cached(table_name):
+                return self._cache[table_name]
+
+            entity = self._ROW_CACHE_ENTITIES.get(table_name)
+            if not entity:
                 self._cache[table_name] = []
+                self._cache_dirty[table_name] = False
+                return self._cache[table_name]
+            epoch = self._cache_epochs.get(entity, 0)
+
+        return self._load_row_caches(entity, epoch)[table_name]
+
+    def _load_row_caches(self, entity: str, epoch: int) -> Dict[str, Sequence[List[Any]]]:
+        """
+        Refetch every row cache of an entity from one formatter pass, run
+        without the lock. The caches are only replaced if the entity did
+        not change since epoch, since the pass may have missed that change
+        """
+        loader = getattr(self.data_formatter, self.ROW_CACHE_LOADERS[entity])
+        loaded = dict(zip(self.ROW_CACHES[entity], loader()))
+
+        with self._lock:
+            if self._cache_epochs.get(entity, 0) == epoch:
+                for table_name, rows in loaded.items():
+                    self._cache[table_name] = rows
+                    self._cache_dirty[table_name] = False
+        return loaded
+
+    def _bump_epoch(self, entity: str):
+        self._cache_epochs[entity] = self._cache_epochs.get(entity, 0) + 1
+
+    def _is_cached(self, table_name: str) -> bool:
+        """True if the table is cached and up to date"""
+        return table_name in self._cache and not self._cache_dirty.get(table_name, True)
+
+    def _is_cached_rows(self, table_name: str, data) -> bool:
+        """True if data are the up to date cached rows of table_name"""
+        return self._is_cached(table_name) and self._cache[table_name] is data
+
+    def _get_index(self, indexes: Dict, table_name: str, data, build: Callable):
+        """
+        Index of data, rows of table_name, from indexes (table_name ->
+        (rows, index)). build() runs without the lock, like table loads, and
+        its index is kept only while data are the cached rows of the table
+        """
+        with self._lock:
+            cached = indexes.get(table_name)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+        index = build()
+        with self._lock:
+            if self._is_cached_rows(table_name, data):
+                indexes[table_name] = (data, index)
+        return index
+
+    @_locked
+    def invalidate_cache(self, table_name: str):
+        """Invalidate cache for specific table"""
+        for name in self.ROW_CACHES.get(table_name, (table_name,)):
+            self._cache_dirty[name] = True
+        if table_name == "users":
+            self._cache_dirty["users_paged"] = True
+        self._bump_epoch(self._ROW_CACHE_ENTITIES.get(table_name, table_name))
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a save or delete in one session with one commit. Cache patches
+        queued with _after_commit run only once the commit succeeded.
+        """
+        patches = []
+        token = _pending_patches.set(patches)
+        try:
+            with unit_of_work():
+                yield
+        finally:
+            _pending_patches.reset(token)
+
+        # Patched together, so no reader sees half of a save
+        with self._lock:
+            for patch, args, kwargs in patches:
+                patch(*args, **kwargs)
+
+    def _after_commit(self, patch: Callable, *args, **kwargs):
+        """Run a cache patch now, or after the commit of the current transaction"""
+        patches = _pending_patches.get()
+        if patches is None:
+            patch(*args, **kwargs)
+        else:
+            patches.append((patch, args, kwargs))
+
+    @_locked
+    def _patch_cached_rows(
+        self, table_name: str, real_id, fetch_record: Optional[Callable] = None
+    ):
+        """
+        Bring the cached rows of one entity up to date without refetching
+        the table. fetch_record() returns the entity's record (a row of the
+        ColumnTable behind its views), or None if it no longer exists;
+        without fetch_record the entity was deleted. Only clean, loaded
+        caches are patched; if the row cannot be located they are
+        invalidated instead.
+        """
+        # Also tells a load already running that it may lack this change
+        self._bump_epoch(table_name)
+
+        cache_names = self.ROW_CACHES[table_name]
+        loaded = [name for name in cache_names if self._is_cached(name)]
+        if not loaded:
+            return
 
-            self._cache_dirty[table_name] = False
+        try:
+            id_cache = cache_names[1]
+            if not self._is_cached(id_cache):
+                raise LookupError(f"No real IDs cached for {table_name}")
+            table = self._cache[id_cache].table
+            if any(self._cache[name].table is not table for name in loaded):
+                raise LookupError(f"Cached views of {table_name} out of step")
+
+            pos = self._get_id_index(id_cache)[1].position(real_id)
+            record = fetch_record() if fetch_record else None
+        except Exception:
+            for name in loaded:
+                self._cache_dirty[name] = True
+            return
+
+        if record is None and pos is None:
+            return  # Neither cached nor stored
+
+        # Copy: the old views may be on screen. Only the chunk holding the
+        # row is copied, when it is written
+        table = table.copy()
+        if record is None:
+            # Sequential IDs are row positions: later rows move up by themselves
+            change = DELETE
+            table.delete(pos)
+        elif pos is None:
+            # IDs are autoincremented, so new rows go last
+            change, pos = APPEND, len(table)
+            table.append(record)
+        else:
+            change = REPLACE
+            table.replace(pos, record)
+
+        old_rows = {name: self._cache[name] for name in loaded}
+        for name in loaded:
+            self._cache[name] = old_rows[name].rebind(table)
+        for name, rows in old_rows.items():
+            self._patch_indexes(name, rows, change, pos)
+
+    def _patch_indexes(self, table_name: str, old_rows, change: str, pos: int):
+        """
+        Carry the indexes of old_rows over to the patched rows of table_name,
+        updated for the one changed row. Indexes that cannot be patched are
+        dropped, to be rebuilt without the lock when next used
+        """
+        rows = self._cache[table_name]
+        self._id_indexes.pop(table_name, None)  # Rebuilt over the ID column
+
+        for indexes, patch in (
+            (self._search_indexes, lambda index: index.patched(
+                change, pos, rows[pos] if change != DELETE else None
+            )),
+            (self._fuzzy_indexes, lambda index: self._patched_fuzzy_index(
+                index, table_name, rows, change, pos
+            )),
+            (self._facet_indexes, lambda index: index.patched(change, pos, rows)),
+            (self._sort_orders, lambda index: index.patched(change, pos, rows.table)),
+        ):
+            cached = indexes.pop(table_name, None)
+            if cached is not None and cached[0] is old_rows:
+                index = patch(cached[1])
+                if index is not None:
+                    indexes[table_name] = (rows, index)
+
+    def _patched_fuzzy_index(self, index, table_name, rows, change, pos):
+        if change == DELETE:
+            return index.patched(change, pos)
+        terms_table = self.SEARCH_TERM_TABLES.get(table_name)
+        if terms_table and not self._is_cached(terms_table):
+            return None  # The terms would be loaded under the lock
+        search_terms = self._search_terms_of(table_name, rows)
+        tokens = self._row_tokens(rows[pos], search_terms[pos] if search_terms else ())
+        return index.patched(change, pos, tokens)
+
+    def _get_id_index(self, table_name: str) -> Tuple[Sequence[List[Any]], IdIndex]:
+        """Rows of a table and their ID index, rebuilt only when the rows change"""
+        data = self._get_cached_data(table_name)
+        index = self._get_index(
+            self._id_indexes, table_name, data,
+            lambda: IdIndex(
+                data,
+                self.ID_INDEX_KEY_COLUMNS.get(table_name, ()),
+                # Ascending integer IDs are binary searched, no per-row keys
+                ids=data.sorted_ids() if isinstance(data, TableView) else None,
+            ),
+        )
+        return data, index
+
+    def _get_admin_row(
+        self, admin_id=None, username: Optional[str] = None
+    ) -> Optional[List[Any]]:
+        """Extended admin row by real ID or username"""
+        rows, index = self._get_id_index("admins_extended")
+        pos = index.position(admin_id) if admin_id is not None else index.find(1, username)
+        return rows[pos] if pos is not None else None
+
+    def _patch_admin_rows(self, admin_id, deleted: bool = False):
+        self._patch_cached_rows(
+            "admins",
+            admin_id,
+            None if deleted else (lambda: self.data_formatter.get_admin_record(admin_id)),
+        )
 
-        return self._cache[table_name]
+    def _patch_trainer_rows(self, trainer_id, deleted: bool = False):
+        self._patch_cached_rows(
+            "trainers",
+            trainer_id,
+            None if deleted else (lambda: self.data_formatter.get_trainer_record(trainer_id)),
+        )
 
-    def invalidate_cache(self, table_name: str):
-        """Invalidate cache for specific table"""
-        self._cache_dirty[table_name] = True
-        if table_name == "admins":
-            self._cache_dirty["admins_extended"] = True
-        elif table_name == "trainers":
-            self._cache_dirty["trainers_with_real_ids"] = True
-        elif table_name == "users":
-            self._cache_dirty["users_with_real_ids"] = True
-
-    def filter_data(self, table_name: str, query: str) -> List[List[Any]]:
-        """Simple filter data functionality"""
+    @_locked
+    def _patch_user_rows(self, user_id, deleted: bool = False, created: bool = False):
+        fetched = []  # the record, read once for both tables
+
+        def fetch_record():
+            if not fetched:
+                fetched.append(self.data_formatter.get_user_record(user_id))
+            return fetched[0]
+
+        self._patch_cached_rows("users", user_id, None if deleted else fetch_record)
+
+        # The paged member table only holds the pages read so far
+        if not self._is_cached("users_paged"):
+            return
+        paged = self._cache["users_paged"]
+        if deleted:
+            paged = paged.without_key(int(user_id))
+        elif created:
+            paged = paged.with_rows_appended()
+        else:
+            index = paged.index_of(int(user_id))
+            if index is None:
+                return
+            record = fetch_record()
+            if record is None:
+                self._cache_dirty["users_paged"] = True
+                return
+            paged = paged.with_row(
+                int(user_id), self.data_formatter.format_user_row(record, index + 1)
+            )
+        self._cache["users_paged"] = paged
+
+    @_locked
+    def _patch_deleted_admin(self, username: str):
+        """Drop a deleted admin's rows and re-read the trainers it managed"""
+        admin_row = None
+        if self._is_cached("admins_extended"):
+            admin_row = self._get_admin_row(username=username)
+        if admin_row:
+            self._patch_admin_rows(admin_row[0], deleted=True)
+        else:
+            self.invalidate_cache("admins")
+        self._patch_admin_trainer_links(username)
+
+    @_locked
+    def _admin_ids_linked_to_trainer(self, trainer_id) -> List[str]:
+        """Real IDs of cached admins associated with a trainer"""
+        if not self._is_cached("admins_extended"):
+            return []
+        rows, index = self._get_id_index("admins_extended")
+        pos = index.find(4, trainer_id)
+        return [rows[pos][0]] if pos is not None else []
+
+    @_locked
+    def _patch_admin_trainer_links(self, admin_username: str, trainer_ids=()):
+        """
+        Re-read the trainers shown as managed by admin_username, the given
+        trainers, and the admins linked to those trainers
+        """
+        trainer_ids = {str(trainer_id) for trainer_id in trainer_ids if trainer_id}
+        if self._is_cached("trainers_with_real_ids"):
+            trainer_ids.update(
+                row[0]
+                for row in self._cache["trainers_with_real_ids"]
+                if row[4] == admin_username
+            )
+        elif self._is_cached("trainers"):
+            # Cannot tell which trainers changed without their real IDs
+            self.invalidate_cache("trainers")
+
+        admin_ids = set()
+        for trainer_id in trainer_ids:
+            admin_ids.update(self._admin_ids_linked_to_trainer(trainer_id))
+            self._patch_trainer_rows(trainer_id)
+        for admin_id in admin_ids:
+            self._patch_admin_rows(admin_id)
+
+    def _get_search_index(self, table_name: str, data=None) -> SearchIndex:
+        """Search index of data (the cached rows by default), built once per rows"""
+        if data is None:
+            data = self._get_cached_data(table_name)
+        return self._get_index(
+            self._search_indexes, table_name, data, lambda: SearchIndex(data)
+        )
+
+    def _get_fuzzy_index(self, table_name: str, data=None) -> FuzzyIndex:
+        """Fuzzy index of data (the cached rows by default), built once per rows"""
+        if data is None:
+            data = self._get_cached_data(table_name)
+        return self._get_index(
+            self._fuzzy_indexes, table_name, data,
+            lambda: self._build_fuzzy_index(table_name, data),
+        )
+
+    def _build_fuzzy_index(self, table_name: str, data) -> FuzzyIndex:
+        search_terms = self._search_terms_of(table_name, data)
+        row_tokens = [
+            self._row_tokens(row, search_terms[pos] if search_terms else ())
+            for pos, row in enumerate(data)
+        ]
+        return FuzzyIndex(row_tokens, self.FUZZY_MAX_DISTANCE)
+
+    def _search_terms_of(self, table_name: str, data) -> Sequence[List[Any]]:
+        """Email/phone rows aligned with data, or [] if there are none"""
+        terms_table = self.SEARCH_TERM_TABLES.get(table_name)
+        if not terms_table:
+            return []
+        search_terms = self._get_cached_data(terms_table)
+        if isinstance(data, TableView) and isinstance(search_terms, TableView):
+            # The same entity's rows: read the terms from data's own table
+            return search_terms.rebind(data.table)
+        # Otherwise only usable while aligned with the table rows
+        return search_terms if len(search_terms) == len(data) else []
+
+    @staticmethod
+    def _row_tokens(row, search_terms=()) -> List[str]:
+        """Fuzzy search tokens of a row and its email/phone terms"""
+        tokens = []
+        for cell in row[1:]:  # Skip the ID column
+            tokens.extend(tokenize(cell))
+        for term in search_terms:
+            tokens.extend(tokenize(term))
+        return tokens
+
+    def fuzzy_search(
+        self,
+        table_name: str,
+        query: str,
+        max_distance: int = FUZZY_MAX_DISTANCE,
+        limit: Optional[int] = None,
+    ) -> Sequence[List[Any]]:
+        """Rows matching every query word within max_distance typos, best first"""
         data = self._get_cached_data(table_name)
         if not query.strip():
             return data
 
-        query_lower = query.lower()
-        return [
-            row for row in data if any(query_lower in str(cell).lower() for cell in row)
-        ]
+        positions = self._get_fuzzy_index(table_name, data).search(
+            query, max_distance=max_distance, limit=limit
+        )
+        return self._select_rows(data, positions)
+
+    def filter_data(
+        self,
+        table_name: str,
+        query: str,
+        fuzzy: bool = False,
+        max_distance: int = FUZZY_MAX_DISTANCE,
+    ) -> Sequence[List[Any]]:
+        """
+        Return the rows where any cell contains the query (case-insensitive).
+        With fuzzy=True, rows matching the query within max_distance typos
+        are appended after the exact matches, ranked by closeness.
+        """
+        data = self._get_cached_data(table_name)
+        if not query.strip():
+            return data
+
+        positions = self._search_positions(table_name, data, query, fuzzy, max_distance)
+        return self._select_rows(data, positions)
+
+    def _search_positions(
+        self, table_name: str, data, query: str, fuzzy: bool, max_distance: int
+    ) -> List[int]:
+        """Positions in data of the rows filter_data returns for a non-empty query"""
+        positions = self._get_search_index(table_name, data).search(query)
+
+        if fuzzy and max_distance > 0:
+            exact_positions = set(positions)
+            positions = positions + [
+                pos
+                for pos in self._get_fuzzy_index(table_name, data).search(
+                    query, max_distance=max_distance
+                )
+                if pos not in exact_positions
+            ]
+
+        return positions
+
+    def _get_facet_index(self, table_name: str, data) -> FacetIndex:
+        """Facet index of data, the cached rows of a table, built once per rows"""
+        return self._get_index(
+            self._facet_indexes, table_name, data,
+            lambda: FacetIndex(data, self.FACET_COLUMNS[table_name]),
+        )
+
+    def facet_data(
+        self,
+        table_name: str,
+        selection: Optional[Dict[int, Sequence[str]]] = None,
+        query: str = "",
+        fuzzy: bool = False,
+        max_distance: int = FUZZY_MAX_DISTANCE,
+    ) -> Tuple[Sequence[List[Any]], Dict[int, Dict[str, int]]]:
+        """
+        Rows of filter_data(table_name, query, ...) that show one of the
+        selected values in every column of selection ({column: values}; no
+        values means any), and the facet counts: for each facet column of
+        FACET_COLUMNS, the rows each of its values would match given the
+        query and the other columns of selection.
+        """
+        selection = selection or {}
+        data = self._get_cached_data(table_name)
+        if table_name not in self.FACET_COLUMNS or not isinstance(data, TableView):
+            return self.filter_data(table_name, query, fuzzy, max_distance), {}
+
+        index = self._get_facet_index(table_name, data)
+        if query.strip():
+            text_positions = self._search_positions(
+                table_name, data, query, fuzzy, max_distance
+            )
+            text_mask = index.mask_of(text_positions)
+        else:
+            text_positions = text_mask = None
+
+        mask = index.mask(selection, text_mask)
+        if text_positions is None:
+            positions = index.positions(mask)
+        else:
+            # Keep the ranking of the text search
+            positions = index.keep(text_positions, mask)
+        return data.select(positions), index.counts(selection, text_mask)
+
+    def _get_sort_order(self, table_name: str, data) -> SortOrder:
+        """Sort orders of data, the cached rows of a table, kept while they are cached"""
+        return self._get_index(
+            self._sort_orders, table_name, data,
+            lambda: SortOrder(data.table, self.SORT_COLUMNS[table_name]),
+        )
+
+    def sort_data(
+        self,
+        table_name: str,
+        sort_spec: Sequence[tuple],
+        rows: Optional[Sequence[List[Any]]] = None,
+    ) -> Sequence[List[Any]]:
+        """
+        Rows of a table sorted by sort_spec, (column, descending) pairs with
+        the most significant column first. Sorting is stable. rows are the
+        rows to sort (e.g. search results of filter_data); all of the
+        table's rows by default. Rows that cannot be sorted are returned as given
+        """
+        data = self._get_cached_data(table_name)
+        if table_name not in self.SORT_COLUMNS or not isinstance(data, TableView):
+            return data if rows is None else rows
+
+        if rows is None:
+            return data.select(self._get_sort_order(table_name, data).order(sort_spec))
+        if not isinstance(rows, TableView):
+            return rows
+        if rows.table is data.table:
+            sort_order = self._get_sort_order(table_name, data)
+        else:
+            # Results of older rows: sort them by their own table
+            sort_order = SortOrder(rows.table, self.SORT_COLUMNS[table_name])
+        return rows.rebind(rows.table).select(
+            sort_order.sort(rows.positions(), sort_spec)
+        )
+
+    @staticmethod
+    def _select_rows(data, positions: List[int]):
+        """Rows at positions, as a lazy view when data is one"""
+        if isinstance(data, TableView):
+            return data.select(positions)
+        return [data[pos] for pos in positions]
 
     # Basic data getters
     def get_admin_data(self):
@@ -102,18 +649,203 @@ class DashboardController:
     def get_user_data(self):
         return self._get_cached_data("users")
 
+    def get_trainer_row_by_real_id(self, trainer_id) -> Optional[List[Any]]:
+        """Trainer row (with its real ID) for a trainer's database ID"""
+        rows, index = self._get_id_index("trainers_with_real_ids")
+        pos = index.position(trainer_id)
+        return rows[pos] if pos is not None else None
+
+    def get_row(self, table_name: str, sequential_id) -> Optional[List[Any]]:
+        """Row shown with sequential_id in the 'admins', 'trainers' or 'users' table"""
+        try:
+            index = int(sequential_id) - 1
+        except (TypeError, ValueError):
+            return None
+        rows = self.get_paged_user_data() if table_name == "users" else (
+            self._get_cached_data(table_name)
+        )
+        return rows[index] if 0 <= index < len(rows) else None
+
+    def get_paged_user_data(self) -> PagedRows:
+        """Member rows fetched one page at a time, as the table displays them"""
+        with self._lock:
+            if self._is_cached("users_paged"):
+                return self._cache["users_paged"]
+            epoch = self._cache_epochs.get("users", 0)
+
+        # Counted without the lock, like the other table loads
+        paged = PagedRows(
+            count_users(),
+            self.data_formatter.get_formatted_user_page,
+            seek_key=get_user_id_at,
+            page_size=self.USER_PAGE_SIZE,
+        )
+        with self._lock:
+            if self._cache_epochs.get("users", 0) == epoch:
+                self._cache["users_paged"] = paged
+                self._cache_dirty["users_paged"] = False
+        return paged
+
+    # Background variants: the work runs on the executor and callback
+    # receives the result on the Tk thread
+    def load_table_async(
+        self, table_name: str, callback: Callable, error_callback: Callable = None
+    ) -> Future:
+        """Load the rows of the 'admins', 'trainers' or 'users' table"""
+        return self.executor.submit(
+            self._load_table, table_name,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def filter_data_async(
+        self,
+        table_name: str,
+        query: str,
+        fuzzy: bool = False,
+        callback: Callable = None,
+        error_callback: Callable = None,
+    ) -> Future:
+        """filter_data in the background: the first search of a table loads all its rows"""
+        return self.executor.submit(
+            self.filter_data, table_name, query, fuzzy,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def sort_data_async(
+        self,
+        table_name: str,
+        sort_spec: Sequence[tuple],
+        rows: Optional[Sequence[List[Any]]] = None,
+        callback: Callable = None,
+        error_callback: Callable = None,
+    ) -> Future:
+        """sort_data in the background: the first sort of a table loads all its rows"""
+        return self.executor.submit(
+            self.sort_data, table_name, sort_spec, rows,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def facet_data_async(
+        self,
+        table_name: str,
+        selection: Optional[Dict[int, Sequence[str]]] = None,
+        query: str = "",
+        fuzzy: bool = False,
+        callback: Callable = None,
+        error_callback: Callable = None,
+    ) -> Future:
+        """facet_data in the background: the first call for a table loads all its rows"""
+        return self.executor.submit(
+            self.facet_data, table_name, selection, query, fuzzy,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def get_row_async(
+        self, table_name: str, sequential_id, callback: Callable,
+        error_callback: Callable = None,
+    ) -> Future:
+        """get_row in the background: its table or page may have to be read"""
+        return self.executor.submit(
+            self.get_row, table_name, sequential_id,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def get_admin_form_data_async(
+        self, sequential_id, current_admin, callback: Callable,
+        error_callback: Callable = None,
+    ) -> Future:
+        return self.executor.submit(
+            self.get_admin_form_data, sequential_id, current_admin,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def get_trainer_form_data_async(
+        self, sequential_id, callback: Callable, error_callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.get_trainer_form_data, sequential_id,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def get_available_trainers_for_form_async(
+        self, callback: Callable, error_callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.get_available_trainers_for_form,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def get_admin_data_unified_async(
+        self, admin_id: str, from_cache: bool = True, callback: Callable = None,
+        error_callback: Callable = None,
+    ) -> Future:
+        return self.executor.submit(
+            self.get_admin_data_unified, admin_id, from_cache,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def refresh_admin_profile_async(
+        self, admin_id: str, callback: Callable, error_callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.refresh_admin_profile, admin_id,
+            callback=callback, error_callback=error_callback,
+        )
+
+    def _load_table(self, table_name: str):
+        if table_name == "users":
+            rows = self.get_paged_user_data()
+            if len(rows):
+                # Fetch the first page here rather than on the Tk thread
+                rows.key_at(0)
+            return rows
+        return self._get_cached_data(table_name)
+
+    def save_admin_data_async(
+        self, admin_data: Dict[str, Any], admin_form_or_id=None, callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.save_admin_data, admin_data, admin_form_or_id,
+            callback=callback, error_callback=self._error_result(callback),
+        )
+
+    def save_trainer_data_async(
+        self, trainer_data: Dict[str, Any], form_or_id=None, callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.save_trainer_data, trainer_data, form_or_id,
+            callback=callback, error_callback=self._error_result(callback),
+        )
+
+    def save_user_data_async(
+        self, user_data: Dict[str, Any], form_or_id=None, callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.save_user_data, user_data, form_or_id,
+            callback=callback, error_callback=self._error_result(callback),
+        )
+
+    def delete_entity_async(
+        self, current_admin, entity_type: str, entity_id: str, callback: Callable = None
+    ) -> Future:
+        return self.executor.submit(
+            self.delete_entity, current_admin, entity_type, entity_id,
+            callback=callback, error_callback=self._error_result(callback),
+        )
+
+    def _error_result(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """Report an unexpected exception to callback as a failed result dict"""
+        if callback is None:
+            return None
+        return lambda error: callback({"success": False, "message": str(error)})
+
     def get_admin_username_from_sequential_id(
         self, sequential_id: str
     ) -> Optional[str]:
         """Get admin username from sequential ID"""
-        try:
-            admin_data = self._get_cached_data("admins")
-            idx = int(sequential_id)
-            if 1 <= idx <= len(admin_data):
-                return admin_data[idx - 1][1]  # Username is in column 1
-            return None
-        except (ValueError, IndexError):
-            return None
+        rows, index = self._get_id_index("admins_extended")
+        pos = index.position(index.real_id(sequential_id))
+        return rows[pos][1] if pos is not None else None  # Username is in column 1
 
     def get_default_section(self, current_admin):
         """Determine default section based on user type"""
@@ -139,13 +871,46 @@ class DashboardController:
             return False
 
         # Get admin data from cache
-        admin_data = self._get_cached_data("admins_extended")
-        for row in admin_data:
-            if str(row[0]) == str(admin_id):
-                role = row[2].lower() if len(row) > 2 else "admin"
-                return role == "admin"
+        row = self._get_admin_row(admin_id)
+        if row is None:
+            return False
+        role = row[2].lower() if len(row) > 2 else "admin"
+        return role == "admin"
+
+    def get_admin_form_data(self, sequential_id, current_admin) -> Dict[str, Any]:
+        """
+        What the admin form shows: the edited admin as get_admin_data_unified
+        returns it (None when adding one), the name of its trainer, and
+        whether current_admin may create administrators
+        """
+        admin = trainer_name = None
+        if sequential_id:
+            admin = self.get_admin_data_unified(
+                str(sequential_id), from_cache=True, by_sequential_id=True
+            )
+            if admin and admin.get("trainer_id"):
+                trainer = self.get_trainer_row_by_real_id(admin["trainer_id"])
+                trainer_name = trainer[1] if trainer else None  # Name is second column
 
-        return False
+        return {
+            "admin": admin,
+            "trainer_name": trainer_name,
+            "can_create_admins": self.can_create_admin_accounts(current_admin),
+        }
+
+    def get_trainer_form_data(self, sequential_id) -> Dict[str, Any]:
+        """
+        What the trainer form shows: the usernames of the managers a trainer
+        can be assigned to, and the edited trainer row (None when adding one)
+        """
+        # admin rows: [ID, username, role, created_at]
+        managers = [
+            row[1]
+            for row in self.get_admin_data()
+            if len(row) > 2 and str(row[2]).lower() == "manager"
+        ]
+        trainer = self.get_row("trainers", sequential_id) if sequential_id else None
+        return {"managers": managers, "trainer": trainer}
 
     def _prevent_duplicate_operation(self, operation_key: str) -> bool:
         """Prevent duplicate operations within 1 second"""
@@ -216,12 +981,14 @@ class DashboardController:
                 entity_type, form_or_id
             )
 
-            if entity_id_to_update:
-                return self._update_entity(
-                    entity_type, entity_data, entity_id_to_update
-                )
-            else:
-                return self._create_entity(entity_type, entity_data)
+            # All the reads and writes of the save share one commit
+            with self._transaction():
+                if entity_id_to_update:
+                    return self._update_entity(
+                        entity_type, entity_data, entity_id_to_update
+                    )
+                else:
+                    return self._create_entity(entity_type, entity_data)
 
         except Exception as e:
             return self._handle_database_error(e, identifier)
@@ -258,14 +1025,7 @@ class DashboardController:
             if entity_to_edit:
                 if entity_type == "admin":
                     # Convert sequential ID to real ID for admin
-                    username_from_seq = self.get_admin_username_from_sequential_id(
-                        entity_to_edit
-                    )
-                    if username_from_seq:
-                        admin_data_list = self._get_cached_data("admins_extended")
-                        for row in admin_data_list:
-                            if row[1] == username_from_seq:
-                                return str(row[0])
+                    return self._get_id_index("admins_extended")[1].real_id(entity_to_edit)
                 elif entity_type == "trainer":
                     return self._get_real_trainer_id(str(entity_to_edit))
                 elif entity_type == "user":
@@ -307,34 +1067,29 @@ class DashboardController:
         if not existing_admin:
             return {"success": False, "message": "Admin not found"}
 
+        # Trainers shown with the previous username or linked before need re-reading
+        previous_username = existing_admin.username
+        affected_trainer_ids = [existing_admin.trainer_id]
+
         if admin_data.get("username"):
             existing_admin.username = admin_data["username"].strip()
         if admin_data.get("password"):
-            existing_admin.set_password(admin_data["password"])
+            # Hashed in the service's bounded slots, like logins
+            existing_admin.set_password_hash(auth_service.hash_password(admin_data["password"]))
         if admin_data.get("role"):
             existing_admin.role = admin_data["role"]
 
-        # Handle trainer association for managers
-        if admin_data.get("role") == "manager":
-            trainer_id = admin_data.get("trainer_id")
-            username_to_clear = getattr(existing_admin, "username", None)
-            if username_to_clear:
-                self._clear_trainer_admin_association(str(username_to_clear))
-
-            if trainer_id:
-                real_trainer_id = self._get_real_trainer_id(trainer_id)
-                trainer = get_trainer(real_trainer_id)
-                if trainer:
-                    setattr(trainer, "admin_username", existing_admin.username)
-                    update_trainer(trainer)
-        else:
-            username_to_clear = getattr(existing_admin, "username", None)
-            if username_to_clear:
-                self._clear_trainer_admin_association(str(username_to_clear))
+        # Handle trainer association: managers keep only the selected trainer
+        real_trainer_id = None
+        if admin_data.get("role") == "manager" and admin_data.get("trainer_id"):
+            real_trainer_id = self._get_real_available_trainer_id(admin_data["trainer_id"])
+            affected_trainer_ids.append(real_trainer_id)
 
         update_admin(existing_admin)
-        self.invalidate_cache("admins")
-        self.invalidate_cache("trainers")
+        # One UPDATE unlinks the trainers of either username and links the new one
+        reassign_admin_trainers(existing_admin.username, real_trainer_id, previous_username)
+        self._after_commit(self._patch_admin_trainer_links, previous_username, affected_trainer_ids)
+        self._after_commit(self._patch_admin_rows, admin_id)
 
         return {
             "success": True,
@@ -348,7 +1103,7 @@ class DashboardController:
 
         admin = Admin(
             username=admin_data.get("username"),
-            password=admin_data.get("password"),
+            password_hash=auth_service.hash_password(admin_data["password"]),
             role=admin_data.get("role", "admin"),
         )
 
@@ -356,14 +1111,12 @@ class DashboardController:
 
         # Handle trainer association for managers
         if admin_data.get("role") == "manager" and admin_data.get("trainer_id"):
-            real_trainer_id = self._get_real_trainer_id(admin_data["trainer_id"])
-            trainer = get_trainer(real_trainer_id)
-            if trainer:
-                setattr(trainer, "admin_username", admin.username)
-                update_trainer(trainer)
+            real_trainer_id = self._get_real_available_trainer_id(admin_data["trainer_id"])
+            if real_trainer_id:
+                reassign_admin_trainers(admin.username, real_trainer_id)
+                self._after_commit(self._patch_admin_trainer_links, admin.username, [real_trainer_id])
 
-        self.invalidate_cache("admins")
-        self.invalidate_cache("trainers")
+        self._after_commit(self._patch_admin_rows, admin.unique_id)
 
         return {
             "success": True,
@@ -401,7 +1154,7 @@ class DashboardController:
                     setattr(trainer, key, val)
 
         update_trainer(trainer)
-        self.invalidate_cache("trainers")
+        self._after_commit(self._patch_trainer_rows, trainer_id)
 
         return {
             "success": True,
@@ -441,7 +1194,8 @@ class DashboardController:
             setattr(trainer, "created_at", datetime.now().strftime("%Y-%m-%d %H:00"))
 
         create_trainer(trainer)
-        self.invalidate_cache("trainers")
+        if getattr(trainer, "unique_id", None):
+            self._after_commit(self._patch_trainer_rows, trainer.unique_id)
 
         return {
             "success": True,
@@ -476,7 +1230,7 @@ class DashboardController:
                     setattr(user, key, val)
 
         update_user(user)
-        self.invalidate_cache("users")
+        self._after_commit(self._patch_user_rows, user_id)
 
         return {
             "success": True,
@@ -517,7 +1271,8 @@ class DashboardController:
             setattr(user, "created_at", datetime.now().strftime("%Y-%m-%d %H:00"))
 
         create_user(user)
-        self.invalidate_cache("users")
+        if getattr(user, "unique_id", None):
+            self._after_commit(self._patch_user_rows, user.unique_id, created=True)
 
         return {
             "success": True,
@@ -525,24 +1280,12 @@ class DashboardController:
         }
 
     def get_available_trainers_for_form(self) -> List[List[Any]]:
-        """Get trainers available for manager association"""
+        """
+        Get trainers available for manager association. Their sequential IDs
+        number this list only; resolve them with _get_real_available_trainer_id
+        """
         try:
-            trainers_with_real_ids = self._get_cached_data("trainers_with_real_ids")
-            extended_admin_data = self._get_cached_data("admins_extended")
-
-            # Get associated trainer IDs
-            associated_trainer_ids = {
-                str(admin_row[4])
-                for admin_row in extended_admin_data
-                if len(admin_row) >= 5 and admin_row[4] is not None
-            }
-
-            # Filter available trainers
-            available_trainers = [
-                trainer_row
-                for trainer_row in trainers_with_real_ids
-                if str(trainer_row[0]) not in associated_trainer_ids
-            ]
+            available_trainers = self._get_available_trainers()[0]
 
             # Return with sequential IDs (4 columns for form)
             return [
@@ -553,48 +1296,58 @@ class DashboardController:
         except Exception:
             return self._get_cached_data("trainers")[:4]  # Fallback
 
-    def _get_real_trainer_id(self, sequential_or_real_id: str) -> Optional[str]:
+    def _get_available_trainers(self):
+        """
+        Trainer rows (real IDs) not associated with any admin, and their ID
+        index. Rebuilt only when the trainer or admin rows change
+        """
+        trainers_with_real_ids = self._get_cached_data("trainers_with_real_ids")
+        admin_rows, admin_index = self._get_id_index("admins_extended")
+        sources = (trainers_with_real_ids, admin_rows)
+
+        with self._lock:
+            cached = self._available_trainers
+        if cached is not None and all(map(operator.is_, cached[0], sources)):
+            return cached[1]
+
+        available = [
+            trainer_row
+            for trainer_row in trainers_with_real_ids
+            if admin_index.find(4, trainer_row[0]) is None
+        ]
+        result = (available, IdIndex(available))
+        with self._lock:
+            if self._is_cached_rows("trainers_with_real_ids", sources[0]) and (
+                self._is_cached_rows("admins_extended", sources[1])
+            ):
+                self._available_trainers = (sources, result)
+        return result
+
+    def _get_real_available_trainer_id(self, sequential_id: str) -> Optional[str]:
+        """Convert a sequential ID of get_available_trainers_for_form to the real DB ID"""
+        return self._get_available_trainers()[1].real_id(sequential_id)
+
+    def _get_real_trainer_id(self, sequential_id: str) -> Optional[str]:
         """Convert sequential trainer ID to real DB ID"""
-        try:
-            seq_id = int(sequential_or_real_id)
-            if 1 <= seq_id <= 1000:  # Sequential ID range
-                trainers = self._get_cached_data("trainers_with_real_ids")
-                if 1 <= seq_id <= len(trainers):
-                    return str(trainers[seq_id - 1][0])
-                return None
-            else:
-                return str(sequential_or_real_id)  # Already real ID
-        except (ValueError, IndexError):
-            return str(sequential_or_real_id) if sequential_or_real_id else None
+        return self._get_id_index("trainers_with_real_ids")[1].real_id(sequential_id)
 
-    def _get_real_user_id(self, sequential_or_real_id: str) -> Optional[str]:
+    def _get_real_user_id(self, sequential_id: str) -> Optional[str]:
         """Convert sequential user ID to real DB ID"""
-        try:
-            seq_id = int(sequential_or_real_id)
-            if 1 <= seq_id <= 100000:  # Sequential ID range
-                users = self._get_cached_data("users_with_real_ids")
-                if 1 <= seq_id <= len(users):
-                    return str(users[seq_id - 1][0])
+        with self._lock:
+            paged = self._cache["users_paged"] if self._is_cached("users_paged") else None
+
+        # Prefer the paged rows: only the page holding the ID is read
+        if paged is not None:
+            try:
+                seq_id = int(sequential_id)
+            except (TypeError, ValueError):
                 return None
-            else:
-                return str(sequential_or_real_id)  # Already real ID
-        except (ValueError, IndexError):
-            return str(sequential_or_real_id) if sequential_or_real_id else None
+            if 1 <= seq_id <= len(paged):
+                real_id = paged.key_at(seq_id - 1)
+                return str(real_id) if real_id is not None else None
+            return None
 
-    def _clear_trainer_admin_association(self, admin_username: str):
-        """Clear trainer associations for admin"""
-        if not admin_username or not isinstance(admin_username, str):
-            return  # Skip if username is None or not a string
-
-        try:
-            all_trainers = get_all_trainers()
-            for trainer in all_trainers:
-                current_admin_username = getattr(trainer, "admin_username", None)
-                if current_admin_username and current_admin_username == admin_username:
-                    setattr(trainer, "admin_username", None)
-                    update_trainer(trainer)
-        except Exception as e:
-            print(f"Error clearing trainer associations: {e}")
+        return self._get_id_index("users_with_real_ids")[1].real_id(sequential_id)
 
     def delete_entity(
         self, current_admin, entity_type: str, entity_id: str
@@ -627,12 +1380,8 @@ class DashboardController:
                 current_is_admin = self.can_create_admin_accounts(current_admin)
                 if not current_is_admin:
                     # Check target role
-                    admin_data = self._get_cached_data("admins_extended")
-                    target_role = None
-                    for row in admin_data:
-                        if row[1] == entity_identifier:
-                            target_role = row[2].lower()
-                            break
+                    target_row = self._get_admin_row(username=entity_identifier)
+                    target_role = target_row[2].lower() if target_row else None
 
                     if target_role == "admin":
                         return {
@@ -659,9 +1408,15 @@ class DashboardController:
                 }
 
             if success:
-                self.invalidate_cache(entity_type + "s")
-                if entity_type == "admin":
-                    self.invalidate_cache("trainers")
+                with self._lock:
+                    if entity_type == "admin":
+                        self._patch_deleted_admin(entity_identifier)
+                    elif entity_type == "trainer":
+                        self._patch_trainer_rows(real_trainer_id, deleted=True)
+                        for admin_id in self._admin_ids_linked_to_trainer(real_trainer_id):
+                            self._patch_admin_rows(admin_id)
+                    else:
+                        self._patch_user_rows(real_user_id, deleted=True)
 
                 return {
                     "success": True,
@@ -690,45 +1445,32 @@ class DashboardController:
     ) -> Optional[Dict[str, Any]]:
         """Get admin data by ID"""
         try:
-            if by_sequential_id:
-                username = self.get_admin_username_from_sequential_id(admin_id)
-                if not username:
-                    return None
-                admin_data = self._get_cached_data("admins_extended")
-                for row in admin_data:
-                    if row[1] == username:
-                        return {
-                            "id": row[0],
-                            "username": row[1],
-                            "role": row[2].lower(),
-                            "created_at": row[3],
-                            "unique_id": row[0],
-                            "trainer_id": row[4] if len(row) > 4 else None,
-                        }
+            if by_sequential_id or from_cache:
+                if by_sequential_id:
+                    admin_id = self._get_id_index("admins_extended")[1].real_id(admin_id)
+                    if admin_id is None:
+                        return None
+                row = self._get_admin_row(admin_id)
+                if row:
+                    return {
+                        "id": row[0],
+                        "username": row[1],
+                        "role": row[2].lower(),
+                        "created_at": row[3],
+                        "unique_id": row[0],
+                        "trainer_id": row[4] if len(row) > 4 else None,
+                    }
             else:
-                if from_cache:
-                    admin_data = self._get_cached_data("admins_extended")
-                    for row in admin_data:
-                        if str(row[0]) == str(admin_id):
-                            return {
-                                "id": row[0],
-                                "username": row[1],
-                                "role": row[2].lower(),
-                                "created_at": row[3],
-                                "unique_id": row[0],
-                                "trainer_id": row[4] if len(row) > 4 else None,
-                            }
-                else:
-                    admin = get_admin(admin_id)
-                    if admin:
-                        return {
-                            "id": admin.unique_id,
-                            "username": admin.username,
-                            "role": admin.role.lower() if admin.role else "admin",
-                            "created_at": admin.created_at,
-                            "unique_id": admin.unique_id,
-                            "trainer_id": getattr(admin, "trainer_id", None),
-                        }
+                admin = get_admin(admin_id)
+                if admin:
+                    return {
+                        "id": admin.unique_id,
+                        "username": admin.username,
+                        "role": admin.role.lower() if admin.role else "admin",
+                        "created_at": admin.created_at,
+                        "unique_id": admin.unique_id,
+                        "trainer_id": getattr(admin, "trainer_id", None),
+                    }
             return None
         except Exception:
             return None
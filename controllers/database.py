@@ -1,10 +1,166 @@
-from sqlalchemy import create_engine
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
-from models.models import Base
+from migrations import migrate
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./fitzone.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Overridable so benchmarks and tools can point at another database
+SQLALCHEMY_DATABASE_URL = os.getenv("FITZONE_DATABASE_URL", "sqlite:///./fitzone.db")
 
-Base.metadata.create_all(bind=engine)
+# SQLite connection profiles, applied as PRAGMAs on every new connection.
+# "default" keeps SQLite's own settings (rollback journal, synchronous=FULL)
+SQLITE_PROFILES = {
+    "tuned": {
+        "journal_mode": "WAL",  # Readers do not block the writer
+        "synchronous": "NORMAL",  # No fsync per commit; safe with WAL
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # Negative values are KiB: 64 MiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms to wait for a lock before failing
+    },
+    "default": {},
+}
+
+SQLITE_PROFILE = os.getenv("FITZONE_SQLITE_PROFILE", "tuned")
+
+
+def sqlite_settings(profile=SQLITE_PROFILE):
+    """
+    PRAGMA values for a profile. Each one can be overridden with a
+    FITZONE_SQLITE_<PRAGMA> environment variable, e.g. FITZONE_SQLITE_MMAP_SIZE=0
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile: '{profile}'")
+
+    settings = dict(SQLITE_PROFILES[profile])
+    for pragma in SQLITE_PROFILES["tuned"]:
+        value = os.getenv(f"FITZONE_SQLITE_{pragma.upper()}")
+        if value is not None:
+            settings[pragma] = value
+    return settings
+
+
+def apply_sqlite_pragmas(dbapi_connection, settings):
+    """Run the PRAGMA statements of settings on a raw sqlite3 connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in settings.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url=SQLALCHEMY_DATABASE_URL, settings=None):
+    """
+    Create an engine for url. SQLite engines get the PRAGMAs of the
+    configured profile (or settings, if given) on every connection, and
+    explicit transactions so that SAVEPOINTs work.
+    """
+    engine = create_engine(url)
+
+    if engine.dialect.name == "sqlite":
+        pragmas = sqlite_settings() if settings is None else settings
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            apply_sqlite_pragmas(dbapi_connection, pragmas)
+            # Let SQLAlchemy emit BEGIN itself: pysqlite only begins before
+            # DML, which breaks SAVEPOINTs issued before any write
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin_sqlite_transaction(connection):
+            connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class UnitOfWorkFailed(SQLAlchemyError):
+    """A crud call inside a unit of work failed, so the unit was rolled back"""
+
+
+class _UnitOfWork:
+    """State of one unit_of_work block"""
+
+    def __init__(self, session):
+        self.session = session
+        self.error = None  # First error reported by a crud call
+
+
+class _SharedSession:
+    """
+    The unit of work's session as seen by one crud call. commit() only
+    flushes and close() leaves the session open: the unit of work commits
+    once on exit. rollback() marks the unit of work as failed.
+    """
+
+    def __init__(self, unit):
+        self._unit = unit
+
+    def __getattr__(self, name):
+        return getattr(self._unit.session, name)
+
+    def commit(self):
+        self._unit.session.flush()
+
+    def rollback(self):
+        # crud functions roll back from their except block
+        if self._unit.error is None:
+            self._unit.error = sys.exc_info()[1] or SQLAlchemyError("rolled back")
+
+    def close(self):
+        pass
+
+
+_current_unit = ContextVar("fitzone_unit_of_work", default=None)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Run the crud calls inside the block in one session and one transaction,
+    committed once on exit. An exception or a failed crud call rolls it back
+    (the latter raises UnitOfWorkFailed). A nested block runs in a SAVEPOINT,
+    so its failure only undoes its own changes.
+    """
+    outer = _current_unit.get()
+    if outer is None:
+        session = SessionLocal()
+        transaction = session
+    else:
+        session = outer.session
+        transaction = session.begin_nested()
+
+    unit = _UnitOfWork(session)
+    token = _current_unit.set(unit)
+    try:
+        yield session
+        if unit.error is not None:
+            raise UnitOfWorkFailed(str(unit.error)) from unit.error
+        transaction.commit()
+    except BaseException:
+        transaction.rollback()
+        raise
+    finally:
+        _current_unit.reset(token)
+        if outer is None:
+            session.close()
+
+
+def get_session():
+    """Session for one crud call: the current unit of work's, or a new one"""
+    unit = _current_unit.get()
+    return SessionLocal() if unit is None else _SharedSession(unit)
+
+
+def init_db():
+    """Create or upgrade the database schema. Call once at startup"""
+    return migrate(engine)
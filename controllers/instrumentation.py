@@ -0,0 +1,253 @@
+"""
+Opt-in timing instrumentation: where does the time go, SQL, conversion,
+formatting or Tk?
+
+Disabled by default. While disabled, instrumented functions only check a
+flag before calling through, and no engine events are attached. Enable it
+with enable() or by setting FITZONE_INSTRUMENTATION=1 (read by app.py and
+cli.py); every span and SQL statement then lands in a per-operation
+histogram, readable with snapshot(), format_report() or log_report().
+SQL time is cursor execution time; fetching and ORM hydration count
+towards the enclosing span only.
+"""
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+ENABLED_BY_ENV = os.getenv("FITZONE_INSTRUMENTATION", "").lower() in ("1", "true", "yes")
+
+_enabled = False
+_bind = None
+_lock = threading.Lock()
+_histograms = {}  # operation name -> Histogram
+_local = threading.local()  # .spans: stack of [name, sql seconds, statements]
+
+
+class Histogram:
+    """
+    Durations of one operation in power-of-two microsecond buckets:
+    bucket n holds durations below 2**n microseconds.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.sql_time = 0.0
+        self.statements = 0
+        self.buckets = {}
+
+    def add(self, seconds, sql_time=0.0, statements=0):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.sql_time += sql_time
+        self.statements += statements
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """Estimated duration, in seconds, under which the given fraction of calls finished"""
+        threshold = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            in_bucket = self.buckets[bucket]
+            if seen + in_bucket >= threshold:
+                # Interpolate linearly inside the bucket's [2**(n-1), 2**n) range
+                lower = 2 ** (bucket - 1) if bucket else 0
+                estimate = lower + (2 ** bucket - lower) * (threshold - seen) / in_bucket
+                return min(self.max, estimate / 1_000_000)
+            seen += in_bucket
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_s": self.total / self.count if self.count else 0.0,
+            "p50_s": self.percentile(0.5),
+            "p95_s": self.percentile(0.95),
+            "max_s": self.max,
+            "sql_s": self.sql_time,
+            "statements": self.statements,
+            "buckets_us": {2 ** bucket: count for bucket, count in sorted(self.buckets.items())},
+        }
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable(bind=None):
+    """Start recording spans, and SQL statements executed on bind (the app engine by default)"""
+    global _enabled, _bind
+    if _enabled:
+        return
+    if bind is None:
+        from controllers.database import engine as bind
+
+    from sqlalchemy import event
+
+    event.listen(bind, "before_cursor_execute", _before_execute)
+    event.listen(bind, "after_cursor_execute", _after_execute)
+    _bind = bind
+    _enabled = True
+
+
+def disable():
+    """Stop recording; collected histograms are kept until reset()"""
+    global _enabled, _bind
+    if not _enabled:
+        return
+
+    from sqlalchemy import event
+
+    event.remove(_bind, "before_cursor_execute", _before_execute)
+    event.remove(_bind, "after_cursor_execute", _after_execute)
+    _bind = None
+    _enabled = False
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def record(name, seconds, sql_time=0.0, statements=0):
+    """Add one measurement of an operation"""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(seconds, sql_time, statements)
+
+
+def span(name):
+    """Time the wrapped block as one call of operation name (no-op while disabled)"""
+    if not _enabled:
+        return nullcontext()
+    return _span(name)
+
+
+@contextmanager
+def _span(name):
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        spans = _local.spans = []
+
+    frame = [name, 0.0, 0]
+    spans.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        spans.pop()
+        record(name, elapsed, frame[1], frame[2])
+
+
+def instrumented(name):
+    """Decorator timing every call of a function as operation name"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _span(name):
+                return func(*args, **kwargs)
+
+        wrapper.__wrapped_operation__ = name
+        return wrapper
+
+    return decorate
+
+
+def instrument_functions(namespace, prefix):
+    """
+    Wrap the public functions defined in a module, given its globals().
+    Call at the end of the module, so importers get the wrapped functions.
+    """
+    module_name = namespace["__name__"]
+    for attribute, value in list(namespace.items()):
+        if (
+            inspect.isfunction(value)
+            and value.__module__ == module_name
+            and not attribute.startswith("_")
+            and not inspect.isgeneratorfunction(value)
+        ):
+            namespace[attribute] = instrumented(f"{prefix}.{attribute}")(value)
+
+
+def instrument_methods(prefix, exclude=()):
+    """
+    Class decorator wrapping the public methods of a class, except those
+    named in exclude (e.g. per-row helpers, whose spans would outweigh them)
+    """
+    def decorate(cls):
+        for attribute, value in list(vars(cls).items()):
+            if (
+                inspect.isfunction(value)
+                and not attribute.startswith("_")
+                and attribute not in exclude
+            ):
+                setattr(cls, attribute, instrumented(f"{prefix}.{attribute}")(value))
+        return cls
+
+    return decorate
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("fitzone_query_start", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("fitzone_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    # SQL time also counts towards every span it ran in
+    for frame in getattr(_local, "spans", ()):
+        frame[1] += elapsed
+        frame[2] += 1
+
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "?"
+    record(f"sql.{verb}", elapsed, elapsed, 1)
+
+
+def snapshot():
+    """Statistics of every operation recorded so far, by name"""
+    with _lock:
+        return {name: histogram.to_dict() for name, histogram in _histograms.items()}
+
+
+def format_report(sort_by="total_s", limit=None):
+    """Plain-text table of the recorded operations, slowest total first"""
+    stats = sorted(snapshot().items(), key=lambda item: item[1][sort_by], reverse=True)
+    if limit:
+        stats = stats[:limit]
+
+    lines = [
+        f"{'operation':<48} {'calls':>7} {'total ms':>10} {'mean ms':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'max ms':>9} {'sql ms':>9} {'queries':>8}"
+    ]
+    for name, values in stats:
+        lines.append(
+            f"{name:<48} {values['count']:>7} {values['total_s'] * 1000:>10.2f} "
+            f"{values['mean_s'] * 1000:>9.3f} {values['p50_s'] * 1000:>8.3f} "
+            f"{values['p95_s'] * 1000:>8.3f} {values['max_s'] * 1000:>9.3f} "
+            f"{values['sql_s'] * 1000:>9.2f} {values['statements']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def log_report(log=None, level=logging.INFO):
+    """Write the report to a logger (this module's by default)"""
+    if _histograms:
+        (log or logger).log(level, "Instrumentation report:\n%s", format_report())
@@ -0,0 +1,68 @@
+"""
+Counts the SQL statements and commits sent to the database.
+Used to catch N+1 query patterns: wrap a call in assert_max_queries and it
+fails as soon as the call goes over its query budget.
+"""
+from contextlib import contextmanager
+from sqlalchemy import event
+from controllers.database import engine
+
+
+class QueryCounter:
+    """
+    Context manager recording every statement executed and every
+    transaction committed on an engine.
+
+    Example:
+        with QueryCounter() as counter:
+            get_all_admins()
+        print(counter.count, counter.statements, counter.commits)
+    """
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self.statements = []
+        self.commits = 0
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def __enter__(self):
+        self.statements = []
+        self.commits = 0
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        event.listen(self.bind, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+        event.remove(self.bind, "commit", self._on_commit)
+        return False
+
+
+@contextmanager
+def assert_max_queries(max_queries, bind=engine):
+    """
+    Fail if the wrapped block executes more than max_queries statements.
+
+    Raises:
+        AssertionError: Listing the executed statements when over budget
+    """
+    with QueryCounter(bind) as counter:
+        yield counter
+
+    if counter.count > max_queries:
+        executed = "\n".join(
+            f"  {idx}. {statement}" for idx, statement in enumerate(counter.statements, 1)
+        )
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, {counter.count} were executed:\n"
+            f"{executed}"
+        )
@@ -0,0 +1,87 @@
+"""
+Versioned schema migrations.
+
+Each migration is a module in this package named m<version>_<description>.py
+with an upgrade(connection) function. Applied versions are recorded in the
+schema_version table, so running the migrations again only applies the new
+ones. Migrations must be idempotent (CREATE ... IF NOT EXISTS and the like)
+so an interrupted or concurrent run can safely be repeated.
+"""
+import importlib
+import logging
+import pkgutil
+from datetime import datetime
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+def available_migrations():
+    """(version, name, module) for every migration module, in version order"""
+    migrations = []
+    for module_info in pkgutil.iter_modules(__path__):
+        prefix, _, name = module_info.name.partition("_")
+        if not (prefix.startswith("m") and prefix[1:].isdigit()):
+            continue
+        module = importlib.import_module(f"{__name__}.{module_info.name}")
+        migrations.append((int(prefix[1:]), name, module))
+    return sorted(migrations, key=lambda migration: migration[0])
+
+
+def _ensure_version_table(connection):
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+        "version INTEGER PRIMARY KEY, "
+        "name VARCHAR NOT NULL, "
+        "applied_at DATETIME NOT NULL)"
+    ))
+
+
+def current_version(engine):
+    """Highest applied migration version, 0 for a database never migrated"""
+    with engine.begin() as connection:
+        _ensure_version_table(connection)
+        version = connection.execute(
+            text(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}")
+        ).scalar()
+    return version or 0
+
+
+def migrate(engine, target=None):
+    """
+    Apply pending migrations up to target (default: latest), each one in its
+    own transaction together with its schema_version row.
+
+    Returns:
+        list: Versions applied by this call
+    """
+    applied = []
+    version = current_version(engine)
+
+    for migration_version, name, module in available_migrations():
+        if migration_version <= version:
+            continue
+        if target is not None and migration_version > target:
+            break
+
+        logger.info(f"Applying migration {migration_version}: {name}")
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            # A concurrent runner may have recorded it already
+            recorded = connection.execute(
+                text(f"SELECT 1 FROM {SCHEMA_VERSION_TABLE} WHERE version = :version"),
+                {"version": migration_version},
+            ).first()
+            if recorded is None:
+                connection.execute(
+                    text(
+                        f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, name, applied_at) "
+                        "VALUES (:version, :name, :applied_at)"
+                    ),
+                    {"version": migration_version, "name": name, "applied_at": datetime.now()},
+                )
+        applied.append(migration_version)
+
+    return applied
@@ -0,0 +1,52 @@
+"""Create the persons, users, trainers and admins tables if they do not exist"""
+from sqlalchemy import text
+
+# The schema as it was before migrations existed. Frozen here rather than
+# read from models.models, so later columns and indexes come from the
+# migrations that add them
+TABLES = [
+    """CREATE TABLE IF NOT EXISTS admins (
+        id INTEGER NOT NULL,
+        username VARCHAR NOT NULL,
+        password_hash VARCHAR(128) NOT NULL,
+        role VARCHAR NOT NULL,
+        created_at DATETIME,
+        PRIMARY KEY (id),
+        UNIQUE (username)
+    )""",
+    """CREATE TABLE IF NOT EXISTS persons (
+        id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        lastname VARCHAR NOT NULL,
+        age INTEGER,
+        email VARCHAR NOT NULL,
+        phone VARCHAR,
+        created_at DATETIME,
+        type VARCHAR(20),
+        PRIMARY KEY (id),
+        UNIQUE (email)
+    )""",
+    """CREATE TABLE IF NOT EXISTS trainers (
+        id INTEGER NOT NULL,
+        specialty VARCHAR,
+        start_time VARCHAR,
+        end_time VARCHAR,
+        admin_username VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY(id) REFERENCES persons (id),
+        FOREIGN KEY(admin_username) REFERENCES admins (username)
+    )""",
+    """CREATE TABLE IF NOT EXISTS users (
+        id INTEGER NOT NULL,
+        membership_type VARCHAR,
+        renovation_date DATETIME,
+        PRIMARY KEY (id),
+        FOREIGN KEY(id) REFERENCES persons (id)
+    )""",
+]
+
+
+def upgrade(connection):
+    # Databases created before migrations existed already have the tables
+    for statement in TABLES:
+        connection.execute(text(statement))
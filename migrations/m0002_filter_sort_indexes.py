@@ -0,0 +1,19 @@
+"""Index the columns the dashboard filters and sorts on"""
+from sqlalchemy import text
+
+# (index name, table, column). Names match the ones SQLAlchemy derives from
+# index=True in models/models.py
+INDEXES = [
+    ("ix_persons_type", "persons", "type"),
+    ("ix_persons_lastname", "persons", "lastname"),
+    ("ix_users_membership_type", "users", "membership_type"),
+    ("ix_users_renovation_date", "users", "renovation_date"),
+    ("ix_trainers_admin_username", "trainers", "admin_username"),
+]
+
+
+def upgrade(connection):
+    # IF NOT EXISTS keeps this safe to re-run. SQLite builds each index in a
+    # single pass; with WAL journaling readers keep working meanwhile
+    for name, table, column in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
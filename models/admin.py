@@ -1,6 +1,7 @@
 from datetime import datetime
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from utils.date_codec import parse_hour
 
 
 # Create a global instance with secure but balanced configuration
@@ -14,15 +15,23 @@ ph = PasswordHasher(
 
 
 class Admin:
-    def __init__(self, username=None, password=None, role=None, created_at=None, trainer_id=None):
+    __slots__ = (
+        "_unique_id", "_username", "_password", "_role", "_created_at", "_trainer_id"
+    )
+
+    def __init__(
+        self, username=None, password=None, role=None, created_at=None, trainer_id=None,
+        password_hash=None,
+    ):
         self._unique_id = None
         self._username = username
-        self._password = None
+        # An already computed hash (e.g. from AuthService.hash_password) skips hashing
+        self._password = password_hash
         self._role = role
         self._created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:00")
         self._trainer_id = trainer_id  # Add trainer association
 
-        if password:
+        if password and not password_hash:
             self.set_password(password)
 
     def __str__(self):
@@ -60,6 +69,10 @@ class Admin:
         else:
             self._password = None
 
+    def set_password_hash(self, password_hash):
+        """Stores a password hash computed elsewhere (AuthService.hash_password)"""
+        self._password = password_hash or None
+
     def verify_password(self, password):
         """Verifica si la contraseña proporcionada coincide con el hash almacenado"""
         if not password or not self._password:
@@ -95,7 +108,7 @@ class Admin:
     @created_at.setter
     def created_at(self, created_at):
         try:
-            datetime.strptime(created_at, "%Y-%m-%d %H:00")
+            parse_hour(created_at)
             self._created_at = created_at
         except ValueError:
             raise ValueError("created_at must be in the format 'YYYY-MM-DD HH:00'")
@@ -24,14 +24,14 @@ class PersonDB(Base):
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
-    lastname = Column(String, nullable=False)
+    lastname = Column(String, nullable=False, index=True)
     age = Column(Integer)
     email = Column(String, unique=True, nullable=False)
     phone = Column(String)
     created_at = Column(DateTime, default=datetime.now)
 
     # Discriminator field to identify the type of person
-    type = Column(String(20))
+    type = Column(String(20), index=True)
 
     __mapper_args__ = {
         "polymorphic_identity": "person",
@@ -44,8 +44,8 @@ class UserDB(PersonDB):
     __tablename__ = "users"
 
     id = Column(Integer, ForeignKey("persons.id"), primary_key=True)
-    membership_type = Column(String)
-    renovation_date = Column(DateTime)
+    membership_type = Column(String, index=True)
+    renovation_date = Column(DateTime, index=True)
 
     __mapper_args__ = {
         "polymorphic_identity": "user",
@@ -60,7 +60,7 @@ class TrainerDB(PersonDB):
     specialty = Column(String)
     start_time = Column(String)
     end_time = Column(String)
-    admin_username = Column(String, ForeignKey("admins.username"), nullable=True)
+    admin_username = Column(String, ForeignKey("admins.username"), nullable=True, index=True)
 
     # Relationship with admin
     admin = relationship("AdminDB", back_populates="trainer")
@@ -1,7 +1,11 @@
 from datetime import datetime
+from utils.date_codec import parse_hour
 
 
 class Person:
+    # No per-instance __dict__: bulk loads create one object per row
+    __slots__ = ("_name", "_lastname", "_age", "_email", "_phone", "_created_at")
+
     def __init__(self, name=None, lastname=None, age=None, email=None, phone=None, created_at=None):
         self._name = name
         self._lastname = lastname
@@ -67,7 +71,7 @@ class Person:
     @created_at.setter
     def created_at(self, created_at):
         try:
-            datetime.strptime(created_at, "%Y-%m-%d %H:00")
+            parse_hour(created_at)
             self._created_at = created_at
         except ValueError:
             raise ValueError("created_at must be in the format 'YYYY-MM-DD HH:00'")
@@ -3,6 +3,9 @@ from models.user import User
 
 
 class Trainer(User):
+    # admin_username is only set when a form links the trainer to a manager
+    __slots__ = ("_specialty", "_start_time", "_end_time", "admin_username")
+
     def __init__(
         self,
         name=None,
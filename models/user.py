@@ -1,9 +1,17 @@
 import re
 from models.person import Person
-from datetime import datetime, timedelta
+from datetime import timedelta
+from utils.date_codec import format_hour, parse_hour
+
+RENOVATION_DATE_PATTERN = re.compile(
+    r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]) (?:[01]\d|2[0-3]):00$"
+)
 
 
 class User(Person):
+    # status is only set by the dashboard forms
+    __slots__ = ("_unique_id", "_membership_type", "_renovation_date", "status")
+
     def __init__(
         self,
         name=None,
@@ -53,23 +61,15 @@ class User(Person):
     def renovation_date(self, renovation_date):
         if renovation_date is None:
             # If no date provided, set to next month same day and hour
-            current = datetime.strptime(self.created_at, "%Y-%m-%d %H:00")
-            next_month = current + timedelta(days=30)
-            self._renovation_date = next_month.strftime("%Y-%m-%d %H:00")
+            next_month = parse_hour(self.created_at) + timedelta(days=30)
+            self._renovation_date = format_hour(next_month)
         else:
             # Validate format YYYY-MM-DD HH:00
-            if not re.match(
-                r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]) "
-                r"(?:[01]\d|2[0-3]):00$",
-                renovation_date,
-            ):
+            if not RENOVATION_DATE_PATTERN.match(renovation_date):
                 raise ValueError("Renovation date must be in format 'YYYY-MM-DD HH:00'")
 
             # Validate that renovation date is after creation date
-            renovation = datetime.strptime(renovation_date, "%Y-%m-%d %H:00")
-            creation = datetime.strptime(self.created_at, "%Y-%m-%d %H:00")
-
-            if renovation <= creation:
+            if parse_hour(renovation_date) <= parse_hour(self.created_at):
                 raise ValueError("Renovation date must be after creation date")
 
             self._renovation_date = renovation_date
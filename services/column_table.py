@@ -0,0 +1,466 @@
+"""
+Column store for the dashboard row caches.
+
+A ColumnTable keeps the values of one entity set column by column instead
+of one Python list per row: integers and hour timestamps in typed arrays,
+repeated values (plans, roles, specialties) as small integer codes, names
+in a pool where equal strings share one object, and unique text (emails,
+phones) packed as UTF-8 in one buffer per chunk of rows. Row views format
+only the rows they are asked for, so every view of an entity shares the
+same storage.
+"""
+import operator
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain, islice
+
+# Column kinds
+INT = "int"  # array of signed 64-bit integers, None stored as MISSING
+CATEGORY = "category"  # array of codes into the column's distinct values
+POOLED = "pooled"  # list of strings, equal values share one object
+PACKED = "packed"  # UTF-8 bytes in one buffer, for mostly unique text
+OBJECT = "object"  # plain list, values kept as they are
+
+# Changes to one row of a table, that indexes over it can be patched for
+REPLACE = "replace"  # the row at a position has new values
+DELETE = "delete"  # the row at a position is gone, later rows move up
+APPEND = "append"  # a row was added at the end
+
+MISSING = -(2 ** 63)
+_NONE_LENGTH = 2 ** 32 - 1  # PACKED length marking None
+
+
+class _Categories:
+    """Distinct values of a CATEGORY column and their codes"""
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _Packed:
+    """
+    Text column packed into one bytearray. Rows point at (start, length);
+    replaced values are appended and deleted ones left in place, so copies
+    compact the buffer once more than half of it is unused.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.starts = array("Q")
+        self.lengths = array("I")
+        self.garbage = 0  # bytes no row points at
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _pack(self, value):
+        if value is None:
+            return 0, _NONE_LENGTH
+        data = value.encode("utf-8")
+        start = len(self.buffer)
+        self.buffer += data
+        return start, len(data)
+
+    def append(self, value):
+        start, length = self._pack(value)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def __getitem__(self, pos):
+        length = self.lengths[pos]
+        if length == _NONE_LENGTH:
+            return None
+        start = self.starts[pos]
+        return self.buffer[start:start + length].decode("utf-8")
+
+    def __setitem__(self, pos, value):
+        self._discard(pos)
+        self.starts[pos], self.lengths[pos] = self._pack(value)
+
+    def __delitem__(self, pos):
+        self._discard(pos)
+        del self.starts[pos]
+        del self.lengths[pos]
+
+    def _discard(self, pos):
+        if self.lengths[pos] != _NONE_LENGTH:
+            self.garbage += self.lengths[pos]
+
+    def copy(self):
+        copy = _Packed()
+        if self.garbage * 2 > len(self.buffer):
+            for pos in range(len(self)):
+                copy.append(self[pos])
+        else:
+            copy.buffer = bytearray(self.buffer)
+            copy.starts = self.starts[:]
+            copy.lengths = self.lengths[:]
+            copy.garbage = self.garbage
+        return copy
+
+    def nbytes(self):
+        return (
+            len(self.buffer)
+            + self.starts.itemsize * len(self.starts)
+            + self.lengths.itemsize * len(self.lengths)
+        )
+
+
+def _order_key(value):
+    return (0, "") if value is None else (1, str(value).casefold())
+
+
+def _ranks(values):
+    """Distinct value -> dense rank in sort order (see ColumnTable.sort_keys)"""
+    keys = {value: _order_key(value) for value in set(values)}
+    rank_of_key = {key: rank for rank, key in enumerate(sorted(set(keys.values())))}
+    return {value: rank_of_key[key] for value, key in keys.items()}
+
+
+class _Chunk:
+    """
+    Storage of up to ColumnTable.CHUNK_ROWS consecutive rows, one object
+    per column, and the table allowed to write it. Tables copied from one
+    another share their chunks until they write to them
+    """
+
+    __slots__ = ("owner", "columns")
+
+    def __init__(self, owner, columns):
+        self.owner = owner
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def copy(self, owner):
+        return _Chunk(owner, [
+            column.copy() if isinstance(column, _Packed) else column[:]
+            for column in self.columns
+        ])
+
+
+class _ColumnView(Sequence):
+    """Read-only values of one INT column of a table, across its chunks"""
+
+    def __init__(self, columns, starts, length):
+        self._columns = columns
+        self._starts = starts
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Column index out of range")
+        chunk = bisect_right(self._starts, index) - 1
+        return self._columns[chunk][index - self._starts[chunk]]
+
+    def __iter__(self):
+        return chain.from_iterable(self._columns)
+
+
+class ColumnTable:
+    """
+    Rows of an entity set stored by column.
+
+    Columns are split in chunks of CHUNK_ROWS rows, so a copy only copies
+    the chunk list and a change to one row then copies only its chunk.
+
+    Args:
+        schema: (column name, kind) pairs, in record order. Records passed
+            to append/replace and returned by record() are tuples in this order
+    """
+
+    CHUNK_ROWS = 4096
+
+    def __init__(self, schema):
+        self.schema = tuple(schema)
+        self.names = tuple(name for name, _ in self.schema)
+        self._categories = {}
+        self._pool = {}
+        for name, kind in self.schema:
+            if kind == CATEGORY:
+                self._categories[name] = _Categories()
+            elif kind not in (INT, PACKED, POOLED, OBJECT):
+                raise ValueError(f"Unknown column kind '{kind}' for '{name}'")
+        self._chunks = []
+        self._starts = array("Q")  # position of the first row of each chunk
+        self._length = 0
+        # Chunks owned by another table are copied before they are written
+        self._owner = object()
+        # Whether the ID column is ascending; None until sorted_ids() checks
+        self._ids_ascending = None
+
+    def __len__(self):
+        return self._length
+
+    def _new_columns(self):
+        columns = []
+        for _, kind in self.schema:
+            if kind == INT:
+                columns.append(array("q"))
+            elif kind == CATEGORY:
+                columns.append(array("H"))
+            elif kind == PACKED:
+                columns.append(_Packed())
+            else:
+                columns.append([])
+        return columns
+
+    def _locate(self, pos):
+        """(chunk index, row offset in the chunk) of a row position"""
+        if pos < 0:
+            pos += self._length
+        if not 0 <= pos < self._length:
+            raise IndexError("ColumnTable position out of range")
+        index = bisect_right(self._starts, pos) - 1
+        return index, pos - self._starts[index]
+
+    def _writable(self, index):
+        """Chunk at index, copied first if this table does not own it"""
+        chunk = self._chunks[index]
+        if chunk.owner is not self._owner:
+            chunk = self._chunks[index] = chunk.copy(self._owner)
+        return chunk
+
+    def append(self, record):
+        if self._ids_ascending:
+            self._ids_ascending = record[0] is not None and (
+                not self._chunks or self._chunks[-1].columns[0][-1] < record[0]
+            )
+        if not self._chunks or len(self._chunks[-1]) >= self.CHUNK_ROWS:
+            self._chunks.append(_Chunk(self._owner, self._new_columns()))
+            self._starts.append(self._length)
+        chunk = self._writable(len(self._chunks) - 1)
+        for (name, kind), column, value in zip(self.schema, chunk.columns, record):
+            column.append(self._encode(name, kind, value))
+        self._length += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def replace(self, pos, record):
+        if self._ids_ascending and self.record(pos)[0] != record[0]:
+            self._ids_ascending = None
+        index, offset = self._locate(pos)
+        chunk = self._writable(index)
+        for (name, kind), column, value in zip(self.schema, chunk.columns, record):
+            column[offset] = self._encode(name, kind, value)
+
+    def delete(self, pos):
+        index, offset = self._locate(pos)
+        chunk = self._writable(index)
+        for column in chunk.columns:
+            del column[offset]
+        if len(chunk):
+            index += 1
+        else:
+            del self._chunks[index]
+            del self._starts[index]
+        for later in range(index, len(self._starts)):
+            self._starts[later] -= 1
+        self._length -= 1
+
+    def record(self, pos):
+        """Values of one row, decoded, in schema order"""
+        index, offset = self._locate(pos)
+        return tuple(
+            self._decode(name, kind, column[offset])
+            for (name, kind), column in zip(self.schema, self._chunks[index].columns)
+        )
+
+    def value(self, name, pos):
+        idx = self.names.index(name)
+        index, offset = self._locate(pos)
+        return self._decode(name, self.schema[idx][1], self._chunks[index].columns[idx][offset])
+
+    def _column(self, idx):
+        """Stored values of one column for all rows, joined in one array or list"""
+        chunks = [chunk.columns[idx] for chunk in self._chunks]
+        kind = self.schema[idx][1]
+        if kind in (INT, CATEGORY):
+            joined = array("q" if kind == INT else "H")
+            for column in chunks:
+                joined.extend(column)
+            return joined
+        if kind == PACKED:
+            return [column[pos] for column in chunks for pos in range(len(column))]
+        return list(chain.from_iterable(chunks))
+
+    def sort_keys(self, name):
+        """
+        Integer sort key of every row for a column, in row order: equal
+        values get equal keys, None sorts first and text ignores case.
+        INT columns (IDs, hour timestamps) are their own keys
+        """
+        idx = self.names.index(name)
+        kind, column = self.schema[idx][1], self._column(idx)
+        if kind == INT:
+            return column
+        if kind == CATEGORY:
+            values = self._categories[name].values
+            ranks = _ranks(values)
+            return array("I", map([ranks[value] for value in values].__getitem__, column))
+        ranks = _ranks(column)
+        return array("I", map(ranks.__getitem__, column))
+
+    def sort_key(self, name, pos):
+        """
+        Sort key of one row for a column, ordered like the keys sort_keys
+        gives the other rows (but not comparable with them)
+        """
+        idx = self.names.index(name)
+        index, offset = self._locate(pos)
+        stored = self._chunks[index].columns[idx][offset]
+        if self.schema[idx][1] == INT:
+            return stored
+        return _order_key(self._decode(name, self.schema[idx][1], stored))
+
+    def categories(self, name):
+        """Distinct values seen in a CATEGORY column, indexed by code"""
+        return list(self._categories[name].values)
+
+    def codes(self, name):
+        """Code of every row of a CATEGORY column (see categories), in row order"""
+        return self._column(self.names.index(name))
+
+    def sorted_ids(self):
+        """
+        The first column, an INT column of IDs, if its values are ascending
+        and never missing (autoincremented IDs in ID order), else None
+        """
+        if self._ids_ascending is None:
+            self._ids_ascending = True
+            previous = MISSING
+            for chunk in self._chunks:
+                ids = chunk.columns[0]
+                if not (ids[0] > previous and all(map(operator.lt, ids, islice(ids, 1, None)))):
+                    self._ids_ascending = False
+                    break
+                previous = ids[-1]
+        if not self._ids_ascending:
+            return None
+        return _ColumnView(
+            [chunk.columns[0] for chunk in self._chunks], self._starts[:], self._length
+        )
+
+    def copy(self):
+        """
+        Independent copy, for changes while the current table may be on
+        screen. Chunks are shared until either table writes to them
+        """
+        copy = type(self).__new__(type(self))
+        copy.schema = self.schema
+        copy.names = self.names
+        copy._chunks = list(self._chunks)
+        copy._starts = self._starts[:]
+        copy._length = self._length
+        copy._owner = object()
+        # Neither table owns the shared chunks any more
+        self._owner = object()
+        # New values only ever add categories and pooled strings: share them
+        copy._categories = self._categories
+        copy._pool = self._pool
+        copy._ids_ascending = self._ids_ascending
+        return copy
+
+    def nbytes(self):
+        """Approximate bytes held by the columns, excluding shared pooled strings"""
+        total = 0
+        for chunk in self._chunks:
+            for column in chunk.columns:
+                if isinstance(column, array):
+                    total += column.itemsize * len(column)
+                elif isinstance(column, _Packed):
+                    total += column.nbytes()
+                else:
+                    total += 8 * len(column)
+        return total
+
+    def _encode(self, name, kind, value):
+        if kind == INT:
+            return MISSING if value is None else value
+        if kind == CATEGORY:
+            code = self._categories[name].encode(value)
+            if code > 0xFFFF:
+                raise OverflowError(f"Too many distinct values in column '{name}'")
+            return code
+        if kind == POOLED and value is not None:
+            return self._pool.setdefault(value, value)
+        return value
+
+    def _decode(self, name, kind, stored):
+        if kind == INT:
+            return None if stored == MISSING else stored
+        if kind == CATEGORY:
+            return self._categories[name].values[stored]
+        return stored
+
+
+class TableView(Sequence):
+    """
+    Read-only sequence of formatted rows over a ColumnTable.
+
+    Args:
+        table: Rows to format
+        project: project(record, sequential_id) -> formatted row, where
+            record is ColumnTable.record(pos) and sequential_id is pos + 1
+        positions: Table positions shown, in order (all rows by default)
+    """
+
+    def __init__(self, table, project, positions=None):
+        self.table = table
+        self._project = project
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions) if self._positions is not None else len(self.table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TableView index out of range")
+
+        pos = self._positions[index] if self._positions is not None else index
+        return self._project(self.table.record(pos), pos + 1)
+
+    def position(self, index):
+        """Table position of the row at index"""
+        return self._positions[index] if self._positions is not None else index
+
+    def positions(self):
+        """Table positions of the rows of this view, in order"""
+        return self._positions if self._positions is not None else range(len(self.table))
+
+    def select(self, indexes):
+        """View of the rows at the given indexes of this view, in that order"""
+        if self._positions is not None:
+            indexes = [self._positions[index] for index in indexes]
+        return TableView(self.table, self._project, array("I", indexes))
+
+    def rebind(self, table):
+        """The same projection over another table (all of its rows)"""
+        return TableView(table, self._project)
+
+    def sorted_ids(self):
+        """Ascending real IDs of every row (see ColumnTable.sorted_ids), or None"""
+        return self.table.sorted_ids() if self._positions is None else None
+
@@ -2,204 +2,276 @@
 Servicio para formatear datos de diferentes entidades.
 Aplica el Principio de Responsabilidad Única: cada formateador se encarga de un tipo de dato.
 """
-from datetime import datetime
-from controllers.crud import get_all_admins, get_all_trainers, get_all_users
-
-
+from controllers.instrumentation import instrument_methods
+from controllers.crud import (
+    DEFAULT_PAGE_SIZE,
+    get_all_admins,
+    get_admin,
+    get_all_trainers_with_managers,
+    get_trainer_with_manager,
+    get_user_listing_rows,
+    get_user_table_rows,
+)
+from services.column_table import (
+    CATEGORY,
+    INT,
+    OBJECT,
+    PACKED,
+    POOLED,
+    ColumnTable,
+    TableView,
+)
+from utils.date_codec import format_day, format_hour, from_hour_code, hour_code, parse_day
+
+# Columnas guardadas por entidad; cada registro es una tupla en este orden
+ADMIN_COLUMNS = (
+    ("id", INT),
+    ("username", OBJECT),
+    ("role", CATEGORY),
+    ("created_at", INT),  # date_codec.hour_code, para ordenar por fecha real
+    ("trainer_id", OBJECT),
+)
+TRAINER_COLUMNS = (
+    ("id", INT),
+    ("name", POOLED),
+    ("specialty", CATEGORY),
+    ("schedule", CATEGORY),
+    ("manager", CATEGORY),
+    ("email", PACKED),
+    ("phone", PACKED),
+)
+USER_COLUMNS = (
+    ("id", INT),
+    ("name", POOLED),
+    ("membership_type", CATEGORY),
+    ("status", CATEGORY),
+    ("created_at", INT),  # date_codec.hour_code
+    ("email", PACKED),
+    ("phone", PACKED),
+)
+
+
+# format_user_row runs once per displayed row: not timed
+@instrument_methods("formatter", exclude=("format_user_row",))
 class DataFormatter:
     """Servicio principal para coordinar el formateo de datos"""
 
-    def get_formatted_admin_data(self):
-        """Obtiene y formatea datos de administradores"""
-        admins_data = get_all_admins()
-        formatted_data = []
-
-        for idx, admin in enumerate(admins_data):
-            # Format created_at date if available
-            created_at_str = self._format_date(admin.created_at)
+    # Las filas de cada entidad se guardan una sola vez en una ColumnTable;
+    # cada proyección (ID secuencial, ID real, búsqueda) es una TableView que
+    # formatea solo las filas que se leen. Se devuelven en el orden de
+    # DashboardController.ROW_CACHES
 
-            formatted_data.append([
-                str(idx + 1),  # Use sequential ID starting from 1
-                admin.username,
-                admin.role.capitalize() if admin.role else "Admin",
-                created_at_str,
-            ])
+    def get_admin_views(self):
+        """
+        Lee los administradores una vez y arma todas sus proyecciones.
+        Returns: (rows, extended_rows), alineadas fila a fila
+        """
+        table = ColumnTable(ADMIN_COLUMNS)
+        table.extend(self._admin_record(admin) for admin in get_all_admins())
+        return self._views(table, (self._admin_row, self._admin_row_extended))
 
-        return formatted_data
+    def get_formatted_admin_data(self):
+        """Obtiene y formatea datos de administradores"""
+        return self.get_admin_views()[0]
 
     def get_formatted_admin_data_extended(self):
         """
         Obtiene datos de administradores con IDs reales y asociaciones de trainers
         Mantiene compatibilidad pero agrega información necesaria para filtros
         """
-        admins_data = get_all_admins()
-        formatted_data = []
-
-        for admin in admins_data:
-            # Format created_at date if available
-            created_at_str = self._format_date(admin.created_at)
-
-            # Get real admin ID safely
-            admin_id = getattr(admin, 'unique_id', None) or getattr(admin, 'id', None)
-
-            # Get associated trainer ID using the new trainer_id property
-            trainer_id = getattr(admin, 'trainer_id', None)
-
-            formatted_data.append([
-                str(admin_id) if admin_id else "N/A",  # Real admin ID
-                admin.username,
-                admin.role.capitalize() if admin.role else "Admin",
-                created_at_str,
-                trainer_id,  # Associated trainer ID from the model
-            ])
-
-        return formatted_data
-
-    def get_formatted_trainer_data(self):
-        """Obtiene y formatea datos de entrenadores con IDs secuenciales para la vista"""
+        return self.get_admin_views()[1]
+
+    def get_admin_record(self, admin_id):
+        """Registro (fila de ADMIN_COLUMNS) de un administrador, o None si no existe"""
+        admin = get_admin(admin_id)
+        return self._admin_record(admin) if admin else None
+
+    def _admin_record(self, admin):
+        # Get real admin ID safely
+        admin_id = getattr(admin, 'unique_id', None) or getattr(admin, 'id', None)
+        return (
+            admin_id or None,
+            admin.username,
+            admin.role.capitalize() if admin.role else "Admin",
+            self._date_code(admin.created_at),
+            getattr(admin, 'trainer_id', None),  # Associated trainer ID from the model
+        )
+
+    def _admin_row(self, record, sequential_id):
+        """Fila de la tabla de administradores: [seq_id, Username, Role, Created]"""
+        return [str(sequential_id), record[1], record[2], self._format_date_code(record[3])]
+
+    def _admin_row_extended(self, record, sequential_id):
+        """Fila con ID real y trainer asociado: [real_id, Username, Role, Created, trainer_id]"""
+        admin_id = record[0]
+        return [
+            str(admin_id) if admin_id else "N/A",
+            record[1],
+            record[2],
+            self._format_date_code(record[3]),
+            record[4],
+        ]
+
+    def get_trainer_views(self):
+        """
+        Lee los entrenadores (con su manager) una vez y arma todas sus proyecciones.
+        Returns: (rows, rows_with_real_ids, search_terms), alineadas fila a fila
+        """
+        table = ColumnTable(TRAINER_COLUMNS)
         try:
-            trainers_data = get_all_trainers()
-            formatted_data = []
-
-            # Get admin data to find manager associations
-            admins_data = get_all_admins()
-
-            # Create a mapping of trainer_id -> manager_username
-            trainer_to_manager = {}
-            for admin in admins_data:
-                trainer_id = getattr(admin, 'trainer_id', None)
-                admin_role = getattr(admin, 'role', '')
-                if trainer_id and admin_role and admin_role.lower() == 'manager':
-                    trainer_to_manager[trainer_id] = admin.username
-
-            for idx, trainer in enumerate(trainers_data):
-                # Format start_time and end_time if available
-                schedule_str = self._format_schedule(trainer)
-
-                # Get trainer name safely
-                full_name = self._format_full_name(trainer)
-
-                # Get specialty safely
-                specialty = getattr(trainer, "specialty", "Trainer")
-
-                # Get real trainer ID for manager lookup
-                trainer_id = getattr(trainer, 'unique_id', None) or getattr(trainer, 'id', None)
-
-                # Find associated manager
-                manager_username = trainer_to_manager.get(trainer_id, "Available")
-
-                formatted_data.append([
-                    str(idx + 1),  # Sequential ID for user-friendly display
-                    full_name,
-                    specialty,
-                    schedule_str,
-                    manager_username,  # Associated manager or "Available"
-                ])
-
-            return formatted_data
+            # Trainers and their manager usernames come from one joined query
+            table.extend(
+                self._trainer_record(trainer, manager_username)
+                for trainer, manager_username in get_all_trainers_with_managers()
+            )
         except Exception as e:
             print(f"Error formatting trainer data: {e}")
-            return []
+            table = ColumnTable(TRAINER_COLUMNS)
+        return self._views(
+            table, (self._trainer_row, self._trainer_row_with_real_id, self._search_terms)
+        )
+
+    def get_formatted_trainer_data(self):
+        """Obtiene y formatea datos de entrenadores con IDs secuenciales para la vista"""
+        return self.get_trainer_views()[0]
 
     def get_formatted_trainer_data_with_real_ids(self):
         """Obtiene datos de entrenadores con IDs reales para filtrado interno"""
-        try:
-            trainers_data = get_all_trainers()
-            formatted_data = []
-
-            # Get admin data to find manager associations
-            admins_data = get_all_admins()
+        return self.get_trainer_views()[1]
 
-            # Create a mapping of trainer_id -> manager_username
-            trainer_to_manager = {}
-            for admin in admins_data:
-                trainer_id = getattr(admin, 'trainer_id', None)
-                admin_role = getattr(admin, 'role', '')
-                if trainer_id and admin_role and admin_role.lower() == 'manager':
-                    trainer_to_manager[trainer_id] = admin.username
-
-            for trainer in trainers_data:
-                # Format start_time and end_time if available
-                schedule_str = self._format_schedule(trainer)
-
-                # Get trainer name safely
-                full_name = self._format_full_name(trainer)
-
-                # Get specialty safely
-                specialty = getattr(trainer, "specialty", "Trainer")
-
-                # Get real trainer ID safely (for proper association filtering)
-                trainer_id = getattr(trainer, 'unique_id', None) or getattr(trainer, 'id', None)
-
-                # Find associated manager
-                manager_username = trainer_to_manager.get(trainer_id, "Available")
-
-                formatted_data.append([
-                    str(trainer_id) if trainer_id else "N/A",  # Real ID for system use
-                    full_name,
-                    specialty,
-                    schedule_str,
-                    manager_username,  # Associated manager or "Available"
-                ])
-
-            return formatted_data
+    def get_trainer_search_terms(self):
+        """
+        Obtiene email y teléfono de cada entrenador para la búsqueda difusa.
+        El orden coincide con get_formatted_trainer_data: [email, phone]
+        """
+        return self.get_trainer_views()[2]
+
+    def get_trainer_record(self, trainer_id):
+        """Registro (fila de TRAINER_COLUMNS) de un entrenador, o None si no existe"""
+        found = get_trainer_with_manager(trainer_id)
+        return self._trainer_record(*found) if found else None
+
+    def _trainer_record(self, trainer, manager_username):
+        trainer_id = getattr(trainer, 'unique_id', None) or getattr(trainer, 'id', None)
+        return (
+            trainer_id or None,
+            self._format_full_name(trainer),
+            getattr(trainer, "specialty", "Trainer"),
+            self._format_schedule(trainer),
+            manager_username,
+            trainer.email,
+            trainer.phone,
+        )
+
+    def _trainer_row(self, record, sequential_id):
+        """Fila de la tabla de entrenadores: [ID, Name, Specialty, Schedule, Manager]"""
+        return [
+            str(sequential_id),  # Sequential ID for user-friendly display
+            *record[1:4],
+            record[4] or "Available",  # Associated manager
+        ]
+
+    def _trainer_row_with_real_id(self, record, sequential_id):
+        """La misma fila con el ID real (para filtrar asociaciones)"""
+        trainer_id = record[0]
+        return [str(trainer_id) if trainer_id else "N/A", *record[1:4], record[4] or "Available"]
+
+    def get_user_views(self):
+        """
+        Lee las columnas de tabla y contacto de los usuarios en una sola consulta,
+        sin construir objetos User, y arma todas sus proyecciones.
+        Returns: (rows, rows_with_real_ids, search_terms), alineadas fila a fila
+        """
+        table = ColumnTable(USER_COLUMNS)
+        try:
+            table.extend(self._user_record(*row) for row in get_user_listing_rows())
         except Exception as e:
-            print(f"Error formatting trainer data with real IDs: {e}")
-            return []
+            print(f"Error formatting user data: {e}")
+            table = ColumnTable(USER_COLUMNS)
+        return self._views(
+            table, (self.format_user_row, self._user_row_with_real_id, self._search_terms)
+        )
 
     def get_formatted_user_data(self):
         """Obtiene y formatea datos de usuarios"""
-        try:
-            users_data = get_all_users()
-            formatted_data = []
-
-            for idx, user in enumerate(users_data):
-                # Format membership type
-                membership_type = getattr(user, "membership_type", "Basic")
-
-                # Format status (assuming active by default if not specified)
-                status = "Active"  # Could be extended if status field exists in user model
-
-                # Format join date (created_at)
-                join_date_str = self._format_date(user.created_at)
-
-                # Get user name safely
-                full_name = self._format_full_name(user)
-
-                formatted_data.append([
-                    str(idx + 1),  # Use sequential ID starting from 1
-                    full_name,
-                    membership_type.capitalize(),
-                    status,
-                    join_date_str,
-                ])
-
-            return formatted_data
-        except Exception as e:
-            print(f"Error formatting user data: {e}")
-            return []
+        return self.get_user_views()[0]
 
     def get_formatted_user_data_with_real_ids(self):
         """Return user rows with real DB IDs in the first column.
-        Ordering matches the underlying CRUD get_all_users iteration,
-        which is the same source typically used by the standard user table.
+        Ordering matches get_formatted_user_data (ID order).
         Each row shape: [real_id, Name, Membership, Status, Join Date]
         """
+        return self.get_user_views()[1]
+
+    def get_user_search_terms(self):
+        """
+        Obtiene email y teléfono de cada usuario para la búsqueda difusa.
+        El orden coincide con get_formatted_user_data: [email, phone]
+        """
+        return self.get_user_views()[2]
+
+    def get_formatted_user_page(self, start_index, after_id=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Obtiene una página de usuarios formateados en orden de ID (paginación por clave).
+        Los IDs secuenciales continúan a partir de start_index.
+        Returns: (rows, real_ids)
+        """
         try:
-            from controllers.crud import get_all_users
-            users = get_all_users() or []
-            rows = []
-            for u in users:
-                real_id = str(getattr(u, "unique_id", getattr(u, "id", "")))
-                name = f"{getattr(u, 'name', '')} {getattr(u, 'lastname', '')}".strip()
-                membership = getattr(u, "membership_type", "")
-                status = getattr(u, "status", "")
-                join_date = getattr(u, "created_at", "")
-                rows.append([real_id, name, membership, status, join_date])
-            return rows
-        except Exception:
-            # Fallback to basic user data
-            return self.get_formatted_user_data() or []
+            page = get_user_table_rows(after_id=after_id, limit=limit)
+            rows = [
+                # The page query has no contact columns
+                self.format_user_row(self._user_record(*row, None, None), start_index + idx + 1)
+                for idx, row in enumerate(page)
+            ]
+            return rows, [row[0] for row in page]
+        except Exception as e:
+            print(f"Error formatting user page: {e}")
+            return [], []
+
+    def get_user_record(self, user_id):
+        """Registro (fila de USER_COLUMNS) de un usuario, o None si no existe"""
+        rows = get_user_listing_rows(user_id=user_id)
+        return self._user_record(*rows[0]) if rows else None
+
+    def _user_record(self, real_id, name, lastname, membership_type, created_at, email, phone):
+        return (
+            real_id,
+            f"{name} {lastname}".strip(),
+            membership_type,
+            "Active",  # Could be extended if status field exists in user model
+            hour_code(created_at) if created_at else None,
+            email,
+            phone,
+        )
+
+    def format_user_row(self, record, sequential_id):
+        """Fila de la tabla de usuarios: [seq_id, Name, Membership, Status, Join Date]"""
+        return [
+            str(sequential_id),  # Sequential ID starting from 1
+            record[1],
+            record[2].capitalize() if record[2] else "Basic",
+            record[3],
+            self._format_date_code(record[4]),
+        ]
+
+    def _user_row_with_real_id(self, record, sequential_id):
+        """Fila con el ID real: [real_id, Name, Membership, Status, Join Date]"""
+        created_at = record[4]
+        return [
+            str(record[0]),
+            record[1],
+            record[2] or "",
+            "",  # Users have no status field yet
+            format_hour(from_hour_code(created_at)) if created_at is not None else "",
+        ]
+
+    def _search_terms(self, record, sequential_id):
+        """[email, phone] de un usuario o entrenador (las dos últimas columnas)"""
+        return [record[-2] or "", record[-1] or ""]
+
+    @staticmethod
+    def _views(table, projections):
+        return tuple(TableView(table, project) for project in projections)
 
     def _format_date(self, date_value):
         """Método utilitario para formatear fechas de manera consistente"""
@@ -209,15 +281,28 @@ class DataFormatter:
         try:
             if isinstance(date_value, str):
                 # Assume format is "YYYY-MM-DD HH:MM:SS" or "YYYY-MM-DD"
-                date_part = date_value.split(" ")[0]
-                dt = datetime.strptime(date_part, "%Y-%m-%d")
-                return dt.strftime("%d/%m/%Y")
+                return format_day(parse_day(date_value.split(" ")[0]))
             else:
                 # It's a datetime object
-                return date_value.strftime("%d/%m/%Y")
+                return format_day(date_value)
         except (ValueError, IndexError):
             return str(date_value)
 
+    def _date_code(self, date_value):
+        """Fecha (datetime o texto 'YYYY-MM-DD ...') -> date_codec.hour_code, o None"""
+        if not date_value:
+            return None
+        try:
+            if isinstance(date_value, str):
+                return hour_code(parse_day(date_value.split(" ")[0]))
+            return hour_code(date_value)
+        except (ValueError, AttributeError):
+            return None
+
+    def _format_date_code(self, code):
+        """hour_code -> 'DD/MM/YYYY', como _format_date"""
+        return format_day(from_hour_code(code)) if code is not None else "N/A"
+
     def _format_schedule(self, trainer):
         """Método utilitario para formatear horarios de entrenadores"""
         if hasattr(trainer, "start_time") and hasattr(trainer, "end_time"):
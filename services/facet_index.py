@@ -0,0 +1,147 @@
+"""
+Facet index for the dashboard tables.
+Keeps, for every value shown in a facet column (membership type, role,
+specialty...), the set of rows showing it as a bitmap, so combining facets
+and text search results and counting their rows are a few big-integer
+operations instead of a pass over the rows.
+"""
+from array import array
+
+from services.column_table import DELETE
+
+# Bit offsets set in each byte value, to list the rows of a bitmap
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(value):
+        return bin(value).count("1")
+
+
+class FacetIndex:
+    """
+    Row bitmaps of the displayed values of some CATEGORY columns.
+
+    Bit n of a bitmap is row position n of the table. A selection maps
+    displayed columns to the values picked in them: rows must show one of
+    the picked values of every column (an empty pick means any value).
+
+    Args:
+        rows: TableView over all the rows of its ColumnTable
+        columns: Displayed column -> CATEGORY column of the table behind it
+    """
+
+    def __init__(self, rows, columns):
+        self._set_row_count(len(rows))
+        self._facets = {}  # displayed column -> {displayed value: bitmap}
+        for column, name in columns.items():
+            self._facets[column] = self._build(rows, column, name)
+
+    def _set_row_count(self, row_count):
+        self._row_count = row_count
+        self._byte_count = (row_count + 7) // 8
+        self._all = (1 << row_count) - 1
+
+    def __len__(self):
+        return self._row_count
+
+    def _build(self, rows, column, name):
+        codes = rows.table.codes(name)
+        code_bits = [bytearray(self._byte_count) for _ in rows.table.categories(name)]
+        for pos, code in enumerate(codes):
+            code_bits[code][pos >> 3] |= 1 << (pos & 7)
+
+        # Codes shown the same way (e.g. 'basic' and 'Basic') share one value
+        bitmaps = {}
+        for bits in code_bits:
+            bitmap = int.from_bytes(bits, "little")
+            if bitmap:
+                first_pos = (bitmap & -bitmap).bit_length() - 1
+                value = str(rows[first_pos][column])
+                bitmaps[value] = bitmaps.get(value, 0) | bitmap
+        return self._sorted(bitmaps)
+
+    @staticmethod
+    def _sorted(bitmaps):
+        return dict(sorted(bitmaps.items(), key=lambda item: (item[0].casefold(), item[0])))
+
+    def patched(self, change, pos, rows):
+        """
+        Index of rows, these rows with one changed (REPLACE or DELETE the
+        row at pos, or APPEND it at pos), by updating that row's bit
+        """
+        patched = FacetIndex.__new__(FacetIndex)
+        patched._set_row_count(len(rows))
+        patched._facets = {}
+        row = rows[pos] if change != DELETE else None
+        bit = 1 << pos
+        for column, facet in self._facets.items():
+            bitmaps = {}
+            for value, bitmap in facet.items():
+                if change == DELETE:
+                    # Later rows move down one bit
+                    bitmap = bitmap & (bit - 1) | bitmap >> (pos + 1) << pos
+                else:
+                    bitmap &= ~bit
+                if bitmap:
+                    bitmaps[value] = bitmap
+            if row is not None:
+                value = str(row[column])
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+            patched._facets[column] = self._sorted(bitmaps)
+        return patched
+
+    def values(self, column):
+        """Displayed values of a facet column, in display order"""
+        return list(self._facets.get(column, ()))
+
+    def mask(self, selection, base=None):
+        """Bitmap of the rows in base (all rows by default) matching selection"""
+        mask = self._all if base is None else base
+        for column, values in selection.items():
+            if values:
+                facet = self._facets.get(column, {})
+                picked = 0
+                for value in values:
+                    picked |= facet.get(value, 0)
+                mask &= picked
+        return mask
+
+    def counts(self, selection, base=None):
+        """
+        {column: {value: rows}} for every facet value: the rows of base
+        that would match if the value were the only one picked in its column
+        """
+        counts = {}
+        for column, facet in self._facets.items():
+            others = self.mask(
+                {col: values for col, values in selection.items() if col != column}, base
+            )
+            counts[column] = {
+                value: _popcount(bitmap & others) for value, bitmap in facet.items()
+            }
+        return counts
+
+    def mask_of(self, positions):
+        """Bitmap of the given row positions"""
+        bits = bytearray(self._byte_count)
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+        return int.from_bytes(bits, "little")
+
+    def positions(self, mask):
+        """Row positions set in a bitmap, ascending"""
+        positions = array("I")
+        for index, byte in enumerate(mask.to_bytes(self._byte_count, "little")):
+            if byte:
+                base = index << 3
+                positions.extend(base + bit for bit in _BYTE_BITS[byte])
+        return positions
+
+    def keep(self, positions, mask):
+        """The given row positions that are set in a bitmap, in their order"""
+        bits = mask.to_bytes(self._byte_count, "little")
+        return array("I", [pos for pos in positions if bits[pos >> 3] >> (pos & 7) & 1])
@@ -0,0 +1,308 @@
+"""
+Fuzzy (typo tolerant) search for the dashboard tables.
+Uses a SymSpell-style deletion dictionary so a lookup only compares the
+query against tokens that share a deletion with it, instead of every row.
+"""
+import copy
+import re
+import unicodedata
+
+from services.column_table import APPEND, DELETE
+from services.row_overlay import RowOverlay
+
+# Runs of letters or runs of digits: "vazquez42@gmail" -> vazquez, 42, gmail
+_TOKEN_PATTERN = re.compile(r"[^\W\d_]+|\d+")
+
+
+def normalize(text):
+    """Lowercase text and strip accents so 'Vázquez' and 'vazquez' compare equal"""
+    decomposed = unicodedata.normalize("NFKD", str(text).lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    """Split a cell value (name, email, phone...) into normalized word tokens"""
+    normalized = normalize(text)
+    tokens = _TOKEN_PATTERN.findall(normalized)
+
+    # Phones are also indexed as one digit string, ignoring separators
+    digits = "".join(char for char in normalized if char.isdigit())
+    if len(digits) >= 6 and digits not in tokens:
+        tokens.append(digits)
+
+    return tokens
+
+
+def edit_distance(source, target, max_distance):
+    """
+    Optimal string alignment distance (Damerau-Levenshtein with adjacent
+    transpositions). Returns max_distance + 1 as soon as the bound is exceeded.
+    """
+    if source == target:
+        return 0
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = i
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + cost,  # substitution
+            )
+            if (
+                previous_previous is not None
+                and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                value = min(value, previous_previous[j - 2] + 1)  # transposition
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    distance = previous[len(target)]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+def _deletes(word, max_distance):
+    """All strings obtained by deleting up to max_distance characters of word"""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            if len(item) <= 1:
+                continue
+            for idx in range(len(item)):
+                next_frontier.add(item[:idx] + item[idx + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class FuzzyIndex:
+    """
+    Deletion dictionary over the tokens of a table.
+
+    Each distinct token is indexed by every deletion (up to max_distance
+    characters) of its first PREFIX_LENGTH characters. A lookup generates the
+    deletions of the query prefix, collects the tokens that share one and
+    verifies them with a bounded edit distance.
+
+    patched() applies a change to one row without rebuilding: the changed
+    row's tokens are kept in a RowOverlay and new tokens in small
+    dictionaries of their own, until too many changes pile up.
+    """
+
+    PREFIX_LENGTH = 7
+
+    def __init__(self, row_tokens, max_distance=2):
+        """
+        Args:
+            row_tokens: One iterable of tokens per row, in table order
+            max_distance: Largest edit distance supported by lookups
+        """
+        self.max_distance = max_distance
+        self._tokens = []  # token id -> token
+        self._token_rows = []  # token id -> row positions
+        self._prefix_tokens = {}  # token prefix -> token ids
+        self._deletes = {}  # deletion -> token prefixes
+
+        # Rows changed since the build (see patched), or None, and the
+        # tokens they added with the same structures as the built ones
+        self._overlay = None
+        self._new_tokens = []  # token id - len(_tokens) -> token
+        self._new_token_ids = {}
+        self._new_prefix_tokens = {}
+        self._new_deletes = {}
+
+        token_ids = {}
+        self._row_count = 0
+        for position, tokens in enumerate(row_tokens):
+            self._row_count += 1
+            for token in set(tokens):
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = len(self._tokens)
+                    token_ids[token] = token_id
+                    self._tokens.append(token)
+                    self._token_rows.append([position])
+                else:
+                    self._token_rows[token_id].append(position)
+
+        # Many tokens share a prefix (phones, emails), so deletions are
+        # generated once per distinct prefix
+        for token_id, token in enumerate(self._tokens):
+            prefix = token[:self.PREFIX_LENGTH]
+            prefix_ids = self._prefix_tokens.get(prefix)
+            if prefix_ids is None:
+                self._prefix_tokens[prefix] = [token_id]
+            else:
+                prefix_ids.append(token_id)
+
+        for prefix in self._prefix_tokens:
+            for deletion in _deletes(prefix, max_distance):
+                bucket = self._deletes.get(deletion)
+                if bucket is None:
+                    self._deletes[deletion] = [prefix]
+                else:
+                    bucket.append(prefix)
+
+    @staticmethod
+    def distance_for(term, max_distance):
+        """Shorter terms tolerate fewer typos, or every short word would match"""
+        if len(term) <= 2 or (term.isdigit() and len(term) < 6):
+            return 0
+        if len(term) <= 5:
+            return min(1, max_distance)
+        return max_distance
+
+    def lookup(self, term, max_distance=None):
+        """Return {token_id: distance} for indexed tokens close to term"""
+        if max_distance is None:
+            max_distance = self.max_distance
+        max_distance = min(max_distance, self.max_distance)
+
+        candidate_prefixes = set()
+        for deletion in _deletes(term[:self.PREFIX_LENGTH], max_distance):
+            candidate_prefixes.update(self._deletes.get(deletion, ()))
+            candidate_prefixes.update(self._new_deletes.get(deletion, ()))
+
+        matches = {}
+        for prefix in candidate_prefixes:
+            for token_id in self._prefix_tokens.get(prefix, ()):
+                distance = edit_distance(term, self._tokens[token_id], max_distance)
+                if distance <= max_distance:
+                    matches[token_id] = distance
+            for token_id in self._new_prefix_tokens.get(prefix, ()):
+                new_token = self._new_tokens[token_id - len(self._tokens)]
+                distance = edit_distance(term, new_token, max_distance)
+                if distance <= max_distance:
+                    matches[token_id] = distance
+        return matches
+
+    def _token_positions(self, token_id):
+        """Positions of the rows holding a token"""
+        overlay = self._overlay
+        if overlay is None:
+            return self._token_rows[token_id]
+        slots = []
+        if token_id < len(self._tokens):
+            slots = [slot for slot in self._token_rows[token_id] if slot not in overlay.stale]
+        slots.extend(overlay.value_slots.get(token_id, ()))
+        return [overlay.position(slot) for slot in slots]
+
+    def patched(self, change, pos, tokens=()):
+        """
+        Index of these rows with one changed (REPLACE or DELETE the row at
+        pos, or APPEND it at pos; tokens are its new tokens), sharing the
+        built dictionaries. None once more changes are kept than
+        rebuilding is worth
+        """
+        overlay = self._overlay.copy() if self._overlay else RowOverlay(self._row_count)
+        if len(overlay) >= overlay.MAX_CHANGES:
+            return None
+
+        patched = copy.copy(self)
+        patched._new_tokens = list(self._new_tokens)
+        patched._new_token_ids = dict(self._new_token_ids)
+        patched._new_prefix_tokens = dict(self._new_prefix_tokens)
+        patched._new_deletes = dict(self._new_deletes)
+        if change == DELETE:
+            overlay.delete(pos)
+        else:
+            token_ids = {patched._token_id(token) for token in tokens}
+            if change == APPEND:
+                overlay.append(token_ids)
+            else:
+                overlay.replace(pos, token_ids)
+        patched._overlay = overlay
+        patched._row_count = overlay.row_count
+        return patched
+
+    def _token_id(self, token):
+        """Id of a token added by a change, indexing it if it is new"""
+        token_id = self._new_token_ids.get(token)
+        if token_id is not None:
+            return token_id
+        token_id = self._new_token_ids[token] = len(self._tokens) + len(self._new_tokens)
+        self._new_tokens.append(token)
+
+        # The dictionaries are shared with the index this one was patched
+        # from: replace their lists rather than appending to them
+        prefix = token[:self.PREFIX_LENGTH]
+        prefix_ids = self._new_prefix_tokens.get(prefix, [])
+        self._new_prefix_tokens[prefix] = prefix_ids + [token_id]
+        if prefix not in self._prefix_tokens and not prefix_ids:
+            for deletion in _deletes(prefix, self.max_distance):
+                self._new_deletes[deletion] = self._new_deletes.get(deletion, []) + [prefix]
+        return token_id
+
+    def search(self, query, max_distance=None, limit=None):
+        """
+        Rank rows against a free-text query.
+
+        Every query term must match a token of the row within the allowed
+        edit distance. Rows are ranked by the sum of their best distances,
+        then by table order.
+
+        Returns:
+            list: Row positions, best match first
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        row_scores = None
+        for term in terms:
+            term_scores = {}
+            term_distance = self.distance_for(term, max_distance)
+            matches = self.lookup(term, term_distance)
+            # Worst matches first so closer tokens overwrite a row's score
+            for token_id in sorted(matches, key=matches.get, reverse=True):
+                term_scores.update(
+                    dict.fromkeys(self._token_positions(token_id), matches[token_id])
+                )
+
+            if row_scores is None:
+                row_scores = term_scores
+            else:
+                row_scores = {
+                    position: score + term_scores[position]
+                    for position, score in row_scores.items()
+                    if position in term_scores
+                }
+            if not row_scores:
+                return []
+
+        # Scores are a handful of small integers: group rows per score
+        # instead of sorting (score, position) tuples
+        scores = sorted(set(row_scores.values()))
+        if len(scores) == 1:
+            ranked = sorted(row_scores)
+        else:
+            ranked = []
+            for score in scores:
+                ranked.extend(sorted(
+                    position for position, row_score in row_scores.items()
+                    if row_score == score
+                ))
+                if limit and len(ranked) >= limit:
+                    break
+
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,72 @@
+"""
+ID lookup index for the dashboard tables.
+Maps the sequential IDs shown in a table to real database IDs and back, and
+finds rows by other unique columns (e.g. username), without scanning rows.
+"""
+from bisect import bisect_left
+
+
+class IdIndex:
+    """
+    Position index over rows whose first column is the real ID.
+
+    Sequential IDs are 1-based row positions, so they map to real IDs
+    directly; the reverse direction and the extra key columns use dicts.
+    Keys are compared as text, like the IDs in the formatted rows.
+
+    Args:
+        rows: Rows with the real ID in column 0
+        key_columns: Other columns holding unique values to look rows up by
+        ids: The real IDs of rows as ascending integers (e.g. an array).
+            When given they are binary searched instead of read from
+            every row and kept in a dict
+    """
+
+    def __init__(self, rows, key_columns=(), ids=None):
+        self._ids = ids
+        if ids is None:
+            self._real_ids = [str(row[0]) for row in rows]
+            self._positions = {real_id: pos for pos, real_id in enumerate(self._real_ids)}
+        self._key_positions = {
+            column: {
+                str(row[column]): pos
+                for pos, row in enumerate(rows)
+                if row[column] is not None
+            }
+            for column in key_columns
+        }
+
+    def __len__(self):
+        return len(self._ids if self._ids is not None else self._real_ids)
+
+    def real_id(self, sequential_id):
+        """Real ID of the row shown with sequential_id, None if out of range"""
+        try:
+            pos = int(sequential_id) - 1
+        except (TypeError, ValueError):
+            return None
+        if 0 <= pos < len(self):
+            return str(self._ids[pos]) if self._ids is not None else self._real_ids[pos]
+        return None
+
+    def sequential_id(self, real_id):
+        """Sequential ID of the row with real_id, None if absent"""
+        pos = self.position(real_id)
+        return pos + 1 if pos is not None else None
+
+    def position(self, real_id):
+        """Row position of real_id, None if absent"""
+        if self._ids is None:
+            return self._positions.get(str(real_id))
+        try:
+            key = int(real_id)
+        except (TypeError, ValueError):
+            return None
+        pos = bisect_left(self._ids, key)
+        return pos if pos < len(self._ids) and self._ids[pos] == key else None
+
+    def find(self, column, value):
+        """Row position where a key column equals value, None if absent"""
+        if value is None:
+            return None
+        return self._key_positions[column].get(str(value))
@@ -0,0 +1,145 @@
+"""
+Lazy row sequence for large tables.
+Rows are fetched one page at a time the first time they are read, so a view
+only pays for the pages it actually displays.
+"""
+import threading
+from collections.abc import Sequence
+
+
+class PagedRows(Sequence):
+    """
+    Read-only sequence of formatted rows backed by a keyset-paginated source.
+
+    Args:
+        total: Number of rows in the source
+        fetch_page: fetch_page(start_index, after_key, limit) -> (rows, keys)
+            returns the formatted rows starting at start_index, read after
+            after_key (None for the first page), and the key of each row
+        seek_key: seek_key(index) -> key of the row at index. Used to jump to
+            a page without reading the pages before it
+        page_size: Rows per page
+    """
+
+    def __init__(self, total, fetch_page, seek_key=None, page_size=200):
+        self._total = total
+        self._fetch_page = fetch_page
+        self._seek_key = seek_key
+        self.page_size = page_size
+        self._pages = {}  # page number -> rows
+        self._keys = {}  # page number -> row keys
+        # Pages are read from the Tk thread (scrolling) and the database worker
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return self._total
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._total))]
+
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("PagedRows index out of range")
+
+        page, offset = divmod(index, self.page_size)
+        rows = self._load_page(page)[0]
+        if offset >= len(rows):
+            # The source shrank since it was counted
+            raise IndexError("PagedRows index out of range")
+        return rows[offset]
+
+    def key_at(self, index):
+        """Key (real ID) of the row at index"""
+        page, offset = divmod(index, self.page_size)
+        keys = self._load_page(page)[1]
+        return keys[offset] if offset < len(keys) else None
+
+    def index_of(self, key):
+        """Index of the row with key, None if its page is not loaded"""
+        with self._lock:
+            loaded = list(self._keys.items())
+        for page, keys in loaded:
+            if key in keys:
+                return page * self.page_size + keys.index(key)
+        return None
+
+    def with_row(self, key, row):
+        """Copy with the row of key replaced. Unloaded pages are left alone"""
+        copy = self._copy(self._total)
+        index = self.index_of(key)
+        if index is not None:
+            page, offset = divmod(index, self.page_size)
+            copy._pages[page] = list(copy._pages[page])
+            copy._pages[page][offset] = row
+        return copy
+
+    def without_key(self, key):
+        """
+        Copy without the row of key. Loaded pages with later keys are dropped,
+        since their rows shift by one, and are refetched when read.
+        Keys must be ascending, as in ID order.
+        """
+        copy = self._copy(self._total - 1)
+        for page, keys in list(copy._keys.items()):
+            if keys and keys[-1] >= key:
+                del copy._pages[page]
+                del copy._keys[page]
+        return copy
+
+    def with_rows_appended(self, count=1):
+        """Copy with count rows added at the end; the old last page is refetched"""
+        copy = self._copy(self._total + count)
+        if self._total:
+            last_page = (self._total - 1) // self.page_size
+            copy._pages.pop(last_page, None)
+            copy._keys.pop(last_page, None)
+        return copy
+
+    def _copy(self, total):
+        """Copy sharing the loaded pages, with a new row count"""
+        copy = PagedRows(total, self._fetch_page, self._seek_key, self.page_size)
+        with self._lock:
+            copy._pages = dict(self._pages)
+            copy._keys = dict(self._keys)
+        return copy
+
+    @property
+    def loaded_pages(self):
+        """Numbers of the pages fetched so far"""
+        return sorted(self._pages)
+
+    def _load_page(self, page):
+        """Fetch a page unless it is already loaded"""
+        with self._lock:
+            if page in self._pages:
+                return self._pages[page], self._keys[page]
+
+            start_index = page * self.page_size
+            after_key = self._after_key(page)
+            rows, keys = self._fetch_page(start_index, after_key, self.page_size)
+
+            self._pages[page] = rows
+            self._keys[page] = keys
+            return rows, keys
+
+    def _after_key(self, page):
+        """Key of the last row before a page"""
+        if page == 0:
+            return None
+
+        previous_keys = self._keys.get(page - 1)
+        if previous_keys:
+            return previous_keys[-1]
+
+        if self._seek_key is not None:
+            return self._seek_key(page * self.page_size - 1)
+
+        # No way to jump: walk forward from the closest loaded page
+        known_page = page - 1
+        while known_page > 0 and known_page not in self._keys:
+            known_page -= 1
+        for previous_page in range(known_page, page):
+            self._load_page(previous_page)
+        return self._keys[page - 1][-1]
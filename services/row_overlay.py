@@ -0,0 +1,89 @@
+"""
+Row changes kept beside an index built over a table, so saving one row
+patches the index instead of rebuilding it from every row.
+"""
+from bisect import bisect_left, insort
+
+
+class RowOverlay:
+    """
+    Rows changed since an index was built, and where its rows are now.
+
+    The index refers to rows by slot: slot n is row n of the table it was
+    built over and appended rows take the next slots. The position of a slot
+    is its number minus the deleted slots before it. Replaced and appended
+    rows keep their values (value or token ids) here; the entries the index
+    built for replaced and deleted slots are stale.
+
+    Args:
+        row_count: Rows of the table the index was built over
+    """
+
+    # Changes kept before the index is better rebuilt
+    MAX_CHANGES = 1024
+
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.stale = set()  # slots whose built entries are out of date
+        self.value_slots = {}  # value id -> changed slots holding it
+        self._next_slot = row_count
+        self._deleted = []  # deleted slots, ascending
+        self._changed = {}  # replaced or appended slot -> its value ids
+
+    def __len__(self):
+        """Changes kept"""
+        return len(self.stale)
+
+    def copy(self):
+        copy = RowOverlay.__new__(RowOverlay)
+        copy.row_count = self.row_count
+        copy.stale = set(self.stale)
+        copy.value_slots = {value: set(slots) for value, slots in self.value_slots.items()}
+        copy._next_slot = self._next_slot
+        copy._deleted = list(self._deleted)
+        copy._changed = dict(self._changed)
+        return copy
+
+    def slot(self, pos):
+        """Slot of the row now at pos"""
+        slot = pos
+        for deleted in self._deleted:
+            if deleted > slot:
+                break
+            slot += 1
+        return slot
+
+    def position(self, slot):
+        """Position of the row in slot (which must not be deleted)"""
+        return slot - bisect_left(self._deleted, slot) if self._deleted else slot
+
+    def replace(self, pos, value_ids):
+        slot = self.slot(pos)
+        self._forget(slot)
+        self._keep(slot, value_ids)
+
+    def delete(self, pos):
+        slot = self.slot(pos)
+        self._forget(slot)
+        self.stale.add(slot)
+        insort(self._deleted, slot)
+        self.row_count -= 1
+
+    def append(self, value_ids):
+        slot = self._next_slot
+        self._next_slot += 1
+        self.row_count += 1
+        self._keep(slot, value_ids)
+
+    def _keep(self, slot, value_ids):
+        self.stale.add(slot)
+        self._changed[slot] = value_ids
+        for value_id in value_ids:
+            self.value_slots.setdefault(value_id, set()).add(slot)
+
+    def _forget(self, slot):
+        for value_id in self._changed.pop(slot, ()):
+            slots = self.value_slots[value_id]
+            slots.discard(slot)
+            if not slots:
+                del self.value_slots[value_id]
@@ -0,0 +1,211 @@
+"""
+In-memory search index for the dashboard tables.
+Answers the same substring queries as a full scan of every cell, without
+touching every row on each keystroke.
+"""
+import copy
+from array import array
+
+from services.column_table import APPEND, DELETE
+from services.row_overlay import RowOverlay
+
+
+class SearchIndex:
+    """
+    Gram index over the distinct cell values of a table.
+
+    Every distinct lowercased cell value is indexed by all of its 1, 2 and 3
+    character grams. A query of up to 3 characters is answered directly from
+    its gram posting list; longer queries read the posting list of their
+    rarest trigram and verify those candidates only. Matching values are then
+    mapped to the rows that contain them.
+
+    patched() applies a change to one row without rebuilding: the changed
+    row's values are kept in a RowOverlay (new distinct values in a small
+    dict searched by scanning) until too many changes pile up.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, rows):
+        self._row_count = len(rows)
+        self._values = []  # value id -> lowercased cell text
+        self._postings = {}  # gram -> array of value ids (ascending)
+        self._value_offsets = array("I")  # value id -> start in _value_rows
+        self._value_rows = array("I")  # row positions grouped by value id
+
+        # Incremental typing: (previous query, values matching it), set as
+        # one tuple since searches may run on several threads
+        self._last = (None, None)
+
+        # Rows changed since the build (see patched), or None
+        self._overlay = None
+        self._new_values = {}  # text -> value id, for values added by changes
+
+        self._build(rows)
+
+    def __len__(self):
+        return self._row_count
+
+    def _build(self, rows):
+        """Index the distinct values of every cell"""
+        value_ids = {}
+        row_values = []
+
+        for row in rows:
+            ids = set()
+            for cell in row:
+                text = str(cell).lower()
+                value_id = value_ids.get(text)
+                if value_id is None:
+                    value_id = len(self._values)
+                    value_ids[text] = value_id
+                    self._values.append(text)
+                ids.add(value_id)
+            row_values.append(ids)
+
+        # Value -> rows, stored as one flat array with offsets (CSR layout)
+        counts = [0] * (len(self._values) + 1)
+        for ids in row_values:
+            for value_id in ids:
+                counts[value_id + 1] += 1
+        for value_id in range(len(self._values)):
+            counts[value_id + 1] += counts[value_id]
+        self._value_offsets = array("I", counts)
+
+        fill = counts[:-1]
+        value_rows = [0] * counts[-1]
+        for position, ids in enumerate(row_values):
+            for value_id in ids:
+                value_rows[fill[value_id]] = position
+                fill[value_id] += 1
+        self._value_rows = array("I", value_rows)
+
+        # Gram -> values
+        postings = {}
+        for value_id, text in enumerate(self._values):
+            for gram in self._grams(text):
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [value_id]
+                else:
+                    posting.append(value_id)
+        self._postings = {gram: array("I", ids) for gram, ids in postings.items()}
+
+    def _grams(self, text):
+        """All distinct substrings of text with length 1..GRAM_SIZE"""
+        grams = set()
+        length = len(text)
+        for size in range(1, self.GRAM_SIZE + 1):
+            for start in range(length - size + 1):
+                grams.add(text[start:start + size])
+        return grams
+
+    def match_values(self, query):
+        """Return the ids of the distinct values that contain query"""
+        query_lower = query.lower()
+        matches = self._match_built_values(query_lower)
+        if self._new_values:
+            matches = list(matches) + [
+                value_id for text, value_id in self._new_values.items() if query_lower in text
+            ]
+        return matches
+
+    def _match_built_values(self, query_lower):
+        size = self.GRAM_SIZE
+
+        if len(query_lower) <= size:
+            matches = self._postings.get(query_lower, ())
+        else:
+            candidates = None
+            for start in range(len(query_lower) - size + 1):
+                posting = self._postings.get(query_lower[start:start + size])
+                if posting is None:
+                    return []
+                if candidates is None or len(posting) < len(candidates):
+                    candidates = posting
+
+            # While typing forward, the previous matches are a smaller superset
+            last_query, last_values = self._last
+            if (
+                last_query
+                and last_query in query_lower
+                and len(last_values) < len(candidates)
+            ):
+                candidates = last_values
+
+            values = self._values
+            matches = [vid for vid in candidates if query_lower in values[vid]]
+
+        self._last = (query_lower, matches)
+        return matches
+
+    def search(self, query):
+        """Return the positions of the rows where any cell contains query"""
+        if not query:
+            return list(range(self._row_count))
+
+        matches = self.match_values(query)
+        if not matches:
+            return []
+        if self._overlay is not None:
+            return self._search_overlay(matches)
+
+        offsets = self._value_offsets
+        value_rows = self._value_rows
+        if len(matches) == 1:
+            value_id = matches[0]
+            return list(value_rows[offsets[value_id]:offsets[value_id + 1]])
+
+        positions = set()
+        for value_id in matches:
+            positions.update(value_rows[offsets[value_id]:offsets[value_id + 1]])
+        return sorted(positions)
+
+    def _search_overlay(self, matches):
+        overlay = self._overlay
+        offsets = self._value_offsets
+        value_rows = self._value_rows
+        built_count = len(self._values)
+
+        slots = set()
+        for value_id in matches:
+            if value_id < built_count:
+                slots.update(value_rows[offsets[value_id]:offsets[value_id + 1]])
+        slots -= overlay.stale
+        for value_id in matches:
+            slots.update(overlay.value_slots.get(value_id, ()))
+        # Slots are in row order
+        return [overlay.position(slot) for slot in sorted(slots)]
+
+    def patched(self, change, pos, row=None):
+        """
+        Index of these rows with one changed (REPLACE or DELETE the row at
+        pos, or APPEND it at pos; row is its new cells), sharing the built
+        postings. None once more changes are kept than rebuilding is worth
+        """
+        overlay = self._overlay.copy() if self._overlay else RowOverlay(self._row_count)
+        if len(overlay) >= overlay.MAX_CHANGES:
+            return None
+
+        patched = copy.copy(self)
+        patched._last = (None, None)
+        patched._new_values = dict(self._new_values)
+        if change == DELETE:
+            overlay.delete(pos)
+        else:
+            value_ids = set()
+            for cell in row:
+                text = str(cell).lower()
+                value_id = patched._new_values.get(text)
+                if value_id is None:
+                    value_id = len(self._values) + len(patched._new_values)
+                    patched._new_values[text] = value_id
+                value_ids.add(value_id)
+            if change == APPEND:
+                overlay.append(value_ids)
+            else:
+                overlay.replace(pos, value_ids)
+        patched._overlay = overlay
+        patched._row_count = overlay.row_count
+        return patched
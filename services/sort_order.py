@@ -0,0 +1,165 @@
+"""
+Sort orders for the dashboard tables.
+Sorts the rows of a ColumnTable by typed keys (hour timestamps, ranked
+text and categories) rather than by the formatted cells, and keeps every
+order it builds so flipping or refining a sort does not start over.
+"""
+import threading
+from array import array
+
+from services.column_table import DELETE, REPLACE
+
+
+def _reverse_runs(ascending, keys):
+    """
+    Descending order from an ascending one in O(n): runs of equal keys are
+    reversed as a whole, so rows inside a run keep their (stable) order
+    """
+    descending = array("I")
+    end = len(ascending)
+    while end:
+        start = end - 1
+        key = keys[ascending[start]]
+        while start and keys[ascending[start - 1]] == key:
+            start -= 1
+        descending.extend(ascending[start:end])
+        end = start
+    return descending
+
+
+class _Descending:
+    """Sort key that compares the other way, for descending columns"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+
+class SortOrder:
+    """
+    Row permutations of one ColumnTable, built on demand and kept until the
+    table changes. patched() carries them over to a copy of the table with
+    one row changed by moving that row only.
+
+    A sort spec is a sequence of (column, descending) pairs, most significant
+    first, over the displayed columns. Sorts are stable: rows equal in every
+    sorted column keep their table order (ID order).
+
+    Args:
+        table: ColumnTable whose rows are sorted
+        columns: For each displayed column, the table column holding its
+            sort key, or None to sort that column by row position
+    """
+
+    # Orders kept per table before the oldest ones are dropped
+    MAX_ORDERS = 32
+
+    def __init__(self, table, columns):
+        self.table = table
+        self._columns = tuple(columns)
+        self._keys = {}  # displayed column -> sort key per row
+        self._orders = {}  # spec -> array of positions
+        self._ranks = {}  # spec -> position -> index in the order
+        # Orders are built without it, it only guards dropping old ones
+        self._lock = threading.Lock()
+
+    def keys(self, column):
+        """Sort key of every row for a displayed column"""
+        keys = self._keys.get(column)
+        if keys is None:
+            name = self._columns[column]
+            keys = range(len(self.table)) if name is None else self.table.sort_keys(name)
+            self._keys[column] = keys
+        return keys
+
+    def order(self, spec):
+        """Table positions of all rows sorted by spec"""
+        spec = tuple((int(column), bool(descending)) for column, descending in spec)
+        if not spec:
+            return range(len(self.table))
+
+        order = self._orders.get(spec)
+        if order is None:
+            order = self._build(spec)
+            with self._lock:
+                if len(self._orders) >= self.MAX_ORDERS and spec not in self._orders:
+                    del self._orders[next(iter(self._orders))]
+                    self._ranks.clear()
+                self._orders[spec] = order
+        return order
+
+    def sort(self, positions, spec):
+        """The given table positions (e.g. search results) sorted by spec"""
+        spec = tuple((int(column), bool(descending)) for column, descending in spec)
+        if not spec:
+            return positions
+
+        rank = self._ranks.get(spec)
+        if rank is None:
+            order = self.order(spec)
+            rank = array("I", [0]) * len(order)
+            for index, pos in enumerate(order):
+                rank[pos] = index
+            self._ranks[spec] = rank
+        return array("I", sorted(positions, key=rank.__getitem__))
+
+    def _build(self, spec):
+        (column, descending), rest = spec[0], spec[1:]
+        keys = self.keys(column)
+        if descending:
+            return _reverse_runs(self.order(((column, False),) + rest), keys)
+        if rest:
+            # Stable sort: rows equal in this column stay in the order of the rest
+            return array("I", sorted(self.order(rest), key=keys.__getitem__))
+        return array("I", sorted(range(len(self.table)), key=keys.__getitem__))
+
+    def patched(self, change, pos, table):
+        """
+        Sort orders of table, a copy of this one with one row changed
+        (REPLACE or DELETE the row at pos, or APPEND it at pos): the kept
+        orders are updated for that row instead of sorted again
+        """
+        patched = SortOrder(table, self._columns)
+        with self._lock:
+            orders = list(self._orders.items())
+
+        for spec, order in orders:
+            if change == DELETE:
+                # Later rows move up one position
+                order = array("I", [other - (other > pos) for other in order if other != pos])
+            else:
+                order = order[:]
+                if change == REPLACE:
+                    del order[self._bisect(self.table, spec, order, pos)]
+                order.insert(self._bisect(table, spec, order, pos), pos)
+            patched._orders[spec] = order
+        return patched
+
+    def _row_key(self, table, spec, pos):
+        """Key of a row in the order of spec; ties keep position order"""
+        key = []
+        for column, descending in spec:
+            name = self._columns[column]
+            value = pos if name is None else table.sort_key(name, pos)
+            key.append(_Descending(value) if descending else value)
+        key.append(pos)
+        return tuple(key)
+
+    def _bisect(self, table, spec, order, pos):
+        """Index of order (sorted by spec) where the row of table at pos goes"""
+        key = self._row_key(table, spec, pos)
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._row_key(table, spec, order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,43 @@
+"""Fixtures for tests that run crud functions against a real SQLite file"""
+import logging
+import os
+import tempfile
+import unittest
+
+from controllers import database
+from controllers.database import create_db_engine
+from migrations import migrate
+from models.trainer import Trainer
+from models.user import User
+
+
+def make_user(idx, email=None):
+    return User(
+        name=f"User{idx}", lastname="Test", age=30, email=email or f"user{idx}@test.com",
+        phone="555", membership_type="basic",
+    )
+
+
+def make_trainer(idx):
+    return Trainer(
+        name=f"Trainer{idx}", lastname="Test", age=30, email=f"trainer{idx}@test.com",
+        phone="555", specialty="Yoga", start_time="08:00", end_time="10:00",
+    )
+
+
+class TempDatabaseTest(unittest.TestCase):
+    """Binds the app's sessions to a fresh SQLite file for each test"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.engine = create_db_engine(f"sqlite:///{os.path.join(directory.name, 'test.db')}")
+        self.addCleanup(self.engine.dispose)
+        migrate(self.engine)
+
+        database.SessionLocal.configure(bind=self.engine)
+        self.addCleanup(database.SessionLocal.configure, bind=database.engine)
@@ -0,0 +1,145 @@
+import unittest
+
+from services.column_table import (
+    CATEGORY,
+    INT,
+    OBJECT,
+    PACKED,
+    POOLED,
+    ColumnTable,
+    TableView,
+    _Packed,
+)
+
+SCHEMA = (
+    ("id", INT),
+    ("name", POOLED),
+    ("plan", CATEGORY),
+    ("email", PACKED),
+    ("extra", OBJECT),
+)
+
+
+def make_table():
+    table = ColumnTable(SCHEMA)
+    table.extend([
+        (1, "Ana", "basic", "ana@x.com", None),
+        (2, "Luis", "vip", None, {"a": 1}),
+        (3, "Ana", "basic", "ana3@x.com", None),
+    ])
+    return table
+
+
+class PackedTest(unittest.TestCase):
+    def test_values_round_trip(self):
+        packed = _Packed()
+        for value in ("ana@x.com", None, "", "ñandú@x.com"):
+            packed.append(value)
+        self.assertEqual([packed[pos] for pos in range(4)], ["ana@x.com", None, "", "ñandú@x.com"])
+
+    def test_copy_compacts_when_most_of_the_buffer_is_garbage(self):
+        packed = _Packed()
+        for pos in range(4):
+            packed.append(f"user{pos}@example.com")
+        for pos in range(3):
+            packed[pos] = "x"
+        del packed[3]
+
+        self.assertGreater(packed.garbage * 2, len(packed.buffer))
+        copy = packed.copy()
+        self.assertEqual(copy.garbage, 0)
+        self.assertEqual(bytes(copy.buffer), b"xxx")
+        self.assertEqual([copy[pos] for pos in range(len(copy))], ["x", "x", "x"])
+
+    def test_copy_keeps_the_buffer_while_little_is_garbage(self):
+        packed = _Packed()
+        for pos in range(4):
+            packed.append(f"user{pos}@example.com")
+        packed[0] = "user0@example.org"
+
+        copy = packed.copy()
+        self.assertEqual(copy.garbage, packed.garbage)
+        self.assertEqual(copy.buffer, packed.buffer)
+        copy[1] = None  # Independent of the original
+        self.assertEqual(packed[1], "user1@example.com")
+
+
+class ColumnTableTest(unittest.TestCase):
+    def test_records_round_trip(self):
+        table = make_table()
+        self.assertEqual(table.record(1), (2, "Luis", "vip", None, {"a": 1}))
+        self.assertEqual(table.categories("plan"), ["basic", "vip"])
+        self.assertIs(table.value("name", 0), table.value("name", 2))  # Pooled
+
+    def test_copy_is_independent(self):
+        table = make_table()
+        copy = table.copy()
+        copy.replace(0, (1, "Eva", "vip", "eva@x.com", None))
+        copy.delete(2)
+        self.assertEqual(table.record(0), (1, "Ana", "basic", "ana@x.com", None))
+        self.assertEqual(len(table), 3)
+        self.assertEqual(len(copy), 2)
+
+    def test_sorted_ids(self):
+        table = make_table()
+        self.assertEqual(list(table.sorted_ids()), [1, 2, 3])
+        table.append((2, "Eva", "vip", None, None))
+        self.assertIsNone(table.sorted_ids())
+
+    def test_sort_keys_rank_values(self):
+        table = ColumnTable((("id", INT), ("name", POOLED), ("plan", CATEGORY)))
+        table.extend([(1, "luis", "VIP"), (2, "Ana", "basic"), (3, None, "Basic"), (4, "ana", None)])
+        self.assertEqual(list(table.sort_keys("name")), [2, 1, 0, 1])
+        self.assertEqual(list(table.sort_keys("plan")), [2, 1, 1, 0])
+
+
+class SmallChunks(ColumnTable):
+    CHUNK_ROWS = 2
+
+
+class ChunkTest(unittest.TestCase):
+    def make_table(self):
+        table = SmallChunks(SCHEMA)
+        table.extend((pos, f"n{pos}", "basic", f"{pos}@x.com", None) for pos in range(1, 8))
+        return table
+
+    def test_rows_across_chunks(self):
+        table = self.make_table()
+        table.delete(2)  # Empties no chunk
+        table.delete(2)  # Drops the chunk of rows 3 and 4
+        table.append((9, "n9", "vip", None, None))
+        self.assertEqual([table.record(pos)[0] for pos in range(len(table))], [1, 2, 5, 6, 7, 9])
+        self.assertEqual(list(table.sorted_ids()), [1, 2, 5, 6, 7, 9])
+        self.assertEqual(table.sorted_ids()[-1], 9)
+        self.assertEqual(list(table.codes("plan")), [0, 0, 0, 0, 0, 1])
+
+    def test_copies_share_chunks_until_written(self):
+        table = self.make_table()
+        copy = table.copy()
+        copy.replace(4, (5, "eva", "vip", "eva@x.com", None))
+        self.assertIs(copy._chunks[0], table._chunks[0])
+        self.assertIsNot(copy._chunks[2], table._chunks[2])
+
+        table.delete(0)  # The original copies shared chunks too
+        self.assertEqual(copy.record(0)[1], "n1")
+        self.assertEqual(table.record(3)[1], "n5")
+        self.assertEqual(copy.record(4)[1], "eva")
+
+
+class TableViewTest(unittest.TestCase):
+    def test_views_project_and_select_rows(self):
+        view = TableView(make_table(), lambda record, seq: [str(seq), record[1]])
+        self.assertEqual(list(view), [["1", "Ana"], ["2", "Luis"], ["3", "Ana"]])
+        self.assertEqual(view[-1], ["3", "Ana"])
+
+        selected = view.select([2, 0])
+        self.assertEqual(list(selected), [["3", "Ana"], ["1", "Ana"]])
+        self.assertEqual(list(selected.select([1])), [["1", "Ana"]])
+        self.assertEqual(list(selected.positions()), [2, 0])
+        self.assertIsNone(selected.sorted_ids())
+        with self.assertRaises(IndexError):
+            selected[2]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from services.column_table import APPEND, CATEGORY, DELETE, INT, REPLACE, ColumnTable, TableView
+from services.facet_index import FacetIndex
+
+RECORDS = [
+    (1, "basic", "Active"),
+    (2, "vip", "Active"),
+    (3, "Basic", "Frozen"),
+    (4, "premium", "Active"),
+    (5, "vip", "Frozen"),
+    (6, "basic", "Active"),
+]
+
+
+COLUMNS = {1: "plan", 2: "status"}
+
+
+def make_rows(records):
+    table = ColumnTable((("id", INT), ("plan", CATEGORY), ("status", CATEGORY)))
+    table.extend(records)
+    return TableView(table, lambda record, seq: [str(seq), record[1].capitalize(), record[2]])
+
+
+def make_index():
+    return FacetIndex(make_rows(RECORDS), COLUMNS)
+
+
+class FacetIndexTest(unittest.TestCase):
+    def test_values_are_the_displayed_ones(self):
+        index = make_index()
+        # 'basic' and 'Basic' are shown the same way and share one value
+        self.assertEqual(index.values(1), ["Basic", "Premium", "Vip"])
+        self.assertEqual(index.values(2), ["Active", "Frozen"])
+
+    def test_selection_ors_within_and_ands_across_columns(self):
+        index = make_index()
+        self.assertEqual(list(index.positions(index.mask({}))), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(list(index.positions(index.mask({1: ["Basic"]}))), [0, 2, 5])
+        mask = index.mask({1: ["Basic", "Vip"], 2: ["Frozen"]})
+        self.assertEqual(list(index.positions(mask)), [2, 4])
+        self.assertEqual(list(index.positions(index.mask({1: ["Gold"]}))), [])
+
+    def test_counts_ignore_the_own_column_selection(self):
+        index = make_index()
+        counts = index.counts({1: ["Vip"], 2: ["Active"]})
+        # Plans are counted among Active rows, statuses among Vip rows
+        self.assertEqual(counts[1], {"Basic": 2, "Premium": 1, "Vip": 1})
+        self.assertEqual(counts[2], {"Active": 1, "Frozen": 1})
+
+    def test_counts_and_positions_within_a_base_mask(self):
+        index = make_index()
+        base = index.mask_of([5, 1, 2])  # e.g. text search results
+        self.assertEqual(index.counts({}, base)[1], {"Basic": 2, "Premium": 0, "Vip": 1})
+        mask = index.mask({1: ["Basic"]}, base)
+        # Search ranking is kept
+        self.assertEqual(list(index.keep([5, 1, 2], mask)), [5, 2])
+
+    def test_patched_matches_a_rebuild(self):
+        index = make_index()
+        records = list(RECORDS)
+        changes = [
+            (REPLACE, 3, (4, "gold", "Frozen")),  # Premium is gone
+            (DELETE, 1, None),
+            (APPEND, 5, (7, "vip", "Active")),
+        ]
+        for change, pos, record in changes:
+            if change == DELETE:
+                del records[pos]
+            elif change == APPEND:
+                records.append(record)
+            else:
+                records[pos] = record
+            rows = make_rows(records)
+            index = index.patched(change, pos, rows)
+            rebuilt = FacetIndex(rows, COLUMNS)
+            self.assertEqual(index.values(1), rebuilt.values(1))
+            for selection in ({}, {1: ["Vip"]}, {1: ["Basic"], 2: ["Active"]}):
+                self.assertEqual(index.counts(selection), rebuilt.counts(selection))
+                self.assertEqual(
+                    list(index.positions(index.mask(selection))),
+                    list(rebuilt.positions(rebuilt.mask(selection))),
+                )
+
+    def test_empty_table(self):
+        table = ColumnTable((("id", INT), ("plan", CATEGORY)))
+        index = FacetIndex(TableView(table, lambda record, seq: list(record)), {1: "plan"})
+        self.assertEqual(index.counts({}), {1: {}})
+        self.assertEqual(list(index.positions(index.mask({}))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
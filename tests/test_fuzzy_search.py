@@ -0,0 +1,63 @@
+import unittest
+
+from services.column_table import APPEND, DELETE, REPLACE
+from services.fuzzy_search import FuzzyIndex, edit_distance, tokenize
+
+
+class EditDistanceTest(unittest.TestCase):
+    def test_distances_within_the_bound(self):
+        self.assertEqual(edit_distance("vazquez", "vazquez", 2), 0)
+        self.assertEqual(edit_distance("vazques", "vazquez", 2), 1)  # substitution
+        self.assertEqual(edit_distance("vazqeuz", "vazquez", 2), 1)  # transposition
+        self.assertEqual(edit_distance("vaquez", "vazquez", 2), 1)  # deletion
+        self.assertEqual(edit_distance("vazques", "vazqeuz", 2), 2)
+        self.assertEqual(edit_distance("vzquz", "vazquez", 2), 2)
+
+    def test_over_the_bound_is_max_distance_plus_one(self):
+        self.assertEqual(edit_distance("vazquez", "perez", 2), 3)
+        self.assertEqual(edit_distance("vaz", "vazquez", 2), 3)  # length gap
+        self.assertEqual(edit_distance("abcd", "badc", 1), 2)
+
+    def test_optimal_string_alignment_not_full_damerau(self):
+        # "ca" -> "abc" is 2 with unrestricted transpositions, 3 in OSA
+        self.assertEqual(edit_distance("ca", "abc", 3), 3)
+
+
+class FuzzyIndexTest(unittest.TestCase):
+    def setUp(self):
+        rows = [
+            ["Ana Vázquez", "ana.vazquez@gmail.com"],
+            ["Luis Pérez", "luis@fitzone.com"],
+            ["Eva Vasquez", "eva@fitzone.com"],
+        ]
+        self.index = FuzzyIndex(
+            [[token for cell in row for token in tokenize(cell)] for row in rows], 2
+        )
+
+    def test_ranks_closest_rows_first(self):
+        self.assertEqual(self.index.search("vazquez"), [0, 2])
+        self.assertEqual(self.index.search("Vazques"), [0, 2])
+
+    def test_every_term_must_match(self):
+        self.assertEqual(self.index.search("eva vazquez"), [2])
+        self.assertEqual(self.index.search("nobody"), [])
+
+    def test_max_distance_zero_is_exact(self):
+        self.assertEqual(self.index.search("vazques", max_distance=0), [])
+
+    def test_patched_rows(self):
+        index = self.index.patched(REPLACE, 1, ["luis", "vazquez"])
+        self.assertEqual(index.search("vazquez"), [0, 1, 2])
+        self.assertEqual(self.index.search("vazquez"), [0, 2])  # Unchanged
+
+        index = index.patched(DELETE, 0)
+        self.assertEqual(index.search("vazquez"), [0, 1])
+        self.assertEqual(index.search("luis"), [0])
+
+        index = index.patched(APPEND, 2, ["zoe", "wolkowicz"])
+        self.assertEqual(index.search("wolkowitz"), [2])
+        self.assertEqual(index.search("eva"), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
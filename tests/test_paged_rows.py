@@ -0,0 +1,170 @@
+import unittest
+
+from services.paged_rows import PagedRows
+
+PAGE_SIZE = 10
+
+
+class FakeSource:
+    """Keyset-paginated rows over ascending keys with gaps, like real IDs"""
+
+    def __init__(self, count):
+        self.keys = [key * 3 for key in range(1, count + 1)]
+        self.names = {key: f"Name{key}" for key in self.keys}
+        self.fetches = []  # (start_index, after_key) of every fetch_page call
+        self.seeks = []
+
+    def row(self, key):
+        return [str(key), self.names[key]]
+
+    def rows(self):
+        return [self.row(key) for key in self.keys]
+
+    def fetch_page(self, start_index, after_key, limit):
+        self.fetches.append((start_index, after_key))
+        keys = [key for key in self.keys if after_key is None or key > after_key][:limit]
+        return [self.row(key) for key in keys], keys
+
+    def seek_key(self, index):
+        self.seeks.append(index)
+        return self.keys[index]
+
+    def paged(self, seek=True):
+        return PagedRows(
+            len(self.keys), self.fetch_page, self.seek_key if seek else None, PAGE_SIZE
+        )
+
+
+def paged_keys(paged):
+    return [paged.key_at(index) for index in range(len(paged))]
+
+
+class PagedRowsTest(unittest.TestCase):
+    def assertMatchesSource(self, paged, source):
+        self.assertEqual(list(paged), source.rows())
+        self.assertEqual(paged_keys(paged), source.keys)
+
+    def test_reads_every_row_once_per_page(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        self.assertMatchesSource(paged, source)
+        self.assertEqual(paged.loaded_pages, [0, 1, 2, 3])
+        self.assertEqual(len(source.fetches), 4)
+        self.assertEqual(paged[-1], source.row(105))
+        self.assertEqual(paged[8:12], source.rows()[8:12])
+        with self.assertRaises(IndexError):
+            paged[35]
+
+    def test_index_of_only_finds_loaded_rows(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        paged[0]
+        self.assertEqual(paged.index_of(30), 9)
+        self.assertIsNone(paged.index_of(33))
+
+    def test_with_row_replaces_a_loaded_row(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        list(paged)
+
+        source.names[45] = "Changed"
+        updated = paged.with_row(45, source.row(45))
+
+        self.assertMatchesSource(updated, source)
+        self.assertEqual(paged[14], ["45", "Name45"])
+        self.assertEqual(len(source.fetches), 4)
+
+    def test_with_row_leaves_unloaded_pages_to_the_source(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        paged[0]
+
+        source.names[45] = "Changed"
+        updated = paged.with_row(45, source.row(45))
+
+        self.assertEqual(updated.loaded_pages, [0])
+        self.assertMatchesSource(updated, source)
+
+    def test_delete_in_an_early_page(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        list(paged)
+
+        source.keys.remove(12)
+        updated = paged.without_key(12)
+
+        self.assertEqual(len(updated), 34)
+        self.assertEqual(updated.loaded_pages, [])
+        self.assertMatchesSource(updated, source)
+        # The original keeps its rows
+        self.assertEqual(paged[3], ["12", "Name12"])
+        self.assertEqual(len(paged), 35)
+
+    def test_delete_keeps_pages_before_the_key(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        list(paged)
+
+        source.keys.remove(75)
+        updated = paged.without_key(75)
+
+        self.assertEqual(updated.loaded_pages, [0, 1])
+        self.assertMatchesSource(updated, source)
+
+    def test_append_to_a_partial_last_page(self):
+        source = FakeSource(35)
+        paged = source.paged()
+        list(paged)
+
+        source.keys.extend([200, 201, 202, 203, 204, 205, 206])
+        source.names.update({key: f"Name{key}" for key in source.keys[35:]})
+        updated = paged.with_rows_appended(7)
+
+        self.assertEqual(len(updated), 42)
+        self.assertEqual(updated.loaded_pages, [0, 1, 2])
+        self.assertMatchesSource(updated, source)
+
+    def test_append_to_an_empty_table(self):
+        source = FakeSource(0)
+        paged = source.paged()
+
+        source.keys.append(3)
+        source.names[3] = "Name3"
+        updated = paged.with_rows_appended()
+
+        self.assertMatchesSource(updated, source)
+
+    def test_jump_with_seek_key_reads_one_page(self):
+        source = FakeSource(35)
+        paged = source.paged()
+
+        self.assertEqual(paged[32], source.row(99))
+        self.assertEqual(source.seeks, [29])
+        self.assertEqual(source.fetches, [(30, 90)])
+        self.assertEqual(paged.loaded_pages, [3])
+
+    def test_jump_without_seek_key_walks_from_the_closest_loaded_page(self):
+        source = FakeSource(55)
+        paged = source.paged(seek=False)
+        paged[12]
+        source.fetches.clear()
+
+        self.assertEqual(paged[42], source.row(129))
+        self.assertEqual(source.fetches, [(20, 60), (30, 90), (40, 120)])
+        self.assertEqual(paged.loaded_pages, [0, 1, 2, 3, 4])
+        self.assertMatchesSource(paged, source)
+
+    def test_jump_without_seek_key_after_a_delete(self):
+        source = FakeSource(55)
+        paged = source.paged(seek=False)
+        paged[0]
+
+        source.keys.remove(60)
+        updated = paged.without_key(60)
+
+        self.assertEqual(updated[50], source.row(source.keys[50]))
+        self.assertMatchesSource(updated, source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from controllers.crud import create_admin, create_trainer, link_trainer_to_admin
+from controllers.query_counter import assert_max_queries
+from models.admin import Admin
+from services.data_formatter import DataFormatter
+from tests.database_case import TempDatabaseTest, make_trainer
+
+# BEGIN plus the one SELECT that reads every row with its association
+VIEW_QUERY_BUDGET = 2
+
+
+class ViewQueryBudgetTest(TempDatabaseTest):
+    def setUp(self):
+        super().setUp()
+        for idx in range(6):
+            trainer = create_trainer(make_trainer(idx))
+            if idx % 2 == 0:
+                manager = create_admin(Admin(username=f"manager{idx}", password="pw", role="manager"))
+                link_trainer_to_admin(trainer.unique_id, manager.username)
+        create_admin(Admin(username="admin", password="pw", role="admin"))
+        self.formatter = DataFormatter()
+
+    def test_admin_views_read_admins_and_trainers_in_one_query(self):
+        with assert_max_queries(VIEW_QUERY_BUDGET, bind=self.engine):
+            rows, extended_rows = self.formatter.get_admin_views()
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(len(extended_rows), 4)
+
+    def test_trainer_views_read_trainers_and_managers_in_one_query(self):
+        with assert_max_queries(VIEW_QUERY_BUDGET, bind=self.engine):
+            rows, rows_with_real_ids, search_terms = self.formatter.get_trainer_views()
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len(search_terms), 6)
+
+    def test_budget_is_enforced(self):
+        with self.assertRaises(AssertionError):
+            with assert_max_queries(1, bind=self.engine):
+                self.formatter.get_trainer_views()
+
+
+if __name__ == "__main__":
+    unittest.main()
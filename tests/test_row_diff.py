@@ -0,0 +1,43 @@
+import unittest
+
+from utils.row_diff import diff_rows
+
+
+class DiffRowsTest(unittest.TestCase):
+    def test_unchanged_rows_need_no_operations(self):
+        rows = [["1", "Ana"], ["2", "Luis"]]
+        diff = diff_rows(rows, [list(row) for row in rows])
+        self.assertEqual(diff, {"removed": [], "inserted": [], "moved": [], "changed": []})
+
+    def test_insert_shifts_later_rows(self):
+        old = [["1", "Ana"], ["3", "Eva"]]
+        new = [["1", "Ana"], ["2", "Luis"], ["3", "Eva"]]
+        diff = diff_rows(old, new)
+        self.assertEqual(diff["inserted"], [(1, "2")])
+        self.assertEqual(diff["moved"], [(1, 2, "3")])
+        self.assertEqual(diff["removed"], [])
+        self.assertEqual(diff["changed"], [])
+
+    def test_reorder_and_change(self):
+        old = [["1", "Ana"], ["2", "Luis"], ["3", "Eva"]]
+        new = [["3", "Eva"], ["1", "Ana María"], ["2", "Luis"]]
+        diff = diff_rows(old, new)
+        self.assertEqual(diff["moved"], [(2, 0, "3"), (0, 1, "1"), (1, 2, "2")])
+        self.assertEqual(diff["changed"], [(1, "1")])
+        self.assertEqual(diff["inserted"], [])
+
+    def test_removed_rows(self):
+        old = [["1", "Ana"], ["2", "Luis"], ["3", "Eva"]]
+        diff = diff_rows(old, [["1", "Ana"], ["3", "Eva"]])
+        self.assertEqual(diff["removed"], ["2"])
+        self.assertEqual(diff["moved"], [(2, 1, "3")])
+
+    def test_duplicate_keys_are_rejected(self):
+        with self.assertRaises(ValueError):
+            diff_rows([["1", "Ana"], ["1", "Eva"]], [])
+        with self.assertRaises(ValueError):
+            diff_rows([], [["1", "Ana"], ["1", "Eva"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from services.column_table import APPEND, DELETE, REPLACE
+from services.row_overlay import RowOverlay
+from services.search_index import SearchIndex
+
+
+ROWS = [
+    ["1", "Ana Vázquez", "Premium"],
+    ["2", "Luis Pérez", "Basic"],
+    ["3", "Eva Vaz", "premium"],
+    ["4", "Mario Luna", "VIP"],
+]
+
+
+def scan(rows, query):
+    """The full scan the index replaces"""
+    query = query.lower()
+    return [
+        pos for pos, row in enumerate(rows)
+        if any(query in str(cell).lower() for cell in row)
+    ]
+
+
+class SearchIndexTest(unittest.TestCase):
+    def test_matches_a_full_scan(self):
+        index = SearchIndex(ROWS)
+        for query in ("a", "va", "vaz", "premium", "PREM", "luna", "z", "xyz", "ui", "4"):
+            self.assertEqual(sorted(index.search(query)), scan(ROWS, query), query)
+
+    def test_typing_forward_keeps_results_exact(self):
+        index = SearchIndex(ROWS)
+        for query in ("v", "va", "vaz", "vazq", "vaz"):
+            self.assertEqual(sorted(index.search(query)), scan(ROWS, query), query)
+
+    def test_empty_query_returns_every_row(self):
+        self.assertEqual(SearchIndex(ROWS).search(""), [0, 1, 2, 3])
+
+    def test_patched_matches_a_full_scan(self):
+        index = SearchIndex(ROWS)
+        rows = [list(row) for row in ROWS]
+        changes = [
+            (REPLACE, 1, ["2", "Luis Vaz", "Gold"]),
+            (DELETE, 0, None),
+            (APPEND, 3, ["4", "Ana Gold", "Premium"]),
+            (REPLACE, 3, ["4", "Zoe", "Basic"]),
+            (DELETE, 1, None),
+        ]
+        for change, pos, row in changes:
+            if change == DELETE:
+                del rows[pos]
+            elif change == APPEND:
+                rows.append(row)
+            else:
+                rows[pos] = row
+            index = index.patched(change, pos, row)
+            for query in ("a", "vaz", "gold", "premium", "zoe", "luis", ""):
+                self.assertEqual(index.search(query), scan(rows, query), (change, query))
+
+    def test_patched_gives_up_past_max_changes(self):
+        index = SearchIndex(ROWS)
+        for _ in range(RowOverlay.MAX_CHANGES):
+            index = index.patched(APPEND, len(index), ["5", "Ana", "VIP"])
+        self.assertIsNone(index.patched(DELETE, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from services.column_table import APPEND, CATEGORY, DELETE, INT, POOLED, REPLACE, ColumnTable
+from services.sort_order import SortOrder, _reverse_runs
+
+RECORDS = [
+    (1, "Luis", "vip", 30),
+    (2, "ana", "basic", 10),
+    (3, "Eva", "vip", 10),
+    (4, "Ana", "basic", None),
+    (5, "eva", "vip", 20),
+]
+
+
+def make_order():
+    table = ColumnTable((("id", INT), ("name", POOLED), ("plan", CATEGORY), ("joined", INT)))
+    table.extend(RECORDS)
+    # Displayed columns: ID (row position), name, plan, join date
+    return SortOrder(table, (None, "name", "plan", "joined"))
+
+
+def reference(spec):
+    """Successive stable sorts, least significant column first"""
+    keys = {
+        0: lambda pos: pos,
+        1: lambda pos: RECORDS[pos][1].casefold(),
+        2: lambda pos: RECORDS[pos][2],
+        3: lambda pos: (RECORDS[pos][3] is not None, RECORDS[pos][3] or 0),
+    }
+    positions = list(range(len(RECORDS)))
+    for column, descending in reversed(spec):
+        positions.sort(key=keys[column], reverse=descending)
+    return positions
+
+
+class ReverseRunsTest(unittest.TestCase):
+    def test_ties_keep_their_order(self):
+        keys = [1, 0, 1, 0, 2, 1]
+        ascending = sorted(range(len(keys)), key=keys.__getitem__)
+        self.assertEqual(ascending, [1, 3, 0, 2, 5, 4])
+        self.assertEqual(list(_reverse_runs(ascending, keys)), [4, 0, 2, 5, 1, 3])
+
+    def test_matches_a_stable_descending_sort(self):
+        keys = [3, 1, 3, 2, 1, 1, 3, 0]
+        ascending = sorted(range(len(keys)), key=keys.__getitem__)
+        self.assertEqual(
+            list(_reverse_runs(ascending, keys)),
+            sorted(range(len(keys)), key=keys.__getitem__, reverse=True),
+        )
+
+    def test_empty(self):
+        self.assertEqual(list(_reverse_runs([], [])), [])
+
+
+class SortOrderTest(unittest.TestCase):
+    def test_single_and_multi_column_orders(self):
+        order = make_order()
+        specs = [
+            ((0, False),), ((0, True),), ((1, False),), ((1, True),),
+            ((2, True),), ((3, False),), ((3, True),),
+            ((2, False), (1, True)), ((2, True), (3, False)), ((1, False), (3, True)),
+        ]
+        for spec in specs:
+            self.assertEqual(list(order.order(spec)), reference(spec), spec)
+
+    def test_orders_are_cached(self):
+        order = make_order()
+        self.assertIs(order.order(((1, True),)), order.order([(1, True)]))
+
+    def test_patched_orders_match_a_rebuild(self):
+        order = make_order()
+        specs = [((1, False),), ((2, True), (3, False)), ((3, True), (0, True))]
+        for spec in specs:
+            order.order(spec)
+
+        for change, pos, record in (
+            (REPLACE, 1, (2, "Zoe", "basic", 40)),
+            (DELETE, 0, None),
+            (APPEND, 4, (6, "ana", "vip", 10)),
+        ):
+            table = order.table.copy()
+            if change == DELETE:
+                table.delete(pos)
+            elif change == APPEND:
+                table.append(record)
+            else:
+                table.replace(pos, record)
+            order = order.patched(change, pos, table)
+            rebuilt = SortOrder(table, (None, "name", "plan", "joined"))
+            for spec in specs:
+                self.assertEqual(list(order.order(spec)), list(rebuilt.order(spec)), spec)
+
+    def test_sort_a_subset(self):
+        order = make_order()
+        self.assertEqual(list(order.sort([4, 0, 2], ((1, False), (0, True)))), [4, 2, 0])
+        self.assertEqual(order.sort([4, 0], ()), [4, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from controllers.crud import (
+    count_trainers,
+    count_users,
+    create_trainer,
+    create_user,
+    get_all_trainers_with_managers,
+)
+from controllers.dashboard_controller import DashboardController
+from controllers.database import UnitOfWorkFailed, unit_of_work
+from controllers.query_counter import QueryCounter
+from tests.database_case import TempDatabaseTest, make_trainer, make_user
+
+
+class UnitOfWorkTest(TempDatabaseTest):
+    def test_block_commits_once(self):
+        with QueryCounter(self.engine) as counter:
+            with unit_of_work():
+                create_user(make_user(1))
+                create_user(make_user(2))
+        self.assertEqual(counter.commits, 1)
+        self.assertEqual(count_users(), 2)
+
+    def test_failed_crud_call_rolls_back_earlier_writes(self):
+        with self.assertRaises(UnitOfWorkFailed):
+            with unit_of_work():
+                create_user(make_user(1))
+                create_trainer(make_trainer(1))
+                # Same email as the first user: the crud call fails and rolls back
+                self.assertIsNone(create_user(make_user(2, email="user1@test.com")))
+        self.assertEqual(count_users(), 0)
+        self.assertEqual(count_trainers(), 0)
+
+    def test_exception_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                create_user(make_user(1))
+                raise RuntimeError("abort")
+        self.assertEqual(count_users(), 0)
+
+    def test_failed_nested_block_only_undoes_its_own_changes(self):
+        with unit_of_work():
+            create_user(make_user(1))
+            with self.assertRaises(UnitOfWorkFailed):
+                with unit_of_work():
+                    create_trainer(make_trainer(1))
+                    create_user(make_user(2, email="user1@test.com"))
+            create_user(make_user(3))
+        self.assertEqual(count_users(), 2)
+        self.assertEqual(count_trainers(), 0)
+
+    def test_nested_block_commits_with_the_outer_one(self):
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                with unit_of_work():
+                    create_user(make_user(1))
+                raise RuntimeError("abort")
+        self.assertEqual(count_users(), 0)
+
+
+class SaveAdminTest(TempDatabaseTest):
+    def test_admin_save_with_trainer_link_commits_once(self):
+        create_trainer(make_trainer(1))
+        controller = DashboardController()
+
+        with QueryCounter(self.engine) as counter:
+            result = controller.save_admin_data(
+                {"username": "manager", "password": "secret", "role": "manager", "trainer_id": "1"}
+            )
+        self.assertTrue(result["success"], result)
+        self.assertEqual(counter.commits, 1)
+
+        [(_, manager)] = get_all_trainers_with_managers()
+        self.assertEqual(manager, "manager")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Shared codec for the hour-aligned 'YYYY-MM-DD HH:00' timestamps the models
+keep as text, and for the 'DD/MM/YYYY' dates shown in the tables.
+
+Well-formed values are parsed by slicing instead of strptime, and every
+conversion is memoized: stored timestamps are whole hours, so a bulk load
+keeps converting the same values. Formatting is memoized on the hour (or
+day) shown, not on the full datetime, so minutes and microseconds do not
+fill the memo with entries that format alike. Anything the fast path does not
+recognise goes through strptime, with the same errors as before.
+"""
+from datetime import date, datetime
+from functools import lru_cache
+
+HOUR_FORMAT = "%Y-%m-%d %H:00"
+DAY_FORMAT = "%Y-%m-%d"
+
+# Distinct values remembered per conversion: about 7 years of hours
+MEMO_SIZE = 65_536
+
+
+def _digits(text, start, end):
+    """Integer value of text[start:end] if it is all ASCII digits, else None"""
+    part = text[start:end]
+    return int(part) if part.isascii() and part.isdigit() else None
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_hour(text):
+    """
+    'YYYY-MM-DD HH:00' -> datetime.
+
+    Raises:
+        ValueError: If text does not match the format (as strptime would)
+    """
+    if len(text) == 16 and text[4] == "-" and text[7] == "-" and text[10] == " " \
+            and text[13:] == ":00":
+        year, month = _digits(text, 0, 4), _digits(text, 5, 7)
+        day, hour = _digits(text, 8, 10), _digits(text, 11, 13)
+        if None not in (year, month, day, hour):
+            # datetime() rejects out-of-range fields with ValueError too
+            return datetime(year, month, day, hour)
+    return datetime.strptime(text, HOUR_FORMAT)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_day(text):
+    """'YYYY-MM-DD' -> datetime at midnight"""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        year, month, day = _digits(text, 0, 4), _digits(text, 5, 7), _digits(text, 8, 10)
+        if None not in (year, month, day):
+            return datetime(year, month, day)
+    return datetime.strptime(text, DAY_FORMAT)
+
+
+def format_hour(value):
+    """datetime -> 'YYYY-MM-DD HH:00' (minutes and seconds are dropped)"""
+    return _format_hour_code(hour_code(value))
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _format_hour_code(code):
+    days, hour = divmod(code, 24)
+    value = date.fromordinal(days)
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d} {hour:02d}:00"
+
+
+def format_day(value):
+    """date or datetime -> 'DD/MM/YYYY', as shown in the tables"""
+    return _format_day_ordinal(value.toordinal())
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _format_day_ordinal(ordinal):
+    value = date.fromordinal(ordinal)
+    return f"{value.day:02d}/{value.month:02d}/{value.year:04d}"
+
+
+def hour_code(value):
+    """datetime -> whole hours since 0001-01-01, to store timestamps as integers"""
+    return value.toordinal() * 24 + value.hour
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def from_hour_code(code):
+    """Inverse of hour_code"""
+    days, hour = divmod(code, 24)
+    return datetime.fromordinal(days).replace(hour=hour)
@@ -0,0 +1,67 @@
+"""
+Keyed diff between two lists of table rows.
+Lets table views patch only the rows that changed instead of rebuilding every widget.
+"""
+
+
+def row_key(row):
+    """Default row key: the ID stored in the first column"""
+    return str(row[0])
+
+
+def diff_rows(old_rows, new_rows, key=row_key):
+    """
+    Compare two row lists by key.
+
+    Args:
+        old_rows: Rows currently displayed
+        new_rows: Rows that should be displayed
+        key: Function returning a unique key for a row
+
+    Returns:
+        dict: Operations to turn old_rows into new_rows
+            removed:  [key, ...] rows only present in old_rows
+            inserted: [(new_idx, key), ...] rows only present in new_rows
+            moved:    [(old_idx, new_idx, key), ...] rows whose position changed
+            changed:  [(new_idx, key), ...] rows whose cell values changed
+
+    Raises:
+        ValueError: If a key appears more than once in either list
+    """
+    old_positions = {}
+    for idx, row in enumerate(old_rows):
+        old_positions[key(row)] = idx
+    if len(old_positions) != len(old_rows):
+        raise ValueError("Duplicate row keys in old rows")
+
+    seen_keys = set()
+    inserted = []
+    moved = []
+    changed = []
+
+    for new_idx, row in enumerate(new_rows):
+        new_key = key(row)
+        if new_key in seen_keys:
+            raise ValueError(f"Duplicate row key in new rows: {new_key}")
+        seen_keys.add(new_key)
+
+        old_idx = old_positions.get(new_key)
+        if old_idx is None:
+            inserted.append((new_idx, new_key))
+            continue
+
+        if old_idx != new_idx:
+            moved.append((old_idx, new_idx, new_key))
+
+        old_row = old_rows[old_idx]
+        if old_row is not row and list(old_row) != list(row):
+            changed.append((new_idx, new_key))
+
+    removed = [old_key for old_key in old_positions if old_key not in seen_keys]
+
+    return {
+        "removed": removed,
+        "inserted": inserted,
+        "moved": moved,
+        "changed": changed,
+    }
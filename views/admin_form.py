@@ -21,6 +21,7 @@ class AdminFormView(ctk.CTkFrame):
         on_cancel=None,
         admin_to_edit=None,
         current_admin=None,
+        controller=None,
     ):
         super().__init__(master, fg_color=("white", "gray17"), corner_radius=15)
         self.on_save = on_save
@@ -29,7 +30,13 @@ class AdminFormView(ctk.CTkFrame):
         self.current_admin = current_admin  # Add current admin for security checks
 
         # Controller for trainer data
-        self.controller = DashboardController()
+        self.controller = controller or DashboardController()
+
+        # Known once the form data has loaded; until then the admin option
+        # stays hidden and get_form_data never yields an admin role
+        self._can_create_admins = False
+        # Bumped per trainers table load so only the latest one is shown
+        self._trainers_token = 0
 
         # Provide default save behavior if none was supplied
         if self.on_save is None:
@@ -66,16 +73,15 @@ class AdminFormView(ctk.CTkFrame):
         if not self.admin_to_edit:
             desc_text = "Enter the details for the administrator account"
         else:
-            username = self.controller.get_admin_username_from_sequential_id(self.admin_to_edit)
-            desc_text = f"Modify the {username or 'administrator'} account"
+            desc_text = "Loading administrator..."
 
-        desc_label = ctk.CTkLabel(
+        self.desc_label = ctk.CTkLabel(
             title_frame,
             text=desc_text,
             font=ctk.CTkFont(size=14),
             text_color=COLORS["text_secondary"],
         )
-        desc_label.pack(anchor="w", pady=(0, 10))
+        self.desc_label.pack(anchor="w", pady=(0, 10))
 
         # Form fields
         form_frame = ctk.CTkFrame(self.scrollable_container, fg_color="transparent")
@@ -220,42 +226,14 @@ class AdminFormView(ctk.CTkFrame):
         )
         role_label.pack(anchor="w", pady=(0, 5))
 
-        # Current role info (only shown when editing)
-        if self.admin_to_edit:
-            admin_data = self.controller.get_admin_data_unified(
-                str(self.admin_to_edit), from_cache=True, by_sequential_id=True
-            )
-            if admin_data:
-                current_role = admin_data.get("role", "admin")
-                current_info_text = f"Current role: {current_role.title()}"
-
-                # If manager with trainer, add trainer info
-                if current_role == "manager" and admin_data.get("trainer_id"):
-                    trainer_name = self._get_trainer_name(admin_data.get("trainer_id"))
-                    if trainer_name:
-                        current_info_text += f" (Associated with: {trainer_name})"
-
-                self.current_role_info = ctk.CTkLabel(
-                    form_frame,
-                    text=current_info_text,
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color=COLORS["accent"][0],
-                    anchor="w",
-                )
-                self.current_role_info.pack(anchor="w", pady=(0, 10))
-
-        self.role_var = ctk.StringVar(value="admin")
-
-        role_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        role_frame.pack(fill="x", pady=(0, 15))
+        self.role_var = ctk.StringVar(value="manager")
 
-        # Security check: Only allow admin creation if current user is admin
-        current_user_is_admin = self.controller.can_create_admin_accounts(
-            self.current_admin
-        )
+        self.role_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+        self.role_frame.pack(fill="x", pady=(0, 15))
 
+        # Packed once the form data shows the current user is an admin
         self.admin_radio = ctk.CTkRadioButton(
-            role_frame,
+            self.role_frame,
             text="Administrator",
             variable=self.role_var,
             value="admin",
@@ -265,15 +243,8 @@ class AdminFormView(ctk.CTkFrame):
             command=self._on_role_change,
         )
 
-        # Only show admin option if current user is admin
-        if current_user_is_admin:
-            self.admin_radio.pack(side="left", padx=(0, 20))
-        else:
-            # If current user is manager, set default to manager and hide admin option
-            self.role_var.set("manager")
-
         self.manager_radio = ctk.CTkRadioButton(
-            role_frame,
+            self.role_frame,
             text="Manager",
             variable=self.role_var,
             value="manager",
@@ -284,23 +255,11 @@ class AdminFormView(ctk.CTkFrame):
         )
         self.manager_radio.pack(side="left")
 
-        # Add security note for managers
-        if not current_user_is_admin:
-            security_note = ctk.CTkLabel(
-                form_frame,
-                text="⚠️ As a Manager, you can only create other Manager accounts",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=COLORS["accent"][0],
-                anchor="w",
-            )
-            security_note.pack(anchor="w", pady=(5, 10))
+        self.form_frame = form_frame
 
         # Trainer selection section (only shown for manager role)
         self.trainer_selection_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
 
-        # Initially hide trainer selection
-        self._on_role_change()
-
         buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
         buttons_frame.pack(fill="x", padx=20, pady=(10, 20))
 
@@ -312,12 +271,51 @@ class AdminFormView(ctk.CTkFrame):
         )
         self.form_buttons.pack(fill="x")
 
-        # Initially disable save button
-        self.form_buttons.set_save_enabled(False)
+        # Role options, current values and permissions come from the
+        # database, so read them in the background before enabling the form
+        self.form_buttons.set_busy(True, "Loading...")
+        self.controller.get_admin_form_data_async(
+            self.admin_to_edit,
+            self.current_admin,
+            callback=self._on_form_data_loaded,
+            error_callback=self._on_form_data_error,
+        )
+
+    def _on_form_data_loaded(self, form_data):
+        """Apply the permissions and the edited admin once they are read"""
+        if not self.winfo_exists():
+            return
+        self.form_buttons.set_busy(False)
+
+        # Security check: Only allow admin creation if current user is admin
+        self._can_create_admins = form_data["can_create_admins"]
+        if self._can_create_admins:
+            self.admin_radio.pack(side="left", padx=(0, 20), before=self.manager_radio)
+            self.role_var.set("admin")
+        else:
+            # Add security note for managers
+            security_note = ctk.CTkLabel(
+                self.form_frame,
+                text="⚠️ As a Manager, you can only create other Manager accounts",
+                font=ctk.CTkFont(size=12, weight="bold"),
+                text_color=COLORS["accent"][0],
+                anchor="w",
+            )
+            security_note.pack(anchor="w", pady=(5, 10), after=self.role_frame)
 
-        # Load existing data if editing
         if self.admin_to_edit:
-            self._load_existing_admin_data()
+            self._load_existing_admin_data(form_data)
+        else:
+            self._on_role_change()
+            self.form_buttons.set_save_enabled(False)
+
+    def _on_form_data_error(self, error):
+        if not self.winfo_exists():
+            return
+        print(f"Error loading admin form data: {error}")
+        self.form_buttons.set_busy(False)
+        self.form_buttons.set_save_enabled(False)
+        self._on_role_change()
 
     def _on_field_change(self, event=None):
         """Handle field changes with debounce - wait 700ms before validating"""
@@ -482,9 +480,26 @@ class AdminFormView(ctk.CTkFrame):
         for widget in self.trainer_selection_frame.winfo_children():
             widget.destroy()
 
+        loading_label = ctk.CTkLabel(
+            self.trainer_selection_frame,
+            text="Loading trainers...",
+            font=ctk.CTkFont(size=14),
+            text_color=COLORS["text_secondary"],
+        )
+        loading_label.pack(pady=20)
+
+        self._trainers_token += 1
+        token = self._trainers_token
+
+        def on_loaded(trainers_data):
+            if self.winfo_exists() and token == self._trainers_token:
+                loading_label.destroy()
+                self._build_trainers_table(trainers_data)
+
         # Get available trainers for form (4 columns only)
-        trainers_data = self.controller.get_available_trainers_for_form()
+        self.controller.get_available_trainers_for_form_async(callback=on_loaded)
 
+    def _build_trainers_table(self, trainers_data):
         self.trainer_view = TableWithHeaderView(
             self.trainer_selection_frame,
             title="Associate Trainer",
@@ -503,10 +518,7 @@ class AdminFormView(ctk.CTkFrame):
         selected_role = self.role_var.get()
 
         # If current user is not admin and tries to create admin, force to manager
-        if (
-            not self.controller.can_create_admin_accounts(self.current_admin)
-            and selected_role == "admin"
-        ):
+        if not self._can_create_admins and selected_role == "admin":
             selected_role = "manager"
 
         # Get selected trainer from the table if manager role is selected
@@ -524,17 +536,6 @@ class AdminFormView(ctk.CTkFrame):
             "trainer_id": trainer_id,
         }
 
-    def _get_trainer_name(self, trainer_id):
-        """Get trainer name by ID"""
-        try:
-            trainers_data = self.controller.get_trainer_data()
-            for trainer in trainers_data:
-                if trainer[0] == trainer_id:  # Assuming ID is first column
-                    return trainer[1]  # Assuming name is second column
-            return None
-        except Exception:
-            return None
-
     def _toggle_password_visibility(self, field_type="password"):
         """Toggle password visibility between hidden and visible"""
         if field_type == "password":
@@ -563,37 +564,45 @@ class AdminFormView(ctk.CTkFrame):
         """Toggle repeat password visibility between hidden and visible"""
         self._toggle_password_visibility("repeat_password")
 
-    def _load_existing_admin_data(self):
+    def _load_existing_admin_data(self, form_data):
         """Load existing admin data into the form fields"""
-        try:
-            # Ensure admin_to_edit is not None and convert to string
-            if not self.admin_to_edit:
-                print("Warning: No admin ID to edit")
-                return
-
-            # Get admin data using the unified method with sequential ID flag
-            admin_data = self.controller.get_admin_data_unified(
-                str(self.admin_to_edit), from_cache=True, by_sequential_id=True
-            )
+        admin_data = form_data["admin"]
+        if not admin_data:
+            print(f"Warning: Could not load admin data for ID {self.admin_to_edit}")
+            self.desc_label.configure(text="Modify the administrator account")
+            self._on_role_change()
+            return
 
-            if admin_data:
-                # Pre-fill username
-                self.username_entry.delete(0, "end")
-                self.username_entry.insert(0, admin_data.get("username", ""))
+        self.desc_label.configure(text=f"Modify the {admin_data['username']} account")
 
-                # Set role
-                self.role_var.set(admin_data.get("role", "admin"))
-                self._on_role_change()
+        # Current role info, with the trainer of a manager
+        current_role = admin_data.get("role", "admin")
+        current_info_text = f"Current role: {current_role.title()}"
+        if current_role == "manager" and form_data["trainer_name"]:
+            current_info_text += f" (Associated with: {form_data['trainer_name']})"
 
-                # For editing, we don't require passwords to be filled
-                # Password fields remain empty - user can optionally change them
+        self.current_role_info = ctk.CTkLabel(
+            self.form_frame,
+            text=current_info_text,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color=COLORS["accent"][0],
+            anchor="w",
+        )
+        self.current_role_info.pack(anchor="w", pady=(0, 10), before=self.role_frame)
 
-                # Enable save button for editing (since username is populated)
-                self._validate_form_for_edit()
-            else:
-                print(f"Warning: Could not load admin data for ID {self.admin_to_edit}")
-        except Exception as e:
-            print(f"Error loading admin data: {e}")
+        # Pre-fill username
+        self.username_entry.delete(0, "end")
+        self.username_entry.insert(0, admin_data.get("username", ""))
+
+        # Set role
+        self.role_var.set(current_role)
+        self._on_role_change()
+
+        # For editing, we don't require passwords to be filled
+        # Password fields remain empty - user can optionally change them
+
+        # Enable save button for editing (since username is populated)
+        self._validate_form_for_edit()
 
     def _validate_form_for_edit(self):
         """Validate form for editing mode - more flexible validation"""
@@ -0,0 +1,109 @@
+"""
+Reusable bar of facet filters: one drop-down per facet column, listing
+its values with the number of rows each one would show.
+"""
+
+import customtkinter as ctk
+from views.colors import COLORS
+from typing import Callable, Dict, List, Optional
+
+
+class FacetBar(ctk.CTkFrame):
+    """Drop-down filters over some columns of a table"""
+
+    ANY_VALUE = "All"
+
+    def __init__(
+        self,
+        master,
+        headers: List[str],
+        on_change_callback: Optional[Callable] = None,
+        on_open_callback: Optional[Callable] = None,
+    ):
+        super().__init__(master, fg_color="transparent")
+
+        self.headers = headers
+        self.on_change_callback = on_change_callback
+        self.on_open_callback = on_open_callback
+        self._menus = {}  # column -> CTkOptionMenu
+        self._labels = {}  # column -> {menu item: value}
+        self.selection = {}  # column -> [value], as controller.facet_data takes it
+
+        # Counting the values may load a whole table, so it waits for a click
+        self.open_button = ctk.CTkButton(
+            self,
+            text="Filters",
+            width=90,
+            fg_color=COLORS["primary"][0],
+            command=self._on_open,
+        )
+        self.open_button.pack(side="left")
+
+    @property
+    def is_open(self):
+        """True once the facet menus are shown"""
+        return bool(self._menus)
+
+    def _on_open(self):
+        self.open_button.configure(text="Loading...", state="disabled")
+        if self.on_open_callback:
+            self.on_open_callback()
+
+    def open_failed(self):
+        """Let the user try opening the facets again"""
+        if self.open_button is not None:
+            self.open_button.configure(text="Filters", state="normal")
+
+    def update_counts(self, counts: Dict[int, Dict[str, int]]):
+        """Show the values of each facet column with their row counts"""
+        if counts and self.open_button is not None:
+            self.open_button.destroy()
+            self.open_button = None
+
+        for column, value_counts in counts.items():
+            menu = self._menus.get(column)
+            if menu is None:
+                menu = self._create_menu(column)
+
+            selected = self.selection.get(column, [None])[0]
+            labels = {self.ANY_VALUE: None}
+            current = self.ANY_VALUE
+            for value, count in value_counts.items():
+                label = f"{value} ({count})"
+                labels[label] = value
+                if value == selected:
+                    current = label
+
+            self._labels[column] = labels
+            menu.configure(values=list(labels))
+            menu.set(current)
+
+    def _create_menu(self, column):
+        ctk.CTkLabel(
+            self,
+            text=f"{self.headers[column]}:",
+            font=ctk.CTkFont(size=13),
+            text_color=COLORS["text_secondary"],
+        ).pack(side="left", padx=(0 if not self._menus else 15, 5))
+
+        menu = ctk.CTkOptionMenu(
+            self,
+            values=[self.ANY_VALUE],
+            width=160,
+            fg_color=COLORS["primary"][0],
+            button_color=COLORS["primary"][1],
+            command=lambda label, c=column: self._on_select(c, label),
+        )
+        menu.pack(side="left")
+        self._menus[column] = menu
+        return menu
+
+    def _on_select(self, column, label):
+        value = self._labels.get(column, {}).get(label)
+        if value is None:
+            self.selection.pop(column, None)
+        else:
+            self.selection[column] = [value]
+
+        if self.on_change_callback:
+            self.on_change_callback(self.selection)
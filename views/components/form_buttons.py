@@ -122,6 +122,16 @@ class FormButtons(ctk.CTkFrame):
         else:
             self.cancel_button.configure(state="disabled")
 
+    def set_busy(self, busy=True, busy_text="Saving..."):
+        """Disable both buttons while a save runs in the background"""
+        if busy:
+            self._idle_save_text = self.save_button.cget("text")
+            self.set_save_text(busy_text)
+        elif hasattr(self, "_idle_save_text"):
+            self.set_save_text(self._idle_save_text)
+        self.set_save_enabled(not busy)
+        self.set_cancel_enabled(not busy)
+
     def set_save_text(self, text):
         """Update the save button text"""
         self.save_button.configure(text=text)
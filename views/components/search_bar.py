@@ -27,7 +27,7 @@ class SearchBar(ctk.CTkFrame):
 
         # Debouncing for performance
         self._search_timer = None
-        self._debounce_delay = 300  # 300ms delay
+        self._debounce_delay = 150  # Indexed search keeps each query cheap
 
         # Focus state tracking
         self._is_focused = False
@@ -3,10 +3,10 @@ Reusable component to display tables with a header.
 Applies the DRY (Don't Repeat Yourself) Principle - eliminates code duplication.
 """
 
-import tkinter as tk
 import customtkinter as ctk
 from views.data_table import DataTable
 from views.colors import COLORS
+from views.components.facet_bar import FacetBar
 from views.components.search_bar import SearchBar
 
 
@@ -18,7 +18,8 @@ class TableWithHeaderView(ctk.CTkFrame):
 
     def __init__(
         self, master, title, description, headers, data, column_weights,
-        table_name, controller=None, crud_callbacks=None, show_crud_buttons=True
+        table_name, controller=None, crud_callbacks=None, show_crud_buttons=True,
+        show_facets=True
     ):
         super().__init__(master, fg_color="transparent")
 
@@ -27,6 +28,15 @@ class TableWithHeaderView(ctk.CTkFrame):
         self.description = description
         self.headers = headers
         self.data = data
+        # Rows shown when the search is cleared (may be a lazily paged sequence)
+        self.source_data = data
+        # Rows of the current search, before sorting
+        self.unsorted_data = data
+        self._sort_request = None  # Latest background sort, older ones are dropped
+        self._filter_request = None  # Latest background search, the same way
+        self._query = ""
+        # Facet counts of the whole table, shown while nothing is filtered
+        self._facet_counts = None
         self.column_weights = column_weights
         self.table_name = table_name
         self.controller = controller  # Dashboard controller for filtering
@@ -34,6 +44,9 @@ class TableWithHeaderView(ctk.CTkFrame):
         self.show_crud_buttons = show_crud_buttons
 
         self._create_header()
+        self.facet_bar = None
+        if show_facets and controller and table_name.lower() in controller.FACET_COLUMNS:
+            self._create_facet_bar()
         self._create_table()
         if self.show_crud_buttons:
             self._create_crud_buttons()
@@ -80,6 +93,36 @@ class TableWithHeaderView(ctk.CTkFrame):
         )
         self.search_bar.grid(row=0, column=1, sticky="e", padx=(20, 0))
 
+    def _create_facet_bar(self):
+        """Creates the facet filters, counted once the user opens them"""
+        self.facet_bar = FacetBar(
+            self,
+            headers=self.headers,
+            on_change_callback=self._on_facets_change,
+            on_open_callback=self._on_facets_open,
+        )
+        self.facet_bar.pack(fill="x", padx=20, pady=(0, 5))
+
+    def _on_facets_open(self):
+        """Count the facet values of the whole table, then of the current search"""
+        def on_counted(result):
+            if not self.winfo_exists():
+                return
+            self._facet_counts = result[1]
+            self.facet_bar.update_counts(self._facet_counts)
+            if self._query.strip():
+                self._apply_filters()
+
+        def on_error(error):
+            if self.winfo_exists():
+                print(f"Error counting {self.table_name} facets: {error}")
+                self.facet_bar.open_failed()
+
+        # The first count of the member table loads every member
+        self.controller.facet_data_async(
+            self.table_name.lower(), callback=on_counted, error_callback=on_error
+        )
+
     def _create_table(self):
         """Creates the data table"""
         self.table = DataTable(
@@ -88,6 +131,7 @@ class TableWithHeaderView(ctk.CTkFrame):
             data=self.data,
             column_weights=self.column_weights,
             table_name=self.table_name,
+            on_sort=self._on_sort if self.controller else None,
         )
         self.table.pack(fill="both", expand=True, padx=20, pady=(5, 15))
 
@@ -109,82 +153,94 @@ class TableWithHeaderView(ctk.CTkFrame):
 
     def _on_search(self, query):
         """Handle search functionality using controller's intelligent cache"""
-        if self.controller:
-            # Store current scroll position before updating
-            scroll_position = self._get_scroll_position()
-
-            # Use controller's optimized filtering with cache
-            filtered_data = self.controller.filter_data(self.table_name.lower(), query)
-            self.data = filtered_data
-
-            # Update the table with filtered data
-            self.table.destroy()
-            # Destroy buttons if they exist to recreate them in correct order
-            if hasattr(self, 'crud_buttons'):
-                self.crud_buttons.master.destroy()
-
-            self._create_table()
-            if self.show_crud_buttons:
-                self._create_crud_buttons()
-
-            # Restore scroll position after update
-            self._restore_scroll_position(scroll_position)
-        else:
+        self._query = query
+        self._apply_filters()
+
+    def _on_facets_change(self, selection):
+        self._apply_filters()
+
+    def _apply_filters(self):
+        """Show the rows matching the search and the facets, sorted as the table is"""
+        self._sort_request = None  # A sort still running would show stale rows
+        self._filter_request = request = object()
+        table_name = self.table_name.lower()
+        selection = self.facet_bar.selection if self.facet_bar else {}
+
+        if not self._query.strip() and not selection:
+            # Show the original rows again without loading the whole table
+            self.unsorted_data = self.source_data
+            if self._facet_counts:
+                self.facet_bar.update_counts(self._facet_counts)
+            self._show_sorted()
+            return
+        if not self.controller:
             # Fallback: basic local filtering (for backward compatibility)
-            pass
-
-    def _get_scroll_position(self):
-        """Get current scroll position of parent scrollable frame"""
-        parent = self.master
-        while parent:
-            if isinstance(parent, ctk.CTkScrollableFrame):
-                try:
-                    # Get the current scroll position
-                    return parent._parent_canvas.canvasy(0)
-                except (AttributeError, tk.TclError):
-                    break
-            parent = parent.master
-        return 0
-
-    def _restore_scroll_position(self, position):
-        """Restore scroll position of parent scrollable frame"""
-        parent = self.master
-        while parent:
-            if isinstance(parent, ctk.CTkScrollableFrame):
-                try:
-                    # Schedule the scroll restoration for after the UI updates
-                    parent.after(50, lambda: self._set_scroll_position(parent, position))
-                    break
-                except (AttributeError, tk.TclError):
-                    break
-            parent = parent.master
-
-    def _set_scroll_position(self, scrollable_frame, position):
-        """Set scroll position on scrollable frame"""
-        try:
-            # Calculate relative position (0.0 to 1.0)
-            canvas = scrollable_frame._parent_canvas
-            scroll_region = canvas.cget("scrollregion")
-            if scroll_region:
-                # Parse scroll region: "x1 y1 x2 y2"
-                coords = scroll_region.split()
-                if len(coords) >= 4:
-                    total_height = float(coords[3]) - float(coords[1])
-                    if total_height > 0:
-                        relative_position = min(max(position / total_height, 0.0), 1.0)
-                        canvas.yview_moveto(relative_position)
-        except (AttributeError, tk.TclError, ValueError):
-            pass  # Silently fail if scroll restoration doesn't work
+            return
+
+        # Facet counts are only kept up to date once the facets are shown
+        with_facets = self.facet_bar is not None and self.facet_bar.is_open
+
+        def on_filtered(result):
+            if self._filter_request is not request or not self.winfo_exists():
+                return
+            if with_facets:
+                self.unsorted_data, counts = result
+                self.facet_bar.update_counts(counts)
+            else:
+                self.unsorted_data = result
+            self._show_sorted()
+
+        def on_error(error):
+            if self._filter_request is request and self.winfo_exists():
+                print(f"Error filtering {self.table_name}: {error}")
+
+        if with_facets:
+            # Facet bitmaps intersect with the indexed search, counts stay live
+            self.controller.facet_data_async(
+                table_name, selection, self._query, fuzzy=True,
+                callback=on_filtered, error_callback=on_error,
+            )
+        else:
+            # Use controller's indexed filtering, tolerating typos in the query
+            self.controller.filter_data_async(
+                table_name, self._query, fuzzy=True,
+                callback=on_filtered, error_callback=on_error,
+            )
+
+    def _on_sort(self, sort_spec):
+        """Header click on the table: show the current rows in the new order"""
+        self._show_sorted()
+
+    def _show_sorted(self):
+        """Show the current rows in the table's sort order, sorted in the background"""
+        self._sort_request = request = object()
+        sort_spec = self.table.sort_spec
+        if not sort_spec:
+            self.update_data(self.unsorted_data)
+            return
+
+        def on_sorted(rows):
+            if self._sort_request is request and self.winfo_exists():
+                self.update_data(rows)
+
+        def on_error(error):
+            if self._sort_request is request and self.winfo_exists():
+                print(f"Error sorting {self.table_name}: {error}")
+                self.table.set_sort_spec(())
+                self.update_data(self.unsorted_data)
+
+        self.controller.sort_data_async(
+            self.table_name.lower(), sort_spec, self._rows_to_sort(),
+            callback=on_sorted, error_callback=on_error,
+        )
+
+    def _rows_to_sort(self):
+        """Filtered rows to sort, or None for the whole table"""
+        return None if self.unsorted_data is self.source_data else self.unsorted_data
 
     def update_data(self, new_data):
         """Updates the table data without recreating the entire component"""
         self.data = new_data
-        # Recreate only the table
-        self.table.destroy()
-        # Destroy buttons if they exist to recreate them in correct order
-        if hasattr(self, 'crud_buttons'):
-            self.crud_buttons.master.destroy()
-
-        self._create_table()
-        if self.show_crud_buttons:
-            self._create_crud_buttons()
+        # The table patches only the rows that changed, so widgets, CRUD
+        # buttons and scroll position are kept as they are
+        self.table.update_data(new_data)
@@ -21,6 +21,11 @@ class DashboardFrame(ctk.CTkFrame):
         # Inject the controller - Dependency Inversion Principle
         self.controller = DashboardController()
 
+        # Bumped whenever the content area is replaced, so results of
+        # background loads started for a previous view are dropped
+        self._content_token = 0
+        self._loading_bar = None
+
         # Configure grid
         self.grid_columnconfigure(1, weight=1)  # Content takes remaining space
         self.grid_rowconfigure(0, weight=1)  # Single row with full height
@@ -58,6 +63,58 @@ class DashboardFrame(ctk.CTkFrame):
         self.content_container.grid_columnconfigure(0, weight=1)
         self.content_container.grid_rowconfigure(0, weight=1)
 
+    def _clear_content(self):
+        """Remove the current view from the content area"""
+        self._content_token += 1
+        if self._loading_bar is not None:
+            self._loading_bar.stop()
+            self._loading_bar = None
+        for widget in self.content_container.winfo_children():
+            widget.destroy()
+
+    def _show_loading(self, message):
+        """Replace the content with a loading indicator, returns the view token"""
+        self._clear_content()
+
+        loading_frame = ctk.CTkFrame(self.content_container, fg_color="transparent")
+        loading_frame.grid(row=0, column=0)
+
+        ctk.CTkLabel(
+            loading_frame,
+            text=message,
+            font=ctk.CTkFont(size=16),
+            text_color=COLORS["text_secondary"],
+        ).pack(pady=(0, 10))
+
+        self._loading_bar = ctk.CTkProgressBar(
+            loading_frame, mode="indeterminate", width=240,
+            progress_color=COLORS["primary"][0],
+        )
+        self._loading_bar.pack()
+        self._loading_bar.start()
+
+        return self._content_token
+
+    def _is_current(self, token):
+        """Whether a background result still belongs to the displayed view"""
+        return token == self._content_token and self.winfo_exists()
+
+    def _load_table_view(self, table_name, message, build_view):
+        """Load a table in the background, then build its view"""
+        token = self._show_loading(message)
+
+        def on_loaded(data):
+            if self._is_current(token):
+                self._clear_content()
+                build_view(data)
+
+        def on_error(error):
+            if self._is_current(token):
+                self._clear_content()
+                self._show_error_dialog("Load Error", f"Error loading {table_name}: {error}")
+
+        self.controller.load_table_async(table_name, on_loaded, on_error)
+
     def _show_default_content(self):
         # Show welcome screen for faster initial load
         self._show_welcome_screen()
@@ -69,8 +126,7 @@ class DashboardFrame(ctk.CTkFrame):
             return
 
         try:
-            for widget in self.content_container.winfo_children():
-                widget.destroy()
+            self._clear_content()
 
             # Create welcome view
             welcome_view = WelcomeView(self.content_container, self.current_admin)
@@ -86,8 +142,7 @@ class DashboardFrame(ctk.CTkFrame):
             )
             self._show_user_configuration(username)
         else:
-            for widget in self.content_container.winfo_children():
-                widget.destroy()
+            self._clear_content()
 
             self.sidebar.set_active_section(section_name)
 
@@ -106,11 +161,9 @@ class DashboardFrame(ctk.CTkFrame):
                 self.content_label.grid(row=0, column=0, padx=20, pady=20)
 
     def _show_admins_table(self):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        admins_data = self.controller.get_admin_data()
+        self._load_table_view("admins", "Loading administrators...", self._build_admins_table)
 
+    def _build_admins_table(self, admins_data):
         self.admin_view = TableWithHeaderView(
             self.content_container,
             title="Admin Management",
@@ -129,11 +182,9 @@ class DashboardFrame(ctk.CTkFrame):
         self.admin_view.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _show_trainers_table(self):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        trainers_data = self.controller.get_trainer_data()
+        self._load_table_view("trainers", "Loading trainers...", self._build_trainers_table)
 
+    def _build_trainers_table(self, trainers_data):
         self.trainer_view = TableWithHeaderView(
             self.content_container,
             title="Trainer Management",
@@ -152,11 +203,10 @@ class DashboardFrame(ctk.CTkFrame):
         self.trainer_view.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _show_users_table(self):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        users_data = self.controller.get_user_data()
+        self._load_table_view("users", "Loading members...", self._build_users_table)
 
+    def _build_users_table(self, users_data):
+        # Only the first page of members is read until the table scrolls
         self.user_view = TableWithHeaderView(
             self.content_container,
             title="Member Management",
@@ -175,8 +225,7 @@ class DashboardFrame(ctk.CTkFrame):
         self.user_view.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _show_user_configuration(self, username):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
+        self._clear_content()
 
         if username == self.current_admin.username:
             # Create UserConfigFrame directly
@@ -209,8 +258,7 @@ class DashboardFrame(ctk.CTkFrame):
 
     def _show_admin_form(self, admin_to_edit=None):
         """Show the admin form for adding/editing administrators"""
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
+        self._clear_content()
 
         # Create the form and store reference
         self.current_admin_form = AdminFormView(
@@ -219,24 +267,36 @@ class DashboardFrame(ctk.CTkFrame):
             on_cancel=self._handle_admin_cancel,
             admin_to_edit=admin_to_edit,
             current_admin=self.current_admin,
+            controller=self.controller,
         )
         self.current_admin_form.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _handle_admin_save(self, admin_data):
         """Handle saving admin data through the controller"""
-        try:
-            # Pass the form reference to the controller so it can check admin_to_edit
-            result = self.controller.save_admin_data(
-                admin_data, self.current_admin_form
-            )
+        # Pass the form reference to the controller so it can check admin_to_edit
+        self._save_in_background(
+            self.current_admin_form,
+            self.controller.save_admin_data_async,
+            admin_data,
+            self._show_admins_table,
+        )
 
-            if result["success"]:
-                # Return to the admins table after successful save
-                self._show_admins_table()
+    def _save_in_background(self, form, save_async, entity_data, on_saved):
+        """Save from a form without blocking the window, then run on_saved"""
+        form.form_buttons.set_busy(True)
+
+        def on_result(result):
+            if not form.winfo_exists():
+                return
+            if result.get("success"):
+                on_saved()
             else:
-                self._show_error_dialog("Save Error", result['message'])
-        except Exception as e:
-            self._show_error_dialog("Save Error", f"Error saving admin: {e}")
+                form.form_buttons.set_busy(False)
+                self._show_error_dialog(
+                    "Save Error", result.get("message", "Unknown error")
+                )
+
+        save_async(entity_data, form, on_result)
 
     def _handle_admin_cancel(self):
         # Return to the admins table
@@ -244,8 +304,7 @@ class DashboardFrame(ctk.CTkFrame):
 
     # Trainer form handlers
     def _show_trainer_form(self, trainer_to_edit=None):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
+        self._clear_content()
 
         self.current_trainer_form = TrainerFormView(
             self.content_container,
@@ -253,22 +312,17 @@ class DashboardFrame(ctk.CTkFrame):
             on_cancel=self._handle_trainer_cancel,
             trainer_to_edit=trainer_to_edit,
             current_admin=self.current_admin,
+            controller=self.controller,
         )
         self.current_trainer_form.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _handle_trainer_save(self, trainer_data):
-        try:
-            result = self.controller.save_trainer_data(
-                trainer_data, self.current_trainer_form
-            )
-            if result.get("success"):
-                self._show_trainers_table()
-            else:
-                self._show_error_dialog(
-                    "Save Error", result.get("message", "Unknown error")
-                )
-        except Exception as e:
-            self._show_error_dialog("Save Error", f"Error saving trainer: {e}")
+        self._save_in_background(
+            self.current_trainer_form,
+            self.controller.save_trainer_data_async,
+            trainer_data,
+            self._show_trainers_table,
+        )
 
     def _handle_trainer_cancel(self):
         self._show_trainers_table()
@@ -281,8 +335,7 @@ class DashboardFrame(ctk.CTkFrame):
 
     # User form handlers
     def _show_user_form(self, user_to_edit=None):
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
+        self._clear_content()
 
         self.current_user_form = UserFormView(
             self.content_container,
@@ -290,22 +343,17 @@ class DashboardFrame(ctk.CTkFrame):
             on_cancel=self._handle_user_cancel,
             user_to_edit=user_to_edit,
             current_admin=self.current_admin,
+            controller=self.controller,
         )
         self.current_user_form.pack(fill="both", expand=True, padx=10, pady=10)
 
     def _handle_user_save(self, user_data):
-        try:
-            result = self.controller.save_user_data(
-                user_data, self.current_user_form
-            )
-            if result.get("success"):
-                self._show_users_table()
-            else:
-                self._show_error_dialog(
-                    "Save Error", result.get("message", "Unknown error")
-                )
-        except Exception as e:
-            self._show_error_dialog("Save Error", f"Error saving user: {e}")
+        self._save_in_background(
+            self.current_user_form,
+            self.controller.save_user_data_async,
+            user_data,
+            self._show_users_table,
+        )
 
     def _handle_user_cancel(self):
         self._show_users_table()
@@ -329,7 +377,7 @@ class DashboardFrame(ctk.CTkFrame):
             self._show_error_dialog("Delete Error", "No administrator selected.")
             return
 
-        username = self.controller.get_admin_username_from_sequential_id(selected_id)
+        username = self._get_selected_name(self.admin_view.table, None)
         if not username:
             self._show_error_dialog("Delete Error", "Administrator not found.")
             return
@@ -337,11 +385,7 @@ class DashboardFrame(ctk.CTkFrame):
         if not self._show_delete_confirmation(username):
             return
 
-        result = self.controller.delete_entity(self.current_admin, "admin", selected_id)
-        if result["success"]:
-            self._show_admins_table()
-        else:
-            self._show_error_dialog("Delete Error", result["message"])
+        self._delete_in_background("admin", selected_id, self._show_admins_table)
 
     def _handle_trainer_delete(self):
         """Handle trainer deletion through controller"""
@@ -350,15 +394,11 @@ class DashboardFrame(ctk.CTkFrame):
             self._show_error_dialog("Delete Error", "No trainer selected.")
             return
 
-        name = self._get_entity_name(selected_id, "trainer")
+        name = self._get_selected_name(self.trainer_view.table, "trainer")
         if not self._show_delete_confirmation_generic("trainer", name):
             return
 
-        result = self.controller.delete_entity(self.current_admin, "trainer", selected_id)
-        if result["success"]:
-            self._show_trainers_table()
-        else:
-            self._show_error_dialog("Delete Error", result["message"])
+        self._delete_in_background("trainer", selected_id, self._show_trainers_table)
 
     def _handle_user_delete(self):
         """Handle user deletion through controller"""
@@ -367,33 +407,34 @@ class DashboardFrame(ctk.CTkFrame):
             self._show_error_dialog("Delete Error", "No member selected.")
             return
 
-        name = self._get_entity_name(selected_id, "user")
+        name = self._get_selected_name(self.user_view.table, "user")
         if not self._show_delete_confirmation_generic("member", name):
             return
 
-        result = self.controller.delete_entity(self.current_admin, "user", selected_id)
-        if result["success"]:
-            self._show_users_table()
-        else:
-            self._show_error_dialog("Delete Error", result["message"])
+        self._delete_in_background("user", selected_id, self._show_users_table)
 
-    def _get_entity_name(self, sequential_id: str, entity_type: str) -> str:
-        """Get entity name from sequential ID"""
-        try:
-            idx = int(sequential_id)
-            if entity_type == "trainer":
-                data = self.controller.get_trainer_data()
-            elif entity_type == "user":
-                data = self.controller.get_user_data()
-            else:
-                return "unknown"
+    def _delete_in_background(self, entity_type, selected_id, show_table):
+        """Delete without blocking the window, then reload the table"""
+        token = self._show_loading("Deleting...")
 
-            if 1 <= idx <= len(data):
-                row = data[idx - 1]
-                return row[1] if len(row) > 1 else entity_type
-            return entity_type
-        except Exception:
-            return entity_type
+        def on_result(result):
+            if not self._is_current(token):
+                return
+            show_table()
+            if not result["success"]:
+                self._show_error_dialog("Delete Error", result["message"])
+
+        self.controller.delete_entity_async(
+            self.current_admin, entity_type, selected_id, on_result
+        )
+
+    def _get_selected_name(self, table, default):
+        """Name column of the selected row, read from the rows the table
+        already shows so confirming a delete never waits on the database"""
+        row = table.get_selected_data()
+        if row is not None and len(row) > 1 and row[1]:
+            return row[1]
+        return default
 
     def _show_delete_confirmation(self, username: str) -> bool:
         """Show confirmation dialog for admin deletion"""
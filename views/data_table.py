@@ -1,12 +1,24 @@
 import customtkinter as ctk
+from controllers.instrumentation import instrumented
 from views.colors import COLORS
+from utils.row_diff import diff_rows, row_key
 
 
 class DataTable(ctk.CTkFrame):
     """Reusable data table component with fixed headers and scrollable content"""
 
+    # Tables larger than this are rendered with a fixed pool of row widgets
+    # that gets rebound to data rows on scroll (virtualized mode)
+    VIRTUALIZE_THRESHOLD = 200
+    ROW_HEIGHT = 32  # Label height (30) plus vertical padding (1 + 1)
+    OVERSCAN_ROWS = 3
+
+    SORT_ARROWS = {False: "\u25b2", True: "\u25bc"}  # Ascending, descending
+    SHIFT_MASK = 0x0001  # Shift bit of a Tk event state
+
     def __init__(
-        self, master, headers, data, column_weights=None, table_name=None, **kwargs
+        self, master, headers, data, column_weights=None, table_name=None,
+        virtualized=None, on_sort=None, **kwargs
     ):
         super().__init__(master, fg_color=("white", "gray17"), **kwargs)
 
@@ -19,10 +31,35 @@ class DataTable(ctk.CTkFrame):
         self.column_weights = column_weights or [1] * len(headers)
         self.table_name = table_name or "Unknown"
 
+        # Header sorting: on_sort(sort_spec) is called on header clicks with
+        # (column, descending) pairs, most significant first; it is expected
+        # to call update_data with the sorted rows
+        self.on_sort = on_sort
+        self.sort_spec = ()
+        self.header_labels = []
+
+        # Virtualized mode is picked automatically for large tables, also
+        # when update_data makes a table large
+        self._auto_virtualize = virtualized is None
+        if virtualized is None:
+            virtualized = len(data) > self.VIRTUALIZE_THRESHOLD
+        self.virtualized = virtualized
+
         # Selection tracking - optimized with tuple (table_name, item_id)
         self.selection = None  # ("table_name", "item_id") or None for deselection
+        self._selected_row_hint = None  # Last known data index of the selection
         self.row_widgets = {}
 
+        # Row widgets keyed by row ID, used to patch rows on update_data
+        self._widgets_by_key = {}
+        self._index_by_key = {}
+
+        # Virtualized mode state: pool of row slots and first visible data row
+        self._row_pool = []
+        self._slot_state = []
+        self._first_row = 0
+        self._visible_rows = 0
+
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -43,8 +80,10 @@ class DataTable(ctk.CTkFrame):
         if column_weights and len(column_weights) != len(headers):
             raise ValueError("Column weights must match headers")
 
-        # Validate all data rows have same number of columns
-        for i, row in enumerate(data):
+        # Validate all data rows have same number of columns. Lazily paged
+        # sequences are only sampled so validation does not load every page
+        rows_to_check = data if isinstance(data, (list, tuple)) else data[:1]
+        for i, row in enumerate(rows_to_check):
             if len(row) != len(headers):
                 raise ValueError(
                     f"Row {i} has {len(row)} columns, expected {len(headers)}"
@@ -79,6 +118,16 @@ class DataTable(ctk.CTkFrame):
                 height=35,
             )
             header_label.grid(row=0, column=col_idx, sticky="ew", padx=2, pady=2)
+            if self.on_sort:
+                header_label.configure(cursor="hand2")
+                header_label.bind(
+                    "<Button-1>", lambda e, c=col_idx: self._on_header_click(c, e)
+                )
+            self.header_labels.append(header_label)
+
+        if self.virtualized:
+            self._create_virtual_body()
+            return
 
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self,
@@ -97,52 +146,304 @@ class DataTable(ctk.CTkFrame):
         # Populate data
         self._populate_data()
 
+    def _create_virtual_body(self):
+        """Create a fixed-size body whose row widgets are recycled on scroll"""
+        self.body_frame = ctk.CTkFrame(
+            self,
+            fg_color=COLORS["neutral_fg"],
+            corner_radius=6,
+        )
+        self.body_frame.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
+        # Keep the body at the size given by the layout, not by its rows
+        self.body_frame.grid_propagate(False)
+
+        for col_idx, weight in enumerate(self.column_weights):
+            minsize = 60 if weight == 1 else (120 if weight >= 3 else 100)
+            self.body_frame.grid_columnconfigure(
+                col_idx, weight=weight, minsize=minsize
+            )
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(2, 0))
+
+        self.body_frame.bind("<Configure>", self._on_body_configure)
+        self._bind_mouse_wheel(self.body_frame)
+
+    def _switch_to_virtualized(self):
+        """Replace the row widgets by a recycled row pool, once the table grew"""
+        self.scrollable_frame.destroy()
+        self._widgets_by_key.clear()
+        self._index_by_key.clear()
+        self.row_widgets.clear()
+        self.virtualized = True
+        self._first_row = 0
+        # The pool is sized and filled when the body gets its height
+        self._create_virtual_body()
+
+    def _on_header_click(self, col_idx, event):
+        """
+        Click sorts by a column, then reverses it, then clears the sort.
+        Shift-click adds the column to the current sort, or reverses it there
+        """
+        if event.state & self.SHIFT_MASK and self.sort_spec:
+            if col_idx in dict(self.sort_spec):
+                sort_spec = tuple(
+                    (col, not descending if col == col_idx else descending)
+                    for col, descending in self.sort_spec
+                )
+            else:
+                sort_spec = self.sort_spec + ((col_idx, False),)
+        elif self.sort_spec == ((col_idx, False),):
+            sort_spec = ((col_idx, True),)
+        elif self.sort_spec == ((col_idx, True),):
+            sort_spec = ()
+        else:
+            sort_spec = ((col_idx, False),)
+
+        self.set_sort_spec(sort_spec)
+        self.on_sort(sort_spec)
+
+    def set_sort_spec(self, sort_spec):
+        """Show the sort arrows (and their priority when several) in the headers"""
+        self.sort_spec = tuple(sort_spec)
+        for col_idx, header_label in enumerate(self.header_labels):
+            header_label.configure(text=self.headers[col_idx])
+        for priority, (col_idx, descending) in enumerate(self.sort_spec, start=1):
+            marker = self.SORT_ARROWS[descending]
+            if len(self.sort_spec) > 1:
+                marker += str(priority)
+            self.header_labels[col_idx].configure(
+                text=f"{self.headers[col_idx]} {marker}"
+            )
+
+    @instrumented("table.populate")
     def _populate_data(self):
         """Populate the scrollable frame with data"""
+        if self.virtualized:
+            self._first_row = 0
+            self._render_window()
+            return
+
         # Clear existing data
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
-        self.row_widgets.clear()
+        self._widgets_by_key.clear()
 
         # Create data rows
         for row_idx, row_data in enumerate(self.data):
-            self.row_widgets[row_idx] = []
-
-            for col_idx, cell_data in enumerate(row_data):
-                # Professional alternating row colors using our color palette
-                if row_idx % 2 == 0:
-                    # Even rows - lighter neutral tones
-                    bg_color = ("white", COLORS["neutral_fg"][1])
-                else:
-                    # Odd rows - subtle contrast
-                    bg_color = (COLORS["neutral_bg"][0], "gray20")
-
-                # Special highlighting for first column (ID) with accent color hints
-                if col_idx == 0:
-                    if row_idx % 2 == 0:
-                        bg_color = ("#f8f5ff", "gray28")  # Subtle primary tint
-                    else:
-                        bg_color = ("#f0ebf7", "gray23")  # Slightly darker primary tint
+            self._widgets_by_key[row_key(row_data)] = self._create_row_widgets(
+                row_idx, row_data
+            )
+
+        self._reindex_rows()
+
+    def _create_row_widgets(self, row_idx, row_data):
+        """Create and grid the cell labels of one data row"""
+        key = row_key(row_data)
+        cells = []
+
+        for col_idx, cell_data in enumerate(row_data):
+            cell_label = ctk.CTkLabel(
+                self.scrollable_frame,
+                text=str(cell_data),
+                font=ctk.CTkFont(size=13),
+                fg_color=self._cell_color(row_idx, col_idx),
+                corner_radius=4,
+                height=30,
+            )
+            cell_label.grid(
+                row=row_idx, column=col_idx, sticky="ew", padx=2, pady=1
+            )
+
+            # Make cell clickable - resolved by key so it survives reordering
+            cell_label.bind(
+                "<Button-1>", lambda e, k=key: self._select_row(self._index_by_key[k])
+            )
+
+            cells.append(cell_label)
+
+        return cells
+
+    def _reindex_rows(self):
+        """Rebuild the index -> widgets and key -> index maps from self.data"""
+        self.row_widgets.clear()
+        self._index_by_key.clear()
+        for row_idx, row_data in enumerate(self.data):
+            key = row_key(row_data)
+            self._index_by_key[key] = row_idx
+            self.row_widgets[row_idx] = self._widgets_by_key[key]
+
+    def _apply_row_diff(self, diff):
+        """Patch the row widgets with the operations computed by diff_rows"""
+        selected_id = self.selection[1] if self.selection else None
+
+        for key in diff["removed"]:
+            for cell_label in self._widgets_by_key.pop(key):
+                cell_label.destroy()
+
+        for old_idx, new_idx, key in diff["moved"]:
+            recolor = (old_idx - new_idx) % 2 == 1 and key != selected_id
+            for col_idx, cell_label in enumerate(self._widgets_by_key[key]):
+                cell_label.grid_configure(row=new_idx)
+                if recolor:
+                    cell_label.configure(fg_color=self._cell_color(new_idx, col_idx))
+
+        for new_idx, key in diff["changed"]:
+            row_data = self.data[new_idx]
+            for col_idx, cell_label in enumerate(self._widgets_by_key[key]):
+                cell_label.configure(text=str(row_data[col_idx]))
+
+        for new_idx, key in diff["inserted"]:
+            self._widgets_by_key[key] = self._create_row_widgets(
+                new_idx, self.data[new_idx]
+            )
+
+        self._reindex_rows()
+
+    def _cell_color(self, row_idx, col_idx):
+        """Background color of a cell given its data row and column"""
+        # Professional alternating row colors using our color palette
+        if row_idx % 2 == 0:
+            # Even rows - lighter neutral tones
+            bg_color = ("white", COLORS["neutral_fg"][1])
+        else:
+            # Odd rows - subtle contrast
+            bg_color = (COLORS["neutral_bg"][0], "gray20")
+
+        # Special highlighting for first column (ID) with accent color hints
+        if col_idx == 0:
+            if row_idx % 2 == 0:
+                bg_color = ("#f8f5ff", "gray28")  # Subtle primary tint
+            else:
+                bg_color = ("#f0ebf7", "gray23")  # Slightly darker primary tint
+
+        return bg_color
+
+    # ----- Virtualized rendering -----
+
+    def _on_body_configure(self, event):
+        """Resize the row pool to the new viewport height"""
+        visible_rows = max(1, event.height // self.ROW_HEIGHT)
+        if visible_rows == self._visible_rows and self._row_pool:
+            return
+
+        self._visible_rows = visible_rows
+        self._resize_pool(visible_rows + self.OVERSCAN_ROWS)
+        self._scroll_to(self._first_row)
 
+    def _resize_pool(self, size):
+        """Grow or shrink the pool of recycled row widgets"""
+        while len(self._row_pool) > size:
+            for cell_label in self._row_pool.pop():
+                cell_label.destroy()
+            self._slot_state.pop()
+
+        while len(self._row_pool) < size:
+            slot = len(self._row_pool)
+            cells = []
+            for col_idx in range(len(self.headers)):
                 cell_label = ctk.CTkLabel(
-                    self.scrollable_frame,
-                    text=str(cell_data),
+                    self.body_frame,
+                    text="",
                     font=ctk.CTkFont(size=13),
-                    fg_color=bg_color,
                     corner_radius=4,
                     height=30,
                 )
-                cell_label.grid(
-                    row=row_idx, column=col_idx, sticky="ew", padx=2, pady=1
-                )
-
-                # Make cell clickable
                 cell_label.bind(
-                    "<Button-1>", lambda e, idx=row_idx: self._select_row(idx)
+                    "<Button-1>", lambda e, s=slot: self._on_slot_click(s)
                 )
+                self._bind_mouse_wheel(cell_label)
+                cells.append(cell_label)
+            self._row_pool.append(cells)
+            self._slot_state.append(None)
+
+    def _render_window(self):
+        """Bind the pooled row widgets to the data rows currently in view"""
+        self.row_widgets.clear()
+        selected_id = self.selection[1] if self.selection else None
+
+        for slot, cells in enumerate(self._row_pool):
+            row_idx = self._first_row + slot
+
+            if row_idx >= len(self.data):
+                if self._slot_state[slot] is not None:
+                    for cell_label in cells:
+                        cell_label.grid_remove()
+                    self._slot_state[slot] = None
+                continue
+
+            row_data = self.data[row_idx]
+            is_selected = str(row_data[0]) == selected_id
+            state = (row_idx, tuple(row_data), is_selected)
+
+            # Skip slots that already show this exact row
+            if self._slot_state[slot] != state:
+                was_hidden = self._slot_state[slot] is None
+                for col_idx, cell_label in enumerate(cells):
+                    cell_label.configure(
+                        text=str(row_data[col_idx]),
+                        fg_color=(
+                            COLORS["accent"]
+                            if is_selected
+                            else self._cell_color(row_idx, col_idx)
+                        ),
+                    )
+                    if was_hidden:
+                        cell_label.grid(
+                            row=slot, column=col_idx, sticky="ew", padx=2, pady=1
+                        )
+                self._slot_state[slot] = state
+
+            self.row_widgets[row_idx] = cells
+
+        self._update_scrollbar()
+
+    def _scroll_to(self, first_row):
+        """Scroll so that the given data row is the first one in view"""
+        max_first_row = max(0, len(self.data) - self._visible_rows)
+        self._first_row = min(max(0, int(first_row)), max_first_row)
+        self._render_window()
+
+    def _update_scrollbar(self):
+        """Reflect the visible window on the scrollbar"""
+        total_rows = len(self.data)
+        if total_rows == 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+
+        start = self._first_row / total_rows
+        end = min(1.0, (self._first_row + self._visible_rows) / total_rows)
+        self.scrollbar.set(start, end)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        """Handle scrollbar drags and scroll commands"""
+        if action == "moveto":
+            self._scroll_to(round(float(value) * len(self.data)))
+        elif action == "scroll":
+            step = int(value)
+            if unit == "pages":
+                step *= self._visible_rows
+            self._scroll_to(self._first_row + step)
+
+    def _bind_mouse_wheel(self, widget):
+        """Route mouse wheel events on a widget to the virtual scroller"""
+        widget.bind("<MouseWheel>", self._on_mouse_wheel)
+        widget.bind("<Button-4>", lambda e: self._scroll_to(self._first_row - 3))
+        widget.bind("<Button-5>", lambda e: self._scroll_to(self._first_row + 3))
+
+    def _on_mouse_wheel(self, event):
+        """Scroll by rows on mouse wheel (Windows reports multiples of 120)"""
+        if abs(event.delta) >= 120:
+            step = -int(event.delta / 120) * 3
+        else:
+            step = -event.delta
+        self._scroll_to(self._first_row + step)
 
-                # Store widget reference
-                self.row_widgets[row_idx].append(cell_label)
+    def _on_slot_click(self, slot):
+        """Select the data row currently bound to a pool slot"""
+        row_idx = self._first_row + slot
+        if row_idx < len(self.data):
+            self._select_row(row_idx)
 
     def _select_row(self, row_idx):
         """Universal row selection handler - optimized with tuple storage"""
@@ -161,9 +462,10 @@ class DataTable(ctk.CTkFrame):
             # Store selection as optimized tuple (table, id)
             item_id = str(self.data[row_idx][0])
             self.selection = (self.table_name, item_id)
+            self._selected_row_hint = row_idx
 
-            # Highlight selected row
-            selected_widgets = self.row_widgets[row_idx]
+            # Highlight selected row (only rows in view have widgets)
+            selected_widgets = self.row_widgets.get(row_idx, [])
             for widget in selected_widgets:
                 widget.configure(fg_color=COLORS["accent"])
 
@@ -173,10 +475,45 @@ class DataTable(ctk.CTkFrame):
             return None
 
         _, selected_id = self.selection
-        # Find row index by matching ID (first column)
-        for idx, row in enumerate(self.data):
-            if str(row[0]) == selected_id:
-                return idx
+
+        # Fast path: the row has not moved since it was selected
+        hint = self._selected_row_hint
+        if hint is not None and hint < len(self.data):
+            if str(self.data[hint][0]) == selected_id:
+                return hint
+
+        idx = self._find_sequential_id(selected_id)
+        if idx is not None:
+            self._selected_row_hint = idx
+        return idx
+
+    def _find_sequential_id(self, selected_id):
+        """
+        Index of the row whose first cell, the sequential ID (table position
+        + 1), is selected_id. Rows are not scanned unless they are a plain
+        list: paged rows would read every page, views know their positions
+        """
+        try:
+            position = int(selected_id) - 1
+        except ValueError:
+            position = None
+
+        if position is not None and 0 <= position < len(self.data):
+            if str(self.data[position][0]) == selected_id:
+                return position
+
+        if position is not None and hasattr(self.data, "positions"):
+            # Sorted or filtered view: find the row by its table position
+            try:
+                idx = self.data.positions().index(position)
+            except ValueError:
+                return None
+            return idx if str(self.data[idx][0]) == selected_id else None
+
+        if isinstance(self.data, (list, tuple)):
+            for idx, row in enumerate(self.data):
+                if str(row[0]) == selected_id:
+                    return idx
         return None
 
     def get_selection(self):
@@ -215,34 +552,40 @@ class DataTable(ctk.CTkFrame):
 
     def _restore_row_colors(self, row_idx):
         """Restore original colors for a row"""
-        old_row_widgets = self.row_widgets[row_idx]
+        old_row_widgets = self.row_widgets.get(row_idx, [])
         for col_idx, widget in enumerate(old_row_widgets):
-            # Restore original color based on the same logic as _populate_data
-            if row_idx % 2 == 0:
-                # Even rows - lighter neutral tones
-                original_color = ("white", COLORS["neutral_fg"][1])
-            else:
-                # Odd rows - subtle contrast
-                original_color = (COLORS["neutral_bg"][0], "gray20")
-
-            # Special highlighting for first column (ID) with accent color hints
-            if col_idx == 0:
-                if row_idx % 2 == 0:
-                    original_color = ("#f8f5ff", "gray28")  # Subtle primary tint
-                else:
-                    original_color = (
-                        "#f0ebf7",
-                        "gray23",
-                    )  # Slightly darker primary tint
-
-            widget.configure(fg_color=original_color)
+            widget.configure(fg_color=self._cell_color(row_idx, col_idx))
 
     def update_data(self, new_data):
-        """Update table data and refresh display"""
+        """Update table data, touching only the rows that changed"""
         self._validate_inputs(self.headers, new_data, self.column_weights)
+        old_data = self.data
         self.data = new_data
-        self.selection = None  # Clear selection with optimized tuple approach
-        self._populate_data()
+
+        # Keep the selection only while the selected row is still present
+        if self.selection and self._get_row_from_selection() is None:
+            self.selection = None
+
+        if (
+            not self.virtualized
+            and self._auto_virtualize
+            and len(new_data) > self.VIRTUALIZE_THRESHOLD
+        ):
+            self._switch_to_virtualized()
+            return
+
+        if self.virtualized:
+            self._scroll_to(self._first_row)
+            return
+
+        try:
+            diff = diff_rows(old_data, new_data)
+        except ValueError:
+            # Rows without unique IDs cannot be diffed, rebuild them instead
+            self._populate_data()
+            return
+
+        self._apply_row_diff(diff)
 
     def get_selected_data(self):
         """Get the currently selected row data - computed when needed"""
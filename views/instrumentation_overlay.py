@@ -0,0 +1,54 @@
+import customtkinter as ctk
+
+from controllers import instrumentation
+from views.colors import COLORS
+
+
+class InstrumentationOverlay(ctk.CTkToplevel):
+    """Developer window showing the live instrumentation report (F12)"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("FitZone - Instrumentation")
+        self.geometry("980x420")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.report_box = ctk.CTkTextbox(
+            self, font=ctk.CTkFont(family="Courier", size=12), wrap="none"
+        )
+        self.report_box.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=10, pady=10)
+
+        ctk.CTkButton(
+            self, text="Reset", fg_color=COLORS["primary"][0], command=self._reset
+        ).grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
+        ctk.CTkButton(
+            self, text="Log report", fg_color=COLORS["primary"][0],
+            command=instrumentation.log_report,
+        ).grid(row=1, column=1, sticky="e", padx=10, pady=(0, 10))
+
+        self._refresh_job = None
+        self._refresh()
+
+    def _refresh(self):
+        """Redraw the report, keeping the scroll position"""
+        position = self.report_box.yview()[0]
+        self.report_box.configure(state="normal")
+        self.report_box.delete("1.0", "end")
+        self.report_box.insert("1.0", instrumentation.format_report())
+        self.report_box.configure(state="disabled")
+        self.report_box.yview_moveto(position)
+        self._refresh_job = self.after(self.REFRESH_MS, self._refresh)
+
+    def _reset(self):
+        instrumentation.reset()
+        self.after_cancel(self._refresh_job)
+        self._refresh()
+
+    def destroy(self):
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        super().destroy()
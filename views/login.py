@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from controllers.crud import authenticate_admin
+from controllers.auth_service import auth_service
 from views.colors import COLORS, set_palette, get_current_palette, get_palette_names
 
 
@@ -223,12 +223,22 @@ class LoginFrame(ctk.CTkFrame):
             self.error_label.configure(text="Please enter both username and password")
             return
 
-        admin = authenticate_admin(username, password)
-        if admin:
+        # Password hashing is slow by design: verify off the Tk thread
+        self.error_label.configure(text="")
+        self.login_button.configure(state="disabled", text="Signing in...")
+        auth_service.authenticate_async(username, password, self._on_authenticated)
+
+    def _on_authenticated(self, result):
+        """Handle the result of the background credential check"""
+        if not self.winfo_exists():
+            return
+
+        self.login_button.configure(state="normal", text="Sign In")
+        if result["success"]:
             self.error_label.configure(text="")
-            self.on_login_success(admin)
+            self.on_login_success(result["admin"])
         else:
-            self.error_label.configure(text="Invalid credentials. Please try again.")
+            self.error_label.configure(text=result["message"])
             # Highlight fields with error
             self.username_entry.configure(border_color=COLORS["danger"][0])
             self.password_entry.configure(border_color=COLORS["danger"][0])
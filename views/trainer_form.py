@@ -27,6 +27,7 @@ class TrainerFormView(ctk.CTkFrame):
         on_cancel=None,
         trainer_to_edit=None,
         current_admin=None,
+        controller=None,
     ):
         super().__init__(master, fg_color=("white", "gray17"), corner_radius=15)
         self.on_save = on_save
@@ -34,7 +35,7 @@ class TrainerFormView(ctk.CTkFrame):
         self.trainer_to_edit = trainer_to_edit
         self.current_admin = current_admin
 
-        self.controller = DashboardController()
+        self.controller = controller or DashboardController()
         self._validation_timer = None
 
         # Default save behavior if no external callback is provided
@@ -43,8 +44,13 @@ class TrainerFormView(ctk.CTkFrame):
 
         self._create_widgets()
 
-        if self.trainer_to_edit:
-            self._load_existing_trainer_data()
+        # Managers and the edited trainer are read in the background
+        self.form_buttons.set_busy(True, "Loading...")
+        self.controller.get_trainer_form_data_async(
+            self.trainer_to_edit,
+            callback=self._on_form_data_loaded,
+            error_callback=self._on_form_data_error,
+        )
 
     def _create_widgets(self):
         # Main scrollable container for the entire form
@@ -310,19 +316,8 @@ class TrainerFormView(ctk.CTkFrame):
             anchor="w",
         )
 
-        # Optional Manager selection (list of admin usernames with role manager)
-        managers = []
-        try:
-            admins = self.controller.get_admin_data()
-            # admin rows: [ID, username, role, created_at]
-            managers = [
-                row[1]
-                for row in admins
-                if len(row) > 2 and str(row[2]).lower() == "manager"
-            ]
-        except Exception:
-            managers = []
-
+        # Optional Manager selection (list of admin usernames with role manager),
+        # filled in once the form data has loaded
         self.manager_label = ctk.CTkLabel(
             form_frame,
             text="Assign Manager (Optional):",
@@ -342,7 +337,7 @@ class TrainerFormView(ctk.CTkFrame):
 
         self.manager_combo = ctk.CTkComboBox(
             form_frame,
-            values=["None"] + managers,
+            values=["None"],
             height=40,
             corner_radius=8,
         )
@@ -361,6 +356,22 @@ class TrainerFormView(ctk.CTkFrame):
         self.form_buttons.pack(fill="x")
         self.form_buttons.set_save_enabled(False)
 
+    def _on_form_data_loaded(self, form_data):
+        if not self.winfo_exists():
+            return
+        self.form_buttons.set_busy(False)
+        self.form_buttons.set_save_enabled(False)
+        self.manager_combo.configure(values=["None"] + form_data["managers"])
+        if self.trainer_to_edit:
+            self._load_existing_trainer_data(form_data["trainer"])
+
+    def _on_form_data_error(self, error):
+        if not self.winfo_exists():
+            return
+        print(f"Error loading trainer form data: {error}")
+        self.form_buttons.set_busy(False)
+        self.form_buttons.set_save_enabled(False)
+
     def _on_field_change(self, event=None):
         if self._validation_timer:
             self.after_cancel(self._validation_timer)
@@ -642,22 +653,10 @@ class TrainerFormView(ctk.CTkFrame):
         except Exception as e:
             return {"success": False, "message": f"Error saving trainer: {e}"}
 
-    def _load_existing_trainer_data(self):
+    def _load_existing_trainer_data(self, trainer_row):
         """Load existing trainer data into the form fields"""
         try:
-            if not self.trainer_to_edit:
-                print("Warning: No trainer ID to edit")
-                return
-
-            # Get trainer data
-            trainers = self.controller.get_trainer_data()
-
-            # Convert sequential ID to array index
-            idx = int(self.trainer_to_edit) - 1
-
-            if 0 <= idx < len(trainers):
-                trainer_row = trainers[idx]
-
+            if trainer_row is not None:
                 # Parse trainer data based on expected format
                 # Assuming format: [ID, Name, Specialty, Schedule, Manager, Email, Phone, ...]
                 if len(trainer_row) >= 2:
@@ -713,7 +712,7 @@ class TrainerFormView(ctk.CTkFrame):
                 # Trigger validation to enable save button if data is valid
                 self.after(100, self._validate_form)
             else:
-                print(f"Warning: Trainer index {idx} out of range")
+                print(f"Warning: Trainer {self.trainer_to_edit} not found")
 
         except Exception as e:
             print(f"Error loading trainer data: {e}")
@@ -25,13 +25,35 @@ class UserConfigFrame(ctk.CTkFrame):
 
     def _create_form(self):
         """Create main form"""
+        form_frame = self._create_form_frame()
+
+        # The profile is read from the database in the background
+        loading_label = ctk.CTkLabel(
+            form_frame,
+            text="Loading profile...",
+            font=ctk.CTkFont(size=14),
+            text_color=COLORS["text_secondary"],
+        )
+        loading_label.grid(row=0, column=0, pady=20)
+
+        def on_loaded(admin_data):
+            if not form_frame.winfo_exists():
+                return
+            loading_label.destroy()
+            self._fill_form(form_frame, admin_data)
+
+        self.controller.get_admin_data_unified_async(
+            self.current_admin.unique_id, from_cache=False, callback=on_loaded
+        )
+
+    def _create_form_frame(self):
         form_frame = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
         form_frame.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
         form_frame.grid_columnconfigure(0, weight=1)
+        return form_frame
 
-        admin_data = self.controller.get_admin_data_unified(
-            self.current_admin.unique_id, from_cache=False
-        )
+    def _fill_form(self, form_frame, admin_data):
+        """Create the form sections for the loaded admin_data"""
         if admin_data:
             self._create_profile_section(form_frame, admin_data)
             self._create_editable_section(form_frame, admin_data)
@@ -360,14 +382,23 @@ class UserConfigFrame(ctk.CTkFrame):
         except Exception:
             return str(created_at)
 
-    def _refresh_profile_data(self):
-        """Refresh profile section with updated data"""
-        admin_data = self.controller.refresh_admin_profile(self.current_admin.unique_id)
-        if admin_data:
-            # Recreate the form with updated data
-            for widget in self.winfo_children():
-                widget.destroy()
-            self._create_form()
+    def _refresh_profile_data(self, on_refreshed=None):
+        """Refresh profile section with updated data, then run on_refreshed"""
+
+        def on_loaded(admin_data):
+            if not self.winfo_exists():
+                return
+            if admin_data:
+                # Recreate the form with updated data
+                for widget in self.winfo_children():
+                    widget.destroy()
+                self._fill_form(self._create_form_frame(), admin_data)
+            if on_refreshed:
+                on_refreshed()
+
+        self.controller.refresh_admin_profile_async(
+            self.current_admin.unique_id, callback=on_loaded
+        )
 
     def _get_form_data(self):
         """Get form data for saving"""
@@ -399,29 +430,39 @@ class UserConfigFrame(ctk.CTkFrame):
             if not self._validate_inputs(new_username, new_password, confirm_password):
                 return
 
-            # Use controller's unified save method - pass admin ID for update
-            result = self.controller.save_admin_data(form_data, self.current_admin.unique_id)
-
-            if result["success"]:
-                # Update current admin username if it changed
-                if result.get("updated_username"):
-                    self.current_admin.username = result["updated_username"]
-
-                self._handle_successful_update()
-            else:
-                # Check if it's a username-related error to show it in the right place
-                error_message = result["message"]
-                if "username" in error_message.lower() and "already taken" in error_message.lower():
-                    self._show_error(error_message, "username")
-                else:
-                    self._show_error(error_message, "general")
-                self._show_notification_badge(success=False)
+            # Use controller's unified save method - pass admin ID for update.
+            # Runs in the background: hashing a new password takes a while
+            self.form_buttons.set_busy(True)
+            self.controller.save_admin_data_async(
+                form_data, self.current_admin.unique_id, self._on_save_result
+            )
 
         except Exception as e:
             # Show error inline instead of modal dialog
             self._show_error(f"Update error: {str(e)}", "general")
             self._show_notification_badge(success=False)
 
+    def _on_save_result(self, result):
+        """Handle the result of the background save"""
+        if not self.winfo_exists():
+            return
+        self.form_buttons.set_busy(False)
+
+        if result["success"]:
+            # Update current admin username if it changed
+            if result.get("updated_username"):
+                self.current_admin.username = result["updated_username"]
+
+            self._handle_successful_update()
+        else:
+            # Check if it's a username-related error to show it in the right place
+            error_message = result["message"]
+            if "username" in error_message.lower() and "already taken" in error_message.lower():
+                self._show_error(error_message, "username")
+            else:
+                self._show_error(error_message, "general")
+            self._show_notification_badge(success=False)
+
     def _handle_cancel(self):
         """Handle cancel button click from FormButtons"""
         self._clear_error_states()
@@ -459,15 +500,15 @@ class UserConfigFrame(ctk.CTkFrame):
         # First exit edit mode to hide the editing section
         self._exit_edit_mode()
 
-        # Then refresh profile data
-        self._refresh_profile_data()
-
         # Update sidebar if callback is provided
         if self.update_sidebar_callback:
             self.update_sidebar_callback()
 
-        # Now show success notification badge just below the edit button
-        self.after(100, lambda: self._show_notification_badge(success=True))
+        # Then refresh profile data, and once the new edit button exists show
+        # the success notification badge just below it
+        self._refresh_profile_data(
+            lambda: self.after(100, lambda: self._show_notification_badge(success=True))
+        )
 
     def _show_notification_badge(self, success=True):
         """Show a notification badge indicating success or error
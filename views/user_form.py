@@ -24,6 +24,7 @@ class UserFormView(ctk.CTkFrame):
         on_cancel=None,
         user_to_edit=None,
         current_admin=None,
+        controller=None,
     ):
         super().__init__(master, fg_color=("white", "gray17"), corner_radius=15)
         self.on_save = on_save
@@ -31,7 +32,7 @@ class UserFormView(ctk.CTkFrame):
         self.user_to_edit = user_to_edit
         self.current_admin = current_admin
 
-        self.controller = DashboardController()
+        self.controller = controller or DashboardController()
         self._validation_timer = None
 
         # Default save behavior if no external callback is provided
@@ -41,7 +42,14 @@ class UserFormView(ctk.CTkFrame):
         self._create_widgets()
 
         if self.user_to_edit:
-            self._load_existing_user_data()
+            # Only the page holding the edited member is read, in the background
+            self.form_buttons.set_busy(True, "Loading...")
+            self.controller.get_row_async(
+                "users",
+                self.user_to_edit,
+                callback=self._on_user_loaded,
+                error_callback=self._on_user_load_error,
+            )
 
     def _create_widgets(self):
         # Main scrollable container for the entire form
@@ -465,22 +473,24 @@ class UserFormView(ctk.CTkFrame):
         except Exception as e:
             return {"success": False, "message": f"Error saving member: {e}"}
 
-    def _load_existing_user_data(self):
-        """Load existing user data into the form fields"""
-        try:
-            if not self.user_to_edit:
-                print("Warning: No user ID to edit")
-                return
-
-            # Get user data
-            users = self.controller.get_user_data()
-
-            # Convert sequential ID to array index
-            idx = int(self.user_to_edit) - 1
+    def _on_user_loaded(self, user_row):
+        if not self.winfo_exists():
+            return
+        self.form_buttons.set_busy(False)
+        self.form_buttons.set_save_enabled(False)
+        self._load_existing_user_data(user_row)
 
-            if 0 <= idx < len(users):
-                user_row = users[idx]
+    def _on_user_load_error(self, error):
+        if not self.winfo_exists():
+            return
+        print(f"Error loading user data: {error}")
+        self.form_buttons.set_busy(False)
+        self.form_buttons.set_save_enabled(False)
 
+    def _load_existing_user_data(self, user_row):
+        """Load existing user data into the form fields"""
+        try:
+            if user_row is not None:
                 # Parse user data based on expected format
                 # Assuming format: [ID, Name, Membership, Status, Join_Date, Email, Phone, ...]
                 if len(user_row) >= 2:
@@ -538,7 +548,7 @@ class UserFormView(ctk.CTkFrame):
                 # Trigger validation to enable save button if data is valid
                 self.after(100, self._validate_form)
             else:
-                print(f"Warning: User index {idx} out of range")
+                print(f"Warning: User {self.user_to_edit} not found")
 
         except Exception as e:
             print(f"Error loading user data: {e}")